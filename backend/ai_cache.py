@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Response caching for the AI curation service.
+Memoizes chat-completion responses keyed on the full request payload.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Thread-safe in-process LRU cache whose entries expire after a TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LLMCache:
+    """
+    Two-tier cache for LLM responses.
+
+    The in-process TTLCache is always used; when AI_CACHE_REDIS_URL is set and
+    redis-py is installed, the async API also reads/writes Redis so cached
+    responses survive restarts and are shared between workers.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, maxsize: int = 512):
+        self.ttl = float(os.getenv('AI_CACHE_TTL', '3600')) if ttl is None else ttl
+        self.local = TTLCache(maxsize=maxsize, ttl=self.ttl)
+        self.hits = 0
+        self.misses = 0
+        self.redis = None
+
+        redis_url = os.getenv('AI_CACHE_REDIS_URL')
+        if redis_url and self.enabled:
+            try:
+                from redis import asyncio as aioredis
+                self.redis = aioredis.from_url(redis_url)
+                logger.info(f"LLM response cache using Redis at {redis_url}")
+            except ImportError:
+                logger.warning("AI_CACHE_REDIS_URL set but redis is not installed; using in-process cache only")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """SHA-256 over the canonical JSON form of the chat-completion kwargs."""
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.sha256(payload).hexdigest()
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Synchronous lookup against the in-process tier."""
+        if not self.enabled:
+            return None
+        value = self.local.get(key)
+        self._record(value is not None)
+        return value
+
+    def store(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Synchronous store into the in-process tier."""
+        if self.enabled:
+            self.local.set(key, value, ttl)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Async lookup: in-process first, then Redis (promoting hits locally)."""
+        if not self.enabled:
+            return None
+        value = self.local.get(key)
+        if value is None and self.redis is not None:
+            try:
+                raw = await self.redis.get(f"llm:{key}")
+                if raw is not None:
+                    value = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+                    self.local.set(key, value)
+            except Exception as e:
+                logger.warning(f"Redis cache read failed: {e}")
+        self._record(value is not None)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Async store into both tiers."""
+        if not self.enabled:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        self.local.set(key, value, ttl)
+        if self.redis is not None:
+            try:
+                await self.redis.set(f"llm:{key}", value, ex=int(ttl))
+            except Exception as e:
+                logger.warning(f"Redis cache write failed: {e}")
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        logger.info(f"LLM cache {'hit' if hit else 'miss'} (hits={self.hits}, misses={self.misses})")
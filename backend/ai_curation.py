@@ -5,19 +5,337 @@ Generates metadata suggestions based on HTML content analysis.
 """
 
 import os
-import json
+import re
+import time
+import random
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+import atexit
+import weakref
+import functools
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple, Type
+from openai import (
+    OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient,
+    RateLimitError, APIConnectionError, InternalServerError
+)
+import orjson
 from dotenv import load_dotenv
+from pydantic import BaseModel
+
+import rate_limiter
+from ai_cache import LLMCache
+from ai_schemas import (
+    SuggestionsEnvelope, ReasonedEnvelope, CombinedEnvelope, ConfidencesEnvelope,
+    json_schema_format
+)
+
+try:
+    import tiktoken
+except ImportError:  # optional: fall back to a chars/4 estimate
+    tiktoken = None
+
+try:
+    import httpx
+except ImportError:  # SDK builds without httpx keep their default connection pool
+    httpx = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional: fall back to BeautifulSoup for raw HTML input
+    HTMLParser = None
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+_TAG_RE = re.compile(r'<[A-Za-z!/]')
+_NON_TEXT_TAGS = ['script', 'style', 'noscript', 'template', 'svg']
+
+# Context windows (tokens) for models we size max_tokens against
+CONTEXT_WINDOW = {
+    'gpt-4o': 128000,
+    'gpt-4o-mini': 128000,
+    'gpt-4-turbo': 128000,
+    'gpt-4': 8192,
+    'gpt-3.5-turbo': 16385,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+
+@functools.lru_cache(maxsize=8)
+def _encoding_for_model(model: str):
+    """tiktoken encoding for ``model`` (None when tiktoken is not installed)."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding('o200k_base')
+
+
+def _count_message_tokens(model: str, messages: List[Dict[str, str]]) -> int:
+    """Approximate prompt tokens for a chat request (4 tokens framing per message)."""
+    enc = _encoding_for_model(model)
+    total = 0
+    for message in messages:
+        content = message.get('content') or ''
+        total += 4 + (len(enc.encode(content)) if enc is not None else len(content) // 4 + 1)
+    return total
+
+
+def _visible_text(html_content: str) -> str:
+    """Extract visible text from raw HTML, dropping scripts, styles and markup."""
+    if HTMLParser is not None:
+        tree = HTMLParser(html_content)
+        tree.strip_tags(_NON_TEXT_TAGS)
+        root = tree.body or tree.root
+        return root.text(separator=' ', strip=True) if root is not None else ''
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_content, 'html.parser')
+    for tag in soup(_NON_TEXT_TAGS):
+        tag.decompose()
+    return soup.get_text(separator=' ', strip=True)
+
+
+def _clean_content(html_content: str, limit: int = 8000) -> str:
+    """
+    Collapse whitespace and truncate page content for a prompt.
+
+    Raw HTML is reduced to its visible text first so markup doesn't eat the
+    character budget; already-extracted text (the scraper's text_content) is
+    used as-is. The text is pre-sliced to 4x the limit so very large pages
+    never get fully tokenized just to keep the first ``limit`` characters.
+    """
+    if html_content and _TAG_RE.search(html_content):
+        html_content = _visible_text(html_content)
+    return _WS_RE.sub(' ', html_content[:limit * 4]).strip()[:limit]
+
+
+PropertyKey = Tuple[Tuple[Any, str, str, Tuple[str, ...]], ...]
+
+
+def _property_key(properties: List[Dict[str, Any]]) -> PropertyKey:
+    """Hashable snapshot of the prompt-relevant fields of a property list."""
+    return tuple(
+        (
+            p.get('id'),
+            p.get('type'),
+            p.get('name'),
+            tuple(o.get('name', '') for o in p.get('property_options', []))
+        )
+        for p in properties
+    )
+
+
+def _option_index(property_def: Dict[str, Any]) -> Dict[str, Any]:
+    """Map lower-cased, stripped option names to option IDs (first match wins)."""
+    index: Dict[str, Any] = {}
+    for opt in property_def.get('property_options', []):
+        index.setdefault(opt['name'].lower().strip(), opt['id'])
+    return index
+
+
+@functools.lru_cache(maxsize=32)
+def _render_property_block(props_key: PropertyKey) -> str:
+    """Property descriptions for the single-pass and reasoner prompts."""
+    property_descriptions = []
+    for prop_id, prop_type, prop_name, options in props_key:
+        prop_id = 'UNKNOWN' if prop_id is None else prop_id
+        prop_type = prop_type or 'UNKNOWN'
+        prop_name = prop_name or 'Unknown'
+        if prop_type in ['MULTIPLE_CHOICE', 'SINGLE_CHOICE']:
+            prop_desc = f"ID {prop_id}: {prop_name} ({prop_type}): {', '.join(options)}"
+        elif prop_type == 'BINARY':
+            prop_desc = f"ID {prop_id}: {prop_name} (BINARY): true/false"
+        elif prop_type == 'NUMERICAL':
+            prop_desc = f"ID {prop_id}: {prop_name} (NUMERICAL): numeric value"
+        elif prop_type == 'FREE_TEXT':
+            prop_desc = f"ID {prop_id}: {prop_name} (FREE_TEXT): descriptive text"
+        else:
+            prop_desc = f"ID {prop_id}: {prop_name} ({prop_type})"
+        property_descriptions.append(f"- {prop_desc}")
+    return '\n'.join(property_descriptions)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_property_schema(props_key: PropertyKey, used_ids: Optional[frozenset] = None) -> str:
+    """
+    Compact property schema lines for the interpreter prompt.
+
+    When ``used_ids`` is given, only those properties are rendered.
+    """
+    prop_lines = []
+    for pid, ptype, name, options in props_key:
+        if pid is None:
+            continue
+        if used_ids is not None and str(pid) not in used_ids:
+            continue
+        ptype = ptype or 'FREE_TEXT'
+        name = name or ''
+        opts = ', '.join(options) if ptype in ['MULTIPLE_CHOICE', 'SINGLE_CHOICE', 'BINARY'] else ''
+        prop_lines.append(f"- {pid}: {name} [{ptype}] {opts}")
+    return '\n'.join(prop_lines)
+
+
+# ------------------------------ Shared OpenAI clients ------------------------------
+# One pooled client per API key for the whole process, so services created per
+# request reuse warm keep-alive connections instead of paying a TLS handshake.
+
+_CLIENT_LOCK = threading.Lock()
+_CLIENT_SINGLETON: Dict[str, OpenAI] = {}
+# httpx.AsyncClient pools are bound to the event loop that first used them
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+
+
+def _http_client_kwargs() -> Dict[str, Any]:
+    """Connection-pool limits for the SDK's HTTP client (AI_MAX_CONN / AI_MAX_KEEPALIVE)."""
+    if httpx is None:
+        return {}
+    return {'limits': httpx.Limits(
+        max_connections=int(os.getenv('AI_MAX_CONN', '100')),
+        max_keepalive_connections=int(os.getenv('AI_MAX_KEEPALIVE', '50'))
+    )}
+
+
+def _get_client(api_key: str) -> OpenAI:
+    """Process-wide sync OpenAI client for ``api_key`` (created on first use)."""
+    with _CLIENT_LOCK:
+        client = _CLIENT_SINGLETON.get(api_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                timeout=60.0,
+                max_retries=0,  # retries are handled by _create with jittered backoff
+                http_client=DefaultHttpxClient(**_http_client_kwargs())
+            )
+            _CLIENT_SINGLETON[api_key] = client
+        return client
+
+
+def _get_async_client(api_key: str) -> AsyncOpenAI:
+    """AsyncOpenAI client for ``api_key`` shared by everything on the running event loop."""
+    loop = asyncio.get_running_loop()
+    clients = _ASYNC_CLIENTS.setdefault(loop, {})
+    client = clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            timeout=60.0,
+            max_retries=0,  # retries are handled by _acreate with jittered backoff
+            http_client=DefaultAsyncHttpxClient(**_http_client_kwargs())
+        )
+        clients[api_key] = client
+    return client
+
+
+async def _close_async_clients() -> None:
+    """Close the async clients bound to the running event loop."""
+    clients = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+@atexit.register
+def _close_clients() -> None:
+    with _CLIENT_LOCK:
+        for client in _CLIENT_SINGLETON.values():
+            client.close()
+        _CLIENT_SINGLETON.clear()
+
+
+# Transient API failures worth another attempt (APITimeoutError subclasses APIConnectionError)
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+
+def _backoff_delay(attempt: int, initial: float = 1.0, maximum: float = 10.0) -> float:
+    """Exponential backoff with up to one second of random jitter, capped at ``maximum``."""
+    return min(initial * (2 ** attempt) + random.uniform(0, 1), maximum)
+
+
+class _JSONStreamScanner:
+    """
+    Incremental bracket-depth scanner for streamed ``{"key": [{...}, ...]}`` responses.
+
+    ``feed`` returns the text of each array item as soon as it closes, and
+    ``done`` flips once the top-level object is complete, so the caller can
+    stop reading the stream without waiting for trailing tokens.
+    """
+
+    def __init__(self):
+        self.buffer = []
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.item_start = None
+        self.done = False
+        self._pos = 0
+
+    def feed(self, text: str) -> List[str]:
+        items = []
+        for ch in text:
+            if self.done:
+                break
+            self.buffer.append(ch)
+            pos = self._pos
+            self._pos += 1
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+                continue
+            if ch == '"':
+                self.in_string = True
+            elif ch in '{[':
+                self.depth += 1
+                if self.depth == 3 and ch == '{':
+                    self.item_start = pos
+            elif ch in '}]':
+                self.depth -= 1
+                if self.depth == 2 and ch == '}' and self.item_start is not None:
+                    items.append(''.join(self.buffer[self.item_start:pos + 1]))
+                    self.item_start = None
+                elif self.depth == 0:
+                    self.done = True
+        return items
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.buffer)
+
+
 class AICurationService:
     """Service for AI-powered metadata curation using OpenAI."""
+
+    # Rubric language signals, compiled once; matched against lower-cased reasoning
+    _RE_DEFINITIVE = re.compile(r'\b(clearly|explicitly|definitively|directly (?:states|mentions|shows))\b')
+    _RE_INDICATIVE = re.compile(r'\b(indicates?|suggests?|appears? to be)\b')
+    _RE_HEDGED = re.compile(r'\b(might|may|possibly|perhaps|seems?|could be)\b')
+    _RE_UNCERTAIN = re.compile(r'\b(uncertain|unclear|ambiguous|not sure|cannot determine)\b')
+    _RE_ALTERNATIVES = re.compile(r'\b(alternatives?|could also|other options?|or possibly|rejected)\b')
+    _RE_SENTENCE_END = re.compile(r'[.!?](?:\s|$)')
+    _RE_NUMBER = re.compile(r'\d+(?:[.,]\d+)?')
+
+    # Preliminary-confidence band that still gets a second opinion from Agent B
+    INTERPRETER_BAND = (0.35, 0.75)
+    # Seconds a models.list() availability probe result is reused
+    AVAILABILITY_TTL = 60.0
+    # Completion budget below which page content is compressed further before calling
+    MIN_COMPLETION_BUDGET = 300
+    # Tokens held back from the context window as a safety margin
+    TOKEN_SAFETY_MARGIN = 64
+    # Calls made for a request whose response fails to parse/validate
+    PARSE_ATTEMPTS = 2
+    # Max chars of evidence/reasoning per item sent to the interpreter when trimming
+    INTERPRETER_FIELD_LIMIT = 600
+    # Below this many pages, validate_batch stays in-process (pool startup dominates)
+    PROCESS_POOL_MIN_PAGES = 8
     
     def __init__(self):
         self.api_key = os.getenv('OPENAI_API_KEY')
@@ -29,33 +347,252 @@ class AICurationService:
         self.max_tokens = int(os.getenv('AI_MAX_TOKENS', '2000'))
         # Confidence mode: 'single' (default) or 'two_pass'
         self.confidence_mode = os.getenv('AI_CONFIDENCE_MODE', 'single').lower()
-        
+        # Per-stage concurrency for the async two-pass pipeline
+        self.pipeline_concurrency = int(os.getenv('AI_PIPELINE_CONCURRENCY', '4'))
+        # Fused Agent A: self-scored preliminary confidence, interpreter only for the uncertain band
+        self.skip_interpreter_high_agreement = os.getenv('AI_SKIP_INTERPRETER_HIGH_AGREEMENT') == '1'
+        # Single-pass cascade: small model first, escalate to the large one when unsure
+        self.cascade_small_model = os.getenv('AI_CASCADE_SMALL_MODEL', self.model)
+        self.cascade_large_model = os.getenv('AI_CASCADE_LARGE_MODEL')
+        self.cascade_threshold = float(os.getenv('AI_CASCADE_ESCALATE_THRESHOLD', '0.5'))
+        self.cascade_stats = {'cascade_hit': 0, 'cascade_escalated': 0}
+        # Agent B mode: 'hybrid' (Python rubric, LLM for ambiguous items), 'python' or 'llm'
+        self.interpreter_mode = os.getenv('AI_INTERPRETER_MODE', 'hybrid').lower()
+        # Interpreter prompt: only scored properties' schema, evidence/reasoning capped
+        self.interpreter_trim = os.getenv('AI_INTERPRETER_TRIM', '1') == '1'
+        # Strict json_schema structured output instead of free-form json_object mode
+        self.structured_output = os.getenv('AI_STRUCTURED_OUTPUT', '1') == '1'
+        # Response memoization for identical requests (AI_CACHE_TTL=0 disables)
+        self.cache = LLMCache()
+        # Stream completions and stop reading once the JSON object closes
+        self.stream_responses = os.getenv('AI_STREAM_RESPONSES') == '1'
+        # (monotonic timestamp, result) of the last availability probe
+        self._last_available_check: Optional[Tuple[float, bool]] = None
+        # Process pool for bulk validation (created on first use)
+        self.validation_workers = int(os.getenv('AI_VALIDATION_WORKERS', '0')) or None
+        self._validation_pool: Optional[ProcessPoolExecutor] = None
+        # Retry policy around chat.completions.create
+        self.max_attempts = int(os.getenv('AI_MAX_ATTEMPTS', '4'))
+        self.request_timeout = float(os.getenv('AI_REQUEST_TIMEOUT', '30'))
+
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         
-        # Initialize OpenAI client with explicit configuration
+        # Shared, pooled OpenAI client (see _get_client)
         try:
-            self.client = OpenAI(
-                api_key=self.api_key,
-                timeout=60.0
-            )
+            self.client = _get_client(self.api_key)
+            # Async client is resolved per event loop on first use (see aclient)
+            self._aclient: Optional[AsyncOpenAI] = None
             logger.info(f"AI Curation Service initialized with model: {self.model}")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             raise
     
-    def is_available(self) -> bool:
-        """Check if the AI service is available and working."""
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async client for batch curation (many pages in flight at once)."""
+        return self._aclient or _get_async_client(self.api_key)
+
+    @aclient.setter
+    def aclient(self, client: Optional[AsyncOpenAI]) -> None:
+        self._aclient = client
+
+    def is_available(self, force: bool = False) -> bool:
+        """
+        Check if the AI service is available and working.
+
+        The connectivity probe is cached for AVAILABILITY_TTL seconds so health
+        checks don't spend a models.list() round-trip on every call.
+
+        Args:
+            force: Bypass the cached result and probe the API again
+        """
+        if not self.api_key or not hasattr(self, 'client') or self.client is None:
+            return False
+
+        now = time.monotonic()
+        if not force and self._last_available_check is not None:
+            checked_at, available = self._last_available_check
+            if now - checked_at < self.AVAILABILITY_TTL:
+                return available
+
         try:
-            if not hasattr(self, 'client') or self.client is None:
-                return False
             # Try a simple API call to test connectivity
             self.client.models.list()
-            return True
+            available = True
         except Exception as e:
             logger.warning(f"AI service availability check failed: {e}")
-            return False
+            available = False
+        self._last_available_check = (now, available)
+        return available
     
+    def _complete(self, request: Dict[str, Any], parse: Callable[[str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Run a chat completion through the response cache and parse its content.
+
+        The raw content is only cached once it parses to a non-empty result, so a
+        malformed response is retried on the next call instead of being replayed.
+        """
+        key = self.cache.make_key(request)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            return parse(cached)
+        for attempt in range(self.PARSE_ATTEMPTS):
+            if self.stream_responses:
+                content = self._stream_content(request)
+            else:
+                response = self._create(request)
+                content = response.choices[0].message.content
+            try:
+                result = parse(content)
+                break
+            except ValueError as e:  # JSONDecodeError or pydantic ValidationError
+                if attempt + 1 >= self.PARSE_ATTEMPTS:
+                    raise
+                logger.warning(f"Unparseable response from {request['model']}, retrying: {e}")
+        if result:
+            self.cache.store(key, content)
+        return result
+
+    async def _acomplete(self, request: Dict[str, Any], parse: Callable[[str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Async variant of _complete using the AsyncOpenAI client."""
+        key = self.cache.make_key(request)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return parse(cached)
+        for attempt in range(self.PARSE_ATTEMPTS):
+            if self.stream_responses:
+                scanner = _JSONStreamScanner()
+                async for _ in self._astream_items(request, scanner):
+                    pass
+                content = scanner.text
+            else:
+                response = await self._acreate(request)
+                content = response.choices[0].message.content
+            try:
+                result = parse(content)
+                break
+            except ValueError as e:  # JSONDecodeError or pydantic ValidationError
+                if attempt + 1 >= self.PARSE_ATTEMPTS:
+                    raise
+                logger.warning(f"Unparseable response from {request['model']}, retrying: {e}")
+        if result:
+            await self.cache.set(key, content)
+        return result
+
+    @staticmethod
+    def _estimate_request_tokens(request: Dict[str, Any]) -> int:
+        """Prompt tokens plus the completion budget, as counted against TPM limits."""
+        return _count_message_tokens(request['model'], request['messages']) + request.get('max_tokens', 0)
+
+    def _create(self, request: Dict[str, Any]):
+        """
+        chat.completions.create with a per-attempt timeout and jittered exponential
+        backoff on rate limits, connection errors/timeouts and 5xx responses.
+        """
+        n_tokens = self._estimate_request_tokens(request)
+        for attempt in range(self.max_attempts):
+            try:
+                rate_limiter.acquire_sync(request['model'], n_tokens)
+                return self.client.chat.completions.create(**request, timeout=self.request_timeout)
+            except RETRYABLE_ERRORS as e:
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"OpenAI {type(e).__name__} (attempt {attempt + 1}/{self.max_attempts}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    async def _acreate(self, request: Dict[str, Any]):
+        """Async variant of _create."""
+        n_tokens = self._estimate_request_tokens(request)
+        for attempt in range(self.max_attempts):
+            try:
+                await rate_limiter.acquire(request['model'], n_tokens)
+                return await self.aclient.chat.completions.create(**request, timeout=self.request_timeout)
+            except RETRYABLE_ERRORS as e:
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"OpenAI {type(e).__name__} (attempt {attempt + 1}/{self.max_attempts}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def _stream_content(self, request: Dict[str, Any]) -> str:
+        """Stream a completion, returning as soon as the top-level JSON object closes."""
+        scanner = _JSONStreamScanner()
+        stream = self._create({**request, 'stream': True})
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    scanner.feed(chunk.choices[0].delta.content)
+                    if scanner.done:
+                        break
+        finally:
+            stream.close()
+        return scanner.text
+
+    async def _astream_items(self, request: Dict[str, Any], scanner: '_JSONStreamScanner'):
+        """Async generator over array items of a streamed completion, in the order they close."""
+        stream = await self._acreate({**request, 'stream': True})
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    for item in scanner.feed(chunk.choices[0].delta.content):
+                        yield item
+                    if scanner.done:
+                        break
+        finally:
+            await stream.close()
+
+    def _call_model(self, model: str, request: Dict[str, Any], parse: Callable[[str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Run ``request`` against a specific model."""
+        return self._complete({**request, 'model': model}, parse)
+
+    async def _acall_model(self, model: str, request: Dict[str, Any], parse: Callable[[str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Async variant of _call_model."""
+        return await self._acomplete({**request, 'model': model}, parse)
+
+    def _needs_escalation(self, suggestions: List[Dict[str, Any]]) -> bool:
+        """True when the small model's least confident suggestion is below the threshold."""
+        confidences = []
+        for s in suggestions:
+            try:
+                confidences.append(float(s.get('confidence', 0.0)))
+            except (TypeError, ValueError):
+                confidences.append(0.0)
+        return bool(confidences) and min(confidences) < self.cascade_threshold
+
+    def _record_cascade(self, escalated: bool) -> None:
+        self.cascade_stats['cascade_escalated' if escalated else 'cascade_hit'] += 1
+        logger.info(f"Cascade {'escalated to ' + self.cascade_large_model if escalated else 'hit on ' + self.cascade_small_model} ({self.cascade_stats})")
+
+    def _cascade(self, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Single-pass suggestions via the small model, re-issued on the large model if needed."""
+        if not self.cascade_large_model:
+            return self._complete(request, self._parse_metadata_response)
+        try:
+            suggestions = self._call_model(self.cascade_small_model, request, self._parse_metadata_response)
+            if not self._needs_escalation(suggestions):
+                self._record_cascade(False)
+                return suggestions
+        except ValueError as e:  # JSONDecodeError or pydantic ValidationError
+            logger.warning(f"Small model returned invalid JSON, escalating: {e}")
+        self._record_cascade(True)
+        return self._call_model(self.cascade_large_model, request, self._parse_metadata_response)
+
+    async def _acascade(self, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Async variant of _cascade."""
+        if not self.cascade_large_model:
+            return await self._acomplete(request, self._parse_metadata_response)
+        try:
+            suggestions = await self._acall_model(self.cascade_small_model, request, self._parse_metadata_response)
+            if not self._needs_escalation(suggestions):
+                self._record_cascade(False)
+                return suggestions
+        except ValueError as e:  # JSONDecodeError or pydantic ValidationError
+            logger.warning(f"Small model returned invalid JSON, escalating: {e}")
+        self._record_cascade(True)
+        return await self._acall_model(self.cascade_large_model, request, self._parse_metadata_response)
+
     def generate_metadata_suggestions(
         self, 
         html_content: str, 
@@ -79,34 +616,12 @@ class AICurationService:
                 logger.error("OpenAI client not properly initialized")
                 return []
             
-            # Prepare the prompt for the AI (single-pass default)
-            prompt = self._build_prompt(html_content, url, existing_properties)
+            # Prepare the request for the AI (single-pass default)
+            request = self._metadata_request(html_content, url, existing_properties)
             
             # Call OpenAI API with error handling
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert metadata curator for digital libraries. Analyze the provided HTML content and generate metadata suggestions based on the available property types. Return only valid JSON."
-                        },
-                        {
-                            "role": "user", 
-                            "content": prompt
-                        }
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=min(self.max_tokens, 800),
-                    response_format={"type": "json_object"}
-                )
-                
-                # Parse the AI response
-                ai_response = response.choices[0].message.content
-                suggestions = json.loads(ai_response)
-                
-                logger.info(f"AI generated {len(suggestions.get('suggestions', []))} metadata suggestions")
-                return suggestions.get('suggestions', [])
+                return self._cascade(request)
                 
             except Exception as api_error:
                 logger.error(f"OpenAI API error: {str(api_error)}")
@@ -116,6 +631,74 @@ class AICurationService:
             logger.error(f"Error generating AI suggestions: {str(e)}")
             return []
 
+    def _completion_budget(self, request: Dict[str, Any]) -> int:
+        """Tokens left for the completion after the prompt and safety margin."""
+        window = CONTEXT_WINDOW.get(request['model'], DEFAULT_CONTEXT_WINDOW)
+        return window - _count_message_tokens(request['model'], request['messages']) - self.TOKEN_SAFETY_MARGIN
+
+    def _fit_max_tokens(self, request: Dict[str, Any]) -> bool:
+        """
+        Clamp max_tokens to what the context window leaves for the completion.
+
+        Returns False when the budget is too small to hold a useful JSON answer,
+        so the caller can rebuild the prompt with less page content.
+        """
+        budget = self._completion_budget(request)
+        request['max_tokens'] = max(1, min(request['max_tokens'], budget))
+        return budget >= self.MIN_COMPLETION_BUDGET
+
+    def _metadata_request(
+        self,
+        html_content: str,
+        url: str,
+        properties: List[Dict[str, Any]],
+        content_limit: int = 8000
+    ) -> Dict[str, Any]:
+        """Build the chat-completion kwargs for single-pass suggestion generation."""
+        prompt = self._build_prompt(html_content, url, properties, content_limit)
+        request = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert metadata curator for digital libraries. Analyze the provided HTML content and generate metadata suggestions based on the available property types. Return only valid JSON."
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            "temperature": self.temperature,
+            "max_tokens": min(self.max_tokens, 800),
+            "response_format": self._response_format(SuggestionsEnvelope)
+        }
+        if not self._fit_max_tokens(request) and content_limit > 4000:
+            # Prompt leaves too little room for the answer; compress the page harder
+            return self._metadata_request(html_content, url, properties, content_limit=4000)
+        return request
+
+    def _response_format(self, envelope: Type[BaseModel]) -> Dict[str, Any]:
+        """Strict json_schema response format for ``envelope``, or plain JSON mode."""
+        if self.structured_output:
+            return json_schema_format(envelope)
+        return {"type": "json_object"}
+
+    def _load(self, ai_response: str, envelope: Type[BaseModel]) -> Dict[str, Any]:
+        """
+        Decode a response body. Structured responses are validated against
+        ``envelope`` (raising pydantic.ValidationError on mismatch).
+        """
+        if self.structured_output:
+            return envelope.model_validate_json(ai_response).model_dump()
+        return orjson.loads(ai_response)
+
+    def _parse_metadata_response(self, ai_response: str) -> List[Dict[str, Any]]:
+        """Parse the single-pass AI response into a list of raw suggestions."""
+        suggestions = self._load(ai_response, SuggestionsEnvelope)
+        
+        logger.info(f"AI generated {len(suggestions.get('suggestions', []))} metadata suggestions")
+        return suggestions.get('suggestions', [])
+
     # ----------------------------- Two-pass mode APIs -----------------------------
     def generate_reasoned_suggestions(
         self,
@@ -132,54 +715,261 @@ class AICurationService:
                 logger.error("OpenAI client not properly initialized")
                 return []
 
-            prompt = self._build_reasoner_prompt(html_content, url, properties)
-
-            response = self.client.chat.completions.create(
-                model=self.reasoner_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an expert metadata reasoner. Your reasoning will be analyzed by a strict confidence system. "
-                            "BE HONEST about uncertainty - use appropriate hedging language when you're not 100% certain. "
-                            "ALWAYS mention alternative interpretations you considered and why you rejected them. "
-                            "Provide EXACT verbatim quotes as evidence whenever possible. "
-                            "Use CLEAR language signals: "
-                            "- CERTAIN: 'explicitly states', 'clearly shows', 'directly mentions' "
-                            "- LIKELY: 'indicates', 'suggests', 'appears to be' "
-                            "- UNCERTAIN: 'might', 'possibly', 'could be', 'seems to imply' "
-                            "Return ONLY valid JSON with detailed, honest reasoning."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.4,  # Slightly higher for more nuanced reasoning
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"},
-            )
-
-            ai_response = response.choices[0].message.content
-            parsed = json.loads(ai_response)
-            suggestions = parsed.get('suggestions', [])
-            logger.info(f"Reasoner produced {len(suggestions)} suggestions (no confidence)")
-            # Ensure confidence is absent
-            for s in suggestions:
-                if 'confidence' in s:
-                    s.pop('confidence', None)
-            return suggestions
+            request = self._reasoner_request(html_content, url, properties)
+            return self._complete(request, self._parse_reasoner_response)
         except Exception as e:
             logger.error(f"Reasoner error: {e}")
             return []
 
+    def _reasoner_request(
+        self,
+        html_content: str,
+        url: str,
+        properties: List[Dict[str, Any]],
+        content_limit: int = 8000
+    ) -> Dict[str, Any]:
+        """Build the chat-completion kwargs for Agent A (Reasoner)."""
+        if self.skip_interpreter_high_agreement:
+            prompt = self._build_combined_prompt(html_content, url, properties, content_limit)
+        else:
+            prompt = self._build_reasoner_prompt(html_content, url, properties, content_limit=content_limit)
+        request = {
+            "model": self.reasoner_model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are an expert metadata reasoner. Your reasoning will be analyzed by a strict confidence system. "
+                        "BE HONEST about uncertainty - use appropriate hedging language when you're not 100% certain. "
+                        "ALWAYS mention alternative interpretations you considered and why you rejected them. "
+                        "Provide EXACT verbatim quotes as evidence whenever possible. "
+                        "Use CLEAR language signals: "
+                        "- CERTAIN: 'explicitly states', 'clearly shows', 'directly mentions' "
+                        "- LIKELY: 'indicates', 'suggests', 'appears to be' "
+                        "- UNCERTAIN: 'might', 'possibly', 'could be', 'seems to imply' "
+                        "Return ONLY valid JSON with detailed, honest reasoning."
+                    ),
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.4,  # Slightly higher for more nuanced reasoning
+            "max_tokens": self.max_tokens,
+            "response_format": self._response_format(
+                CombinedEnvelope if self.skip_interpreter_high_agreement else ReasonedEnvelope
+            ),
+        }
+        if not self._fit_max_tokens(request) and content_limit > 4000:
+            # Prompt leaves too little room for the answer; compress the page harder
+            return self._reasoner_request(html_content, url, properties, content_limit=4000)
+        return request
+
+    def _parse_reasoner_response(self, ai_response: str) -> List[Dict[str, Any]]:
+        """Parse Agent A output, stripping any confidence the model emitted anyway."""
+        envelope = CombinedEnvelope if self.skip_interpreter_high_agreement else ReasonedEnvelope
+        parsed = self._load(ai_response, envelope)
+        suggestions = parsed.get('suggestions', [])
+        logger.info(f"Reasoner produced {len(suggestions)} suggestions (no confidence)")
+        # Ensure confidence is absent (a fused call reports preliminary_confidence instead)
+        for s in suggestions:
+            if 'confidence' in s:
+                s.pop('confidence', None)
+        return suggestions
+
+    def _split_by_agreement(
+        self,
+        reasoned_suggestions: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split fused Agent A output into items that still need Agent B and
+        pass-through confidences for items outside the uncertain band.
+
+        Items without a preliminary_confidence always go to the interpreter.
+        """
+        needs_interpreter = []
+        passthrough = []
+        for s in reasoned_suggestions:
+            try:
+                prelim = float(s['preliminary_confidence'])
+                pid = int(s.get('property_id'))
+            except (KeyError, TypeError, ValueError):
+                needs_interpreter.append(s)
+                continue
+            if self.INTERPRETER_BAND[0] <= prelim <= self.INTERPRETER_BAND[1]:
+                needs_interpreter.append(s)
+            else:
+                passthrough.append({
+                    'property_id': pid,
+                    'confidence': min(max(prelim, 0.0), 1.0),
+                    'rationale': 'Preliminary confidence from reasoner (outside interpreter band)',
+                    'tags': {},
+                    'confidence_source': 'reasoner_preliminary'
+                })
+        if passthrough:
+            logger.info(f"Skipping interpreter for {len(passthrough)}/{len(reasoned_suggestions)} high-agreement items")
+        return needs_interpreter, passthrough
+
+    def score_confidence(
+        self,
+        suggestion: Dict[str, Any],
+        prop: Dict[str, Any],
+        content: Optional[str] = None
+    ) -> Tuple[float, Dict[str, Any]]:
+        """
+        Apply the interpreter's scoring rubric locally.
+
+        Mirrors the algorithm in _build_interpreter_prompt:
+        base + evidence + reasoning + property match + type penalties, clamped to [0, 1].
+
+        Args:
+            suggestion: Reasoned suggestion (suggested_value, evidence, reasoning)
+            prop: Property definition the suggestion targets
+            content: Page text, to check whether the evidence is a verbatim quote
+
+        Returns:
+            (confidence, tags) where tags carries the evidence/reasoning labels,
+            an ``ambiguous`` flag and the itemised ``breakdown``
+        """
+        normalized = ' '.join(content.split()).lower() if content else None
+        return self._score(suggestion, prop, normalized)
+
+    def _score(
+        self,
+        suggestion: Dict[str, Any],
+        prop: Dict[str, Any],
+        normalized_content: Optional[str]
+    ) -> Tuple[float, Dict[str, Any]]:
+        """score_confidence against page text already whitespace-collapsed and lower-cased."""
+        value = suggestion.get('suggested_values') or suggestion.get('suggested_value')
+        value_text = ' '.join(str(v) for v in value) if isinstance(value, list) else str(value or '')
+        # Surrounding quotes are stripped first: evidence of only quote marks is no evidence
+        evidence = ' '.join(str(suggestion.get('evidence') or '').split()).strip('"\' ')
+        reasoning = str(suggestion.get('reasoning') or '').lower()
+        evidence_lower = evidence.lower()
+        prop_type = prop.get('type', 'FREE_TEXT')
+        breakdown = [('base', 0.45)]
+
+        # Evidence quality
+        if not evidence:
+            evidence_tag = 'none'
+            breakdown.append(('no evidence', -0.20))
+        elif normalized_content and normalized_content.find(evidence_lower) != -1:
+            evidence_tag = 'direct'
+            breakdown.append(('verbatim quote', 0.30))
+        elif len(evidence) >= 20:
+            evidence_tag = 'indirect'
+            breakdown.append(('specific reference', 0.15))
+        else:
+            evidence_tag = 'indirect'
+            breakdown.append(('vague reference', 0.05))
+
+        # Reasoning strength
+        definitive = self._RE_DEFINITIVE.search(reasoning)
+        indicative = self._RE_INDICATIVE.search(reasoning)
+        hedged = self._RE_HEDGED.search(reasoning)
+        uncertain = self._RE_UNCERTAIN.search(reasoning)
+        alternatives = self._RE_ALTERNATIVES.search(reasoning)
+        if definitive:
+            breakdown.append(('definitive language', 0.20))
+        elif indicative:
+            breakdown.append(('indicative language', 0.10))
+        if hedged:
+            breakdown.append(('hedging language', -0.10))
+        if uncertain:
+            breakdown.append(('uncertain language', -0.20))
+        breakdown.append(('alternatives discussed', -0.10) if alternatives else ('no alternatives', -0.05))
+        if len(self._RE_SENTENCE_END.findall(reasoning)) >= 3:
+            breakdown.append(('detailed reasoning', 0.10))
+
+        if uncertain:
+            reasoning_tag = 'uncertain'
+        elif hedged:
+            reasoning_tag = 'hedged'
+        elif definitive:
+            reasoning_tag = 'definitive'
+        else:
+            reasoning_tag = 'moderate'
+
+        # Property match and type penalties
+        if prop_type in ['MULTIPLE_CHOICE', 'SINGLE_CHOICE']:
+            option_names = {o.get('name', '').lower().strip() for o in prop.get('property_options', [])}
+            values = [str(v).lower().strip() for v in (value if isinstance(value, list) else [value_text])]
+            breakdown.append(('exact option', 0.15) if values and all(v in option_names for v in values) else ('questionable fit', -0.15))
+            if not any(v and v in evidence_lower for v in values):
+                breakdown.append(('choice not stated', -0.12))
+        elif prop_type == 'BINARY':
+            breakdown.append(('exact option', 0.15) if value_text.lower() in ('true', 'false', '1', '0') else ('questionable fit', -0.15))
+        elif prop_type == 'NUMERICAL':
+            numbers = self._RE_NUMBER.findall(value_text)
+            breakdown.append(('close match', 0.05) if numbers else ('requires assumption', -0.08))
+            if not numbers or not all(n in evidence for n in numbers):
+                breakdown.append(('number not quoted', -0.15))
+        else:
+            breakdown.append(('close match', 0.05))
+            if evidence_tag != 'direct':
+                breakdown.append(('free text without quote', -0.08))
+
+        score = min(max(sum(delta for _, delta in breakdown), 0.0), 1.0)
+        tags = {
+            'evidence': evidence_tag,
+            'reasoning': reasoning_tag,
+            # Conflicting signals are what the LLM interpreter is still useful for
+            'ambiguous': bool(definitive and (hedged or uncertain)),
+            'breakdown': breakdown
+        }
+        return score, tags
+
+    def _route_interpreter(
+        self,
+        reasoned_suggestions: List[Dict[str, Any]],
+        properties: List[Dict[str, Any]],
+        content: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Decide which items still need the LLM interpreter.
+
+        Returns (items for the LLM, confidences already resolved locally).
+        """
+        needs_llm, resolved = self._split_by_agreement(reasoned_suggestions)
+        if self.interpreter_mode == 'llm' or not needs_llm:
+            return needs_llm, resolved
+
+        prop_index = {str(p.get('id')): p for p in properties}
+        normalized = ' '.join(content.split()).lower() if content else None
+        remaining = []
+        for s in needs_llm:
+            prop = prop_index.get(str(s.get('property_id')))
+            if prop is None:
+                remaining.append(s)
+                continue
+            confidence, tags = self._score(s, prop, normalized)
+            if tags['ambiguous'] and self.interpreter_mode == 'hybrid':
+                remaining.append(s)
+                continue
+            resolved.append({
+                'property_id': int(prop['id']),
+                'confidence': confidence,
+                'rationale': ' '.join(f"{delta:+.2f} {label}" for label, delta in tags['breakdown']) + f" = {confidence:.2f}",
+                'tags': {'evidence': tags['evidence'], 'reasoning': tags['reasoning']},
+                'confidence_source': 'rubric_v1'
+            })
+        logger.info(f"Rubric scored {len(needs_llm) - len(remaining)}/{len(needs_llm)} items locally")
+        return remaining, resolved
+
     def interpret_confidence(
         self,
         reasoned_suggestions: List[Dict[str, Any]],
         properties: List[Dict[str, Any]],
-        url: Optional[str] = None
+        url: Optional[str] = None,
+        content: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Agent B (Interpreter): Given the suggestions with reasoning/evidence, return calibrated confidences.
         Returns list of {property_id, confidence, rationale, tags}.
+
+        In 'hybrid' interpreter mode (default) the scoring rubric is applied in
+        Python first (see score_confidence) and only ambiguous items go to the LLM;
+        'python' never calls the LLM and 'llm' always does. ``content`` is the page
+        text the reasoner saw, used to check that evidence is quoted verbatim.
         """
         if not reasoned_suggestions:
             return []
@@ -189,118 +979,352 @@ class AICurationService:
                 logger.error("OpenAI client not properly initialized")
                 return []
 
-            # Build interpreter prompt with compact property schema and the reasoned items
-            prompt = self._build_interpreter_prompt(reasoned_suggestions, properties, url)
-
-            response = self.client.chat.completions.create(
-                model=self.interpreter_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a careful but fair confidence scorer for metadata curation. "
-                            "Avoid overconfidence, but do not over-penalize when evidence is solid. "
-                            "Follow the algorithm exactly, applying penalties proportionally. "
-                            "High confidence (>0.80) should be uncommon and reserved for explicit cases, "
-                            "but moderate-high scores (0.60-0.80) are acceptable when evidence is strong and reasoning is sound. "
-                            "Look for hedging language, ambiguity, missing evidence, and alternatives; penalize gently. "
-                            "Return ONLY valid JSON with calculations shown in rationale."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,  # Slightly higher to be a bit less conservative (small change)
-                max_tokens=min(self.max_tokens, 1200),
-                response_format={"type": "json_object"},
-            )
+            reasoned_suggestions, passthrough = self._route_interpreter(reasoned_suggestions, properties, content)
+            if not reasoned_suggestions:
+                return passthrough
+            request = self._interpreter_request(reasoned_suggestions, properties, url)
+            return self._complete(request, self._parse_interpreter_response) + passthrough
+        except Exception as e:
+            logger.error(f"Interpreter error: {e}")
+            return []
 
-            ai_response = response.choices[0].message.content
-            logger.debug(f"Agent B raw response: {ai_response}")
-            
+    def _interpreter_request(
+        self,
+        reasoned_suggestions: List[Dict[str, Any]],
+        properties: List[Dict[str, Any]],
+        url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the chat-completion kwargs for Agent B (Interpreter)."""
+        # Build interpreter prompt with compact property schema and the reasoned items
+        prompt = self._build_interpreter_prompt(reasoned_suggestions, properties, url)
+        return {
+            "model": self.interpreter_model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are a careful but fair confidence scorer for metadata curation. "
+                        "Avoid overconfidence, but do not over-penalize when evidence is solid. "
+                        "Follow the algorithm exactly, applying penalties proportionally. "
+                        "High confidence (>0.80) should be uncommon and reserved for explicit cases, "
+                        "but moderate-high scores (0.60-0.80) are acceptable when evidence is strong and reasoning is sound. "
+                        "Look for hedging language, ambiguity, missing evidence, and alternatives; penalize gently. "
+                        "Return ONLY valid JSON with calculations shown in rationale."
+                    ),
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.3,  # Slightly higher to be a bit less conservative (small change)
+            "max_tokens": min(self.max_tokens, 1200),
+            "response_format": self._response_format(ConfidencesEnvelope),
+        }
+
+    def _parse_interpreter_response(self, ai_response: str) -> List[Dict[str, Any]]:
+        """Parse and normalize Agent B output into per-property confidences."""
+        logger.debug(f"Agent B raw response: {ai_response}")
+        
+        parsed = self._load(ai_response, ConfidencesEnvelope)
+
+        items = parsed.get('confidences', [])
+        # Normalize
+        normalized = []
+        for item in items:
             try:
-                parsed = json.loads(ai_response)
-            except json.JSONDecodeError as e:
-                logger.error(f"Agent B JSON parsing failed: {e}")
-                logger.error(f"Raw response: {ai_response}")
-                
-                # Try to fix common JSON issues
-                try:
-                    # Remove trailing comma before closing bracket
-                    fixed_response = ai_response.rstrip().rstrip(',')
-                    if not fixed_response.endswith(']'):
-                        fixed_response += ']'
-                    if not fixed_response.endswith('}'):
-                        fixed_response += '}'
-                    
-                    parsed = json.loads(fixed_response)
-                    logger.info("Successfully fixed JSON parsing issue")
-                except json.JSONDecodeError as e2:
-                    logger.error(f"JSON fix attempt failed: {e2}")
-                    return []
-                
-            items = parsed.get('confidences', [])
-            # Normalize
-            normalized = []
-            for item in items:
-                try:
-                    pid = int(item.get('property_id'))
-                    c = float(item.get('confidence', 0.0))
-                    if c < 0.0:
-                        c = 0.0
-                    if c > 1.0:
-                        c = 1.0
-                    normalized.append({
-                        'property_id': pid,
-                        'confidence': c,
-                        'rationale': item.get('rationale', ''),
-                        'tags': item.get('tags', {}),
-                        'confidence_source': 'interpreter_v1'
-                    })
-                except Exception:
-                    continue
-            logger.info(f"Interpreter produced confidences for {len(normalized)} properties")
-            return normalized
+                pid = int(item.get('property_id'))
+                c = float(item.get('confidence', 0.0))
+                if c < 0.0:
+                    c = 0.0
+                if c > 1.0:
+                    c = 1.0
+                normalized.append({
+                    'property_id': pid,
+                    'confidence': c,
+                    'rationale': item.get('rationale', ''),
+                    'tags': item.get('tags', {}),
+                    'confidence_source': 'interpreter_v1'
+                })
+            except Exception:
+                continue
+        logger.info(f"Interpreter produced confidences for {len(normalized)} properties")
+        return normalized
+
+    # ------------------------------- Async batch APIs -------------------------------
+    async def agenerate_metadata_suggestions(
+        self,
+        html_content: str,
+        url: str,
+        existing_properties: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Async variant of generate_metadata_suggestions using the shared AsyncOpenAI client."""
+        try:
+            request = self._metadata_request(html_content, url, existing_properties)
+            return await self._acascade(request)
+        except Exception as e:
+            logger.error(f"Error generating AI suggestions: {str(e)}")
+            return []
+
+    async def agenerate_reasoned_suggestions(
+        self,
+        html_content: str,
+        url: str,
+        properties: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Async variant of generate_reasoned_suggestions (Agent A)."""
+        try:
+            request = self._reasoner_request(html_content, url, properties)
+            return await self._acomplete(request, self._parse_reasoner_response)
+        except Exception as e:
+            logger.error(f"Reasoner error: {e}")
+            return []
+
+    async def ainterpret_confidence(
+        self,
+        reasoned_suggestions: List[Dict[str, Any]],
+        properties: List[Dict[str, Any]],
+        url: Optional[str] = None,
+        content: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of interpret_confidence (Agent B)."""
+        if not reasoned_suggestions:
+            return []
+
+        try:
+            reasoned_suggestions, passthrough = self._route_interpreter(reasoned_suggestions, properties, content)
+            if not reasoned_suggestions:
+                return passthrough
+            request = self._interpreter_request(reasoned_suggestions, properties, url)
+            return await self._acomplete(request, self._parse_interpreter_response) + passthrough
         except Exception as e:
             logger.error(f"Interpreter error: {e}")
             return []
+
+    async def astream_metadata_suggestions(
+        self,
+        html_content: str,
+        url: str,
+        properties: List[Dict[str, Any]]
+    ):
+        """
+        Stream single-pass suggestions, validating each one as soon as the model
+        finishes emitting it.
+
+        Yields:
+            Validated suggestions (same shape as validate_suggestions output)
+        """
+        request = self._metadata_request(html_content, url, properties)
+        scanner = _JSONStreamScanner()
+        try:
+            async for item in self._astream_items(request, scanner):
+                try:
+                    raw = orjson.loads(item)
+                except orjson.JSONDecodeError:
+                    continue
+                for validated in self.validate_suggestions([raw], properties):
+                    yield validated
+        except Exception as e:
+            logger.error(f"Error streaming AI suggestions: {str(e)}")
+
+    async def curate_batch(
+        self,
+        pages: List[Dict[str, Any]],
+        properties: List[Dict[str, Any]],
+        validate: bool = False
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Generate single-pass suggestions for many pages concurrently.
+
+        Args:
+            pages: Page dicts as produced by the scraper (``url``, ``text_content``)
+            properties: Available metadata properties
+            validate: Validate each page on the process pool as soon as its response arrives
+
+        Returns:
+            One list of suggestions per page (raw, or validated if ``validate``),
+            in the same order as ``pages``
+        """
+        async def curate(page: Dict[str, Any]) -> List[Dict[str, Any]]:
+            raw = await self.agenerate_metadata_suggestions(
+                page.get('text_content', ''),
+                page.get('url', ''),
+                properties
+            )
+            return await self.avalidate(raw, properties) if validate else raw
+
+        return await asyncio.gather(*[curate(page) for page in pages])
+
+    async def two_pass_pipeline(
+        self,
+        pages: List[Dict[str, Any]],
+        properties: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run two-pass curation over many pages as a pipeline.
+
+        Agent A (Reasoner) feeds a queue that Agent B (Interpreter) workers drain,
+        so Agent B on page i overlaps with Agent A on page i+1 instead of idling.
+        Each stage gets its own concurrency budget.
+
+        Returns:
+            One dict per page (same order as ``pages``) with keys
+            ``page``, ``reasoned`` and ``confidences``
+        """
+        concurrency = max_concurrency or self.pipeline_concurrency
+        reasoned_q: asyncio.Queue = asyncio.Queue()
+        done_q: asyncio.Queue = asyncio.Queue()
+        reasoner_slots = asyncio.Semaphore(concurrency)
+
+        async def reason(index: int, page: Dict[str, Any]) -> None:
+            async with reasoner_slots:
+                reasoned = await self.agenerate_reasoned_suggestions(
+                    page.get('text_content', ''),
+                    page.get('url', ''),
+                    properties
+                )
+            await reasoned_q.put((index, page, reasoned))
+
+        async def interpret() -> None:
+            # Each worker is one unit of Agent B concurrency
+            while True:
+                item = await reasoned_q.get()
+                try:
+                    if item is None:
+                        return
+                    index, page, reasoned = item
+                    confidences = await self.ainterpret_confidence(
+                        reasoned, properties, page.get('url'), page.get('text_content')
+                    )
+                    await done_q.put((index, {
+                        'page': page,
+                        'reasoned': reasoned,
+                        'confidences': confidences
+                    }))
+                finally:
+                    reasoned_q.task_done()
+
+        workers = [asyncio.create_task(interpret()) for _ in range(concurrency)]
+        await asyncio.gather(*[reason(i, page) for i, page in enumerate(pages)])
+        for _ in workers:
+            await reasoned_q.put(None)
+        await asyncio.gather(*workers)
+
+        results: List[Dict[str, Any]] = [{}] * len(pages)
+        while not done_q.empty():
+            index, result = done_q.get_nowait()
+            results[index] = result
+        logger.info(f"Two-pass pipeline processed {len(pages)} pages")
+        return results
+
+    # ------------------------------ Offline Batch API ------------------------------
+    def submit_batch(
+        self,
+        pages: List[Dict[str, Any]],
+        properties: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Submit single-pass curation for many pages as an OpenAI Batch job.
+
+        Batch jobs are billed at half price and complete within 24h, which suits
+        overnight curation of large archives. Each page is keyed by its ``id``
+        (or its position in ``pages``) so results can be matched back.
+
+        Args:
+            pages: Page dicts as produced by the scraper (``url``, ``text_content``)
+            properties: Available metadata properties
+
+        Returns:
+            The batch ID to pass to poll_batch
+        """
+        lines = []
+        for index, page in enumerate(pages):
+            lines.append(orjson.dumps({
+                "custom_id": str(page.get('id', index)),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._metadata_request(
+                    page.get('text_content', ''),
+                    page.get('url', ''),
+                    properties
+                )
+            }))
+        payload = b'\n'.join(lines) + b'\n'
+
+        batch_file = self.client.files.create(file=("curation_batch.jsonl", payload), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} pages")
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Fetch the results of a batch submitted with submit_batch.
+
+        Returns:
+            None while the batch is still running; otherwise a mapping of
+            custom_id to the raw suggestions list (same shape as
+            generate_metadata_suggestions). Failed requests map to an empty list.
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in ('validating', 'in_progress', 'finalizing'):
+            return None
+        if batch.status != 'completed' or not batch.output_file_id:
+            logger.error(f"Batch {batch_id} ended with status {batch.status}")
+            return {}
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            custom_id = record.get('custom_id')
+            try:
+                body = record['response']['body']
+                results[custom_id] = self._parse_metadata_response(body['choices'][0]['message']['content'])
+            except Exception as e:
+                logger.error(f"Batch {batch_id} item {custom_id} failed: {e}")
+                results[custom_id] = []
+        logger.info(f"Batch {batch_id} returned results for {len(results)} pages")
+        return results
+
+    async def aclose(self) -> None:
+        """Close the async client's connection pool and the validation pool (call on shutdown)."""
+        if self._aclient is not None:
+            await self._aclient.close()
+        else:
+            await _close_async_clients()
+        if self._validation_pool is not None:
+            self._validation_pool.shutdown(wait=False)
+            self._validation_pool = None
     
-    def _build_prompt(self, html_content: str, url: str, properties: List[Dict[str, Any]]) -> str:
+    def _build_prompt(
+        self,
+        html_content: str,
+        url: str,
+        properties: List[Dict[str, Any]],
+        content_limit: int = 8000
+    ) -> str:
         """Build the prompt for the AI model."""
         
-        # Clean HTML content (remove excessive whitespace, limit length)
-        cleaned_content = ' '.join(html_content.split())[:8000]  # Limit to 8000 chars
-        
-        # Build property descriptions with IDs
-        property_descriptions = []
-        for prop in properties:
-            prop_id = prop.get('id', 'UNKNOWN')
-            prop_type = prop.get('type', 'UNKNOWN')
-            prop_name = prop.get('name', 'Unknown')
-            prop_tech = prop.get('technical_name', 'unknown')
-            
-            if prop_type in ['MULTIPLE_CHOICE', 'SINGLE_CHOICE']:
-                options = [opt['name'] for opt in prop.get('property_options', [])]
-                prop_desc = f"ID {prop_id}: {prop_name} ({prop_type}): {', '.join(options)}"
-            elif prop_type == 'BINARY':
-                prop_desc = f"ID {prop_id}: {prop_name} (BINARY): true/false"
-            elif prop_type == 'NUMERICAL':
-                prop_desc = f"ID {prop_id}: {prop_name} (NUMERICAL): numeric value"
-            elif prop_type == 'FREE_TEXT':
-                prop_desc = f"ID {prop_id}: {prop_name} (FREE_TEXT): descriptive text"
-            else:
-                prop_desc = f"ID {prop_id}: {prop_name} ({prop_type})"
-            
-            property_descriptions.append(f"- {prop_desc}")
+        # Clean HTML content (collapse whitespace, limit to 8000 chars by default)
+        cleaned_content = _clean_content(html_content, content_limit)
         
-        prompt = f"""
-Analyze the following HTML content from {url} and generate metadata suggestions.
+        property_block = _render_property_block(_property_key(properties))
 
+        # Static prefix first (properties + page), URL and instructions last, so
+        # retries and cascade re-issues hit OpenAI's automatic prompt-prefix cache
+        prompt = f"""
 AVAILABLE METADATA PROPERTIES:
-{chr(10).join(property_descriptions)}
+{property_block}
 
 HTML CONTENT:
 {cleaned_content}
 
+Analyze the HTML content above from {url} and generate metadata suggestions.
+
 INSTRUCTIONS:
 1. Analyze the HTML content to understand the webpage's topic, purpose, and key information
 2. For each metadata property, provide a suggestion based on the content analysis
@@ -308,6 +1332,7 @@ INSTRUCTIONS:
    - You MUST select ONLY from the options listed above
    - NEVER create new values or variants
    - Use the EXACT option names as shown
+   - For MULTIPLE_CHOICE, list every matching option in "suggested_values"; leave it [] for other types
    - If uncertain or none match perfectly, skip the property (confidence 0.0)
 4. For NUMERICAL properties, extract relevant numbers (years, quantities, etc.)
 5. For FREE_TEXT properties, provide concise, descriptive text
@@ -322,6 +1347,7 @@ RETURN FORMAT (JSON):
             "property_id": <exact_property_id_number>,
             "property_technical_name": "<technical_name>",
             "suggested_value": "<value>",
+            "suggested_values": ["<option>", ...],
             "confidence": <0.0-1.0>,
             "evidence": "<supporting text snippet>",
             "reasoning": "<brief explanation>"
@@ -334,43 +1360,61 @@ Generate suggestions based on what you can confidently determine from the conten
         
         return prompt.strip()
 
-    def _build_reasoner_prompt(self, html_content: str, url: str, properties: List[Dict[str, Any]]) -> str:
+    def _build_combined_prompt(
+        self,
+        html_content: str,
+        url: str,
+        properties: List[Dict[str, Any]],
+        content_limit: int = 8000
+    ) -> str:
+        """Prompt for fused Agent A: reasoner output plus a self-scored preliminary confidence."""
+        return self._build_reasoner_prompt(
+            html_content, url, properties,
+            preliminary_confidence=True,
+            content_limit=content_limit
+        )
+
+    def _build_reasoner_prompt(
+        self,
+        html_content: str,
+        url: str,
+        properties: List[Dict[str, Any]],
+        preliminary_confidence: bool = False,
+        content_limit: int = 8000
+    ) -> str:
         """Prompt for Agent A (Reasoner) without confidence, with longer reasoning and direct evidence."""
-        cleaned_content = ' '.join(html_content.split())[:8000]
-
-        property_descriptions = []
-        for prop in properties:
-            prop_id = prop.get('id', 'UNKNOWN')
-            prop_type = prop.get('type', 'UNKNOWN')
-            prop_name = prop.get('name', 'Unknown')
-            if prop_type in ['MULTIPLE_CHOICE', 'SINGLE_CHOICE']:
-                options = [opt['name'] for opt in prop.get('property_options', [])]
-                prop_desc = f"ID {prop_id}: {prop_name} ({prop_type}): {', '.join(options)}"
-            elif prop_type == 'BINARY':
-                prop_desc = f"ID {prop_id}: {prop_name} (BINARY): true/false"
-            elif prop_type == 'NUMERICAL':
-                prop_desc = f"ID {prop_id}: {prop_name} (NUMERICAL): numeric value"
-            elif prop_type == 'FREE_TEXT':
-                prop_desc = f"ID {prop_id}: {prop_name} (FREE_TEXT): descriptive text"
-            else:
-                prop_desc = f"ID {prop_id}: {prop_name} ({prop_type})"
-            property_descriptions.append(f"- {prop_desc}")
+        cleaned_content = _clean_content(html_content, content_limit)
 
-        prompt = f"""
-Analyze the following HTML content from {url} and propose metadata suggestions.
+        property_block = _render_property_block(_property_key(properties))
+
+        if preliminary_confidence:
+            confidence_instruction = (
+                "5. PRELIMINARY CONFIDENCE: Score each suggestion 0.0-1.0 from your own evidence and reasoning. "
+                "Reserve >0.75 for explicit, unambiguous statements and <0.35 for speculation; "
+                "scores in between will be reviewed by a separate system."
+            )
+            confidence_field = ',\n      "preliminary_confidence": <0.0-1.0>'
+        else:
+            confidence_instruction = "5. DO NOT output confidence scores - a separate system will analyze your reasoning."
+            confidence_field = ''
 
+        # Same prefix-first layout as _build_prompt
+        prompt = f"""
 AVAILABLE METADATA PROPERTIES:
-{chr(10).join(property_descriptions)}
+{property_block}
 
 HTML CONTENT:
 {cleaned_content}
 
+Analyze the HTML content above from {url} and propose metadata suggestions.
+
 INSTRUCTIONS:
 1. For each property, suggest a value if supported by content.
 2. For CHOICE properties (MULTIPLE_CHOICE, SINGLE_CHOICE, BINARY):
    - You MUST select ONLY from the predefined options listed above
    - NEVER create new values, variations, or similar terms
    - Use EXACT option names as shown
+   - For MULTIPLE_CHOICE, list every matching option in "suggested_values"; leave it [] for other types
    - If none of the options match the content, skip the property entirely
 3. EVIDENCE: Provide DIRECT verbatim quotes when possible. Be specific about location/context.
 4. REASONING: Write 3-6 sentences using CLEAR language patterns:
@@ -378,7 +1422,7 @@ INSTRUCTIONS:
    - Use HEDGING language when uncertain: "might indicate", "possibly suggests", "seems to imply"
    - MENTION ALTERNATIVES: "Other options like X were rejected because..."
    - BE SPECIFIC: Include exact locations, context, and detailed analysis
-5. DO NOT output confidence scores - a separate system will analyze your reasoning.
+{confidence_instruction}
 6. Use EXACT property ID numbers.
 
 RETURN FORMAT (JSON):
@@ -388,8 +1432,9 @@ RETURN FORMAT (JSON):
       "property_id": <exact_property_id_number>,
       "property_technical_name": "<technical_name>",
       "suggested_value": "<value>",
+      "suggested_values": ["<option>", ...],
       "evidence": "<direct quote or very specific snippet>",
-      "reasoning": "<long reasoning, 3-6 sentences>"
+      "reasoning": "<long reasoning, 3-6 sentences>"{confidence_field}
     }}
   ]
 }}
@@ -403,25 +1448,22 @@ RETURN FORMAT (JSON):
         url: Optional[str] = None
     ) -> str:
         """Prompt for Agent B to assign calibrated confidences to reasoned suggestions."""
-        # Build a compact property schema map for constraints/context
-        prop_lines = []
-        prop_map = {}
-        for p in properties:
-            pid = p.get('id')
-            if pid is None:
-                continue
-            prop_map[int(pid)] = p
-            ptype = p.get('type', 'FREE_TEXT')
-            name = p.get('name', '')
-            opts = ', '.join([o.get('name', '') for o in p.get('property_options', [])]) if ptype in ['MULTIPLE_CHOICE', 'SINGLE_CHOICE', 'BINARY'] else ''
-            prop_lines.append(f"- {pid}: {name} [{ptype}] {opts}")
+        # Compact property schema for constraints/context (memoized across pages);
+        # when trimming, only the properties actually being scored are included
+        used_ids = None
+        if self.interpreter_trim:
+            used_ids = frozenset(str(s.get('property_id')) for s in reasoned_suggestions)
+        prop_schema = _render_property_schema(_property_key(properties), used_ids)
 
         items_lines = []
         for s in reasoned_suggestions:
             pid = s.get('property_id')
-            val = s.get('suggested_value')
+            val = s.get('suggested_values') or s.get('suggested_value')
             ev = s.get('evidence', '')
             rs = s.get('reasoning', '')
+            if self.interpreter_trim:
+                ev = (ev or '')[:self.INTERPRETER_FIELD_LIMIT]
+                rs = (rs or '')[:self.INTERPRETER_FIELD_LIMIT]
             items_lines.append(
                 f"- property_id={pid}\n  value={val}\n  evidence={ev}\n  reasoning={rs}"
             )
@@ -472,7 +1514,7 @@ FINAL = Base + Evidence + Reasoning + Match + Type penalties
 CLAMP to [0.0, 1.0]
 
 PROPERTIES:
-{chr(10).join(prop_lines)}
+{prop_schema}
 
 CALIBRATION EXAMPLES:
 
@@ -527,139 +1569,214 @@ Apply the algorithm consistently to each item. Be CONSERVATIVE but FAIR — many
         Returns:
             Validated suggestions ready for database insertion
         """
-        validated_suggestions = []
-        
-        for suggestion in suggestions:
-            try:
-                # Find the corresponding property by ID
-                prop_id = suggestion.get('property_id')
-                if prop_id is None:
-                    logger.warning("Suggestion missing property_id, skipping")
-                    continue
-                
-                # Convert to int if it's a string
-                try:
-                    prop_id = int(prop_id)
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid property_id format: {prop_id}, skipping")
-                    continue
-                
-                prop = next((p for p in properties if p['id'] == prop_id), None)
-                
-                if not prop:
-                    logger.warning(f"Property ID {prop_id} not found in available properties, skipping suggestion")
-                    continue
-                
-                # Validate the suggestion based on property type
-                validated_suggestion = self._validate_single_suggestion(suggestion, prop)
-                if validated_suggestion:
-                    validated_suggestions.append(validated_suggestion)
-                    
-            except Exception as e:
-                logger.error(f"Error validating suggestion: {str(e)}")
-                continue
-        
-        logger.info(f"Validated {len(validated_suggestions)} suggestions from AI")
-        return validated_suggestions
+        return _validate_suggestions(suggestions, properties)
+
+    def validate_batch(
+        self,
+        pages_suggestions: List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Validate many pages' suggestions, fanning out to a process pool for large batches.
+
+        Args:
+            pages_suggestions: One (raw_suggestions, properties) tuple per page
+
+        Returns:
+            One list of validated suggestions per page, in input order
+        """
+        if len(pages_suggestions) < self.PROCESS_POOL_MIN_PAGES:
+            return [_validate_static(item) for item in pages_suggestions]
+        return list(self._get_validation_pool().map(_validate_static, pages_suggestions))
+
+    def _get_validation_pool(self) -> ProcessPoolExecutor:
+        """Lazily create the shared process pool used for bulk validation."""
+        if self._validation_pool is None:
+            self._validation_pool = ProcessPoolExecutor(max_workers=self.validation_workers)
+        return self._validation_pool
+
+    async def avalidate(
+        self,
+        suggestions: List[Dict[str, Any]],
+        properties: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Validate one page's suggestions on the process pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_validation_pool(), _validate_static, (suggestions, properties))
     
     def _validate_single_suggestion(
         self, 
         suggestion: Dict[str, Any], 
-        property_def: Dict[str, Any]
+        property_def: Dict[str, Any],
+        option_by_name: Optional[Dict[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """Validate a single suggestion against its property definition."""
-        
-        prop_type = property_def.get('type')
-        suggested_value = suggestion.get('suggested_value')
-        confidence = suggestion.get('confidence', 0.0)
-        
-        # Validate confidence score
-        if not isinstance(confidence, (int, float)) or confidence < 0.0 or confidence > 1.0:
-            confidence = 0.0
-        
-        # Validate value based on property type
-        if prop_type == 'BINARY':
-            if suggested_value in ['true', '1', True, 1]:
-                property_option_id = next((opt['id'] for opt in property_def.get('property_options', []) if opt['name'] == '1'), None)
-                custom_value = None
-            elif suggested_value in ['false', '0', False, 0]:
-                property_option_id = next((opt['id'] for opt in property_def.get('property_options', []) if opt['name'] == '0'), None)
-                custom_value = None
+        return _validate_single_suggestion(suggestion, property_def, option_by_name)
+
+
+# ------------------------------- Validation (picklable) -------------------------------
+# Kept at module level so bulk validation can run in a ProcessPoolExecutor.
+
+def _validate_static(page: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Process-pool entry point: validate one (suggestions, properties) pair."""
+    suggestions, properties = page
+    return _validate_suggestions(suggestions, properties)
+
+
+def _validate_suggestions(
+    suggestions: List[Dict[str, Any]], 
+    properties: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Validate and format AI suggestions to match our data model.
+
+    Args:
+        suggestions: Raw AI suggestions
+        properties: Available metadata properties
+
+    Returns:
+        Validated suggestions ready for database insertion
+    """
+    validated_suggestions = []
+    prop_index = {p['id']: p for p in properties}
+    option_maps: Dict[int, Dict[str, Any]] = {}
+
+    for suggestion in suggestions:
+        try:
+            # Find the corresponding property by ID
+            prop_id = suggestion.get('property_id')
+            if prop_id is None:
+                logger.warning("Suggestion missing property_id, skipping")
+                continue
+
+            # Convert to int if it's a string
+            try:
+                prop_id = int(prop_id)
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid property_id format: {prop_id}, skipping")
+                continue
+
+            prop = prop_index.get(prop_id)
+
+            if not prop:
+                logger.warning(f"Property ID {prop_id} not found in available properties, skipping suggestion")
+                continue
+
+            # Validate the suggestion based on property type
+            if prop_id not in option_maps:
+                option_maps[prop_id] = _option_index(prop)
+            validated_suggestion = _validate_single_suggestion(suggestion, prop, option_maps[prop_id])
+            if validated_suggestion:
+                validated_suggestions.append(validated_suggestion)
+
+        except Exception as e:
+            logger.error(f"Error validating suggestion: {str(e)}")
+            continue
+
+    logger.info(f"Validated {len(validated_suggestions)} suggestions from AI")
+    return validated_suggestions
+
+
+def _validate_single_suggestion(
+    suggestion: Dict[str, Any], 
+    property_def: Dict[str, Any],
+    option_by_name: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Validate a single suggestion against its property definition."""
+    if option_by_name is None:
+        option_by_name = _option_index(property_def)
+
+    prop_type = property_def.get('type')
+    suggested_value = suggestion.get('suggested_value')
+    confidence = suggestion.get('confidence', 0.0)
+
+    # Validate confidence score
+    if not isinstance(confidence, (int, float)) or confidence < 0.0 or confidence > 1.0:
+        confidence = 0.0
+
+    # Validate value based on property type
+    if prop_type == 'BINARY':
+        if suggested_value in ['true', '1', True, 1]:
+            property_option_id = option_by_name.get('1')
+            custom_value = None
+        elif suggested_value in ['false', '0', False, 0]:
+            property_option_id = option_by_name.get('0')
+            custom_value = None
+        else:
+            logger.warning(f"Invalid binary value: {suggested_value}")
+            return None
+
+    elif prop_type in ['MULTIPLE_CHOICE', 'SINGLE_CHOICE']:
+        # STRICT matching against predefined options
+        available_options = property_def.get('property_options', [])
+        available_names = [opt['name'] for opt in available_options]
+
+        # Support both 'suggested_value' (string) and 'suggested_values' (array) from the AI
+        values_from_ai = []
+        if prop_type == 'MULTIPLE_CHOICE':
+            # Structured output always sends the array, so an empty one falls back to the string
+            if isinstance(suggestion.get('suggested_values'), list) and suggestion['suggested_values']:
+                values_from_ai = [str(v).strip() for v in suggestion.get('suggested_values') if str(v).strip()]
+            elif suggested_value:  # backwards compatibility if model returns single string
+                values_from_ai = [str(suggested_value).strip()]
             else:
-                logger.warning(f"Invalid binary value: {suggested_value}")
+                values_from_ai = []
+        else:  # SINGLE_CHOICE
+            if isinstance(suggested_value, list):
+                # If AI mistakenly returns list for single choice, keep only first
+                values_from_ai = [str(suggested_value[0]).strip()] if suggested_value else []
+            else:
+                values_from_ai = [str(suggested_value).strip()] if suggested_value else []
+
+        # Map to option IDs with exact, case-insensitive matching
+        matched_ids = []
+        for v in values_from_ai:
+            match = option_by_name.get(v.lower())
+            if match and match not in matched_ids:
+                matched_ids.append(match)
+
+        if prop_type == 'SINGLE_CHOICE':
+            # Require exactly one valid match
+            if len(matched_ids) != 1:
+                logger.warning(f"AI suggested invalid single choice '{values_from_ai}' for {property_def['name']}. Available: {available_names}")
                 return None
-                
-        elif prop_type in ['MULTIPLE_CHOICE', 'SINGLE_CHOICE']:
-            # STRICT matching against predefined options
-            available_options = property_def.get('property_options', [])
-            available_names = [opt['name'] for opt in available_options]
-
-            # Support both 'suggested_value' (string) and 'suggested_values' (array) from the AI
-            values_from_ai = []
-            if prop_type == 'MULTIPLE_CHOICE':
-                if isinstance(suggestion.get('suggested_values'), list):
-                    values_from_ai = [str(v).strip() for v in suggestion.get('suggested_values') if str(v).strip()]
-                elif suggested_value:  # backwards compatibility if model returns single string
-                    values_from_ai = [str(suggested_value).strip()]
-                else:
-                    values_from_ai = []
-            else:  # SINGLE_CHOICE
-                if isinstance(suggested_value, list):
-                    # If AI mistakenly returns list for single choice, keep only first
-                    values_from_ai = [str(suggested_value[0]).strip()] if suggested_value else []
-                else:
-                    values_from_ai = [str(suggested_value).strip()] if suggested_value else []
-
-            # Map to option IDs with exact, case-insensitive matching
-            matched_ids = []
-            for v in values_from_ai:
-                match = next((opt['id'] for opt in available_options if opt['name'].lower().strip() == v.lower()), None)
-                if match and match not in matched_ids:
-                    matched_ids.append(match)
-
-            if prop_type == 'SINGLE_CHOICE':
-                # Require exactly one valid match
-                if len(matched_ids) != 1:
-                    logger.warning(f"AI suggested invalid single choice '{values_from_ai}' for {property_def['name']}. Available: {available_names}")
-                    return None
-                property_option_id = matched_ids[0]
-                custom_value = None
-            else:  # MULTIPLE_CHOICE
-                if len(matched_ids) == 0:
-                    logger.warning(f"AI suggested invalid multiple choice '{values_from_ai}' for {property_def['name']}. Available: {available_names}")
-                    return None
-                # Primary option is the first; store all IDs as comma-separated in custom_value for compatibility
-                property_option_id = matched_ids[0]
-                custom_value = ",".join([str(x) for x in matched_ids])
-                
-        elif prop_type in ['NUMERICAL', 'FREE_TEXT']:
-            property_option_id = None
-            custom_value = str(suggested_value) if suggested_value else None
-            
-            if not custom_value:
-                logger.warning(f"Empty value for {prop_type} property")
+            property_option_id = matched_ids[0]
+            custom_value = None
+        else:  # MULTIPLE_CHOICE
+            if len(matched_ids) == 0:
+                logger.warning(f"AI suggested invalid multiple choice '{values_from_ai}' for {property_def['name']}. Available: {available_names}")
                 return None
-        
-        else:
-            logger.warning(f"Unknown property type: {prop_type}")
+            # Primary option is the first; store all IDs as comma-separated in custom_value for compatibility
+            property_option_id = matched_ids[0]
+            custom_value = ",".join([str(x) for x in matched_ids])
+
+    elif prop_type in ['NUMERICAL', 'FREE_TEXT']:
+        property_option_id = None
+        custom_value = str(suggested_value) if suggested_value else None
+
+        if not custom_value:
+            logger.warning(f"Empty value for {prop_type} property")
             return None
-        
-        # Return validated suggestion
-        result = {
-            'property_id': property_def['id'],
-            'property_option_id': property_option_id,
-            'custom_value': custom_value,
-            'confidence': confidence,
-            'evidence': suggestion.get('evidence', ''),
-            'reasoning': suggestion.get('reasoning', ''),
-            'ai_generated': True
-        }
 
-        # Include full list for MULTIPLE_CHOICE for downstream consumers
-        if prop_type == 'MULTIPLE_CHOICE' and custom_value:
-            try:
-                result['property_option_ids'] = [int(x) for x in custom_value.split(',') if x]
-            except Exception:
-                pass
+    else:
+        logger.warning(f"Unknown property type: {prop_type}")
+        return None
 
-        return result
+    # Return validated suggestion
+    result = {
+        'property_id': property_def['id'],
+        'property_option_id': property_option_id,
+        'custom_value': custom_value,
+        'confidence': confidence,
+        'evidence': suggestion.get('evidence', ''),
+        'reasoning': suggestion.get('reasoning', ''),
+        'ai_generated': True
+    }
+
+    # Include full list for MULTIPLE_CHOICE for downstream consumers
+    if prop_type == 'MULTIPLE_CHOICE' and custom_value:
+        try:
+            result['property_option_ids'] = [int(x) for x in custom_value.split(',') if x]
+        except Exception:
+            pass
+
+    return result
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Response schemas for the AI curation agents.
+Used to request strict structured output (response_format json_schema).
+"""
+
+import copy
+import functools
+from typing import Any, Dict, List, Type
+
+from pydantic import BaseModel
+
+
+class Suggestion(BaseModel):
+    """Single-pass suggestion: value plus the model's own confidence."""
+    property_id: int
+    property_technical_name: str
+    suggested_value: str
+    # MULTIPLE_CHOICE options; strict mode makes it required, so [] when unused
+    suggested_values: List[str]
+    confidence: float
+    evidence: str
+    reasoning: str
+
+
+class ReasonedSuggestion(BaseModel):
+    """Agent A (Reasoner) suggestion, without confidence."""
+    property_id: int
+    property_technical_name: str
+    suggested_value: str
+    # MULTIPLE_CHOICE options; strict mode makes it required, so [] when unused
+    suggested_values: List[str]
+    evidence: str
+    reasoning: str
+
+
+class CombinedSuggestion(ReasonedSuggestion):
+    """Fused Agent A suggestion carrying a self-scored preliminary confidence."""
+    preliminary_confidence: float
+
+
+class ConfidenceTags(BaseModel):
+    evidence: str
+    reasoning: str
+
+
+class ConfidenceItem(BaseModel):
+    """Agent B (Interpreter) confidence for one property."""
+    property_id: int
+    confidence: float
+    rationale: str
+    tags: ConfidenceTags
+
+
+class SuggestionsEnvelope(BaseModel):
+    suggestions: List[Suggestion]
+
+
+class ReasonedEnvelope(BaseModel):
+    suggestions: List[ReasonedSuggestion]
+
+
+class CombinedEnvelope(BaseModel):
+    suggestions: List[CombinedSuggestion]
+
+
+class ConfidencesEnvelope(BaseModel):
+    confidences: List[ConfidenceItem]
+
+
+def _make_strict(node: Any) -> Any:
+    """Strict mode needs every object closed and every property required."""
+    if isinstance(node, dict):
+        node.pop('title', None)
+        if node.get('type') == 'object' and 'properties' in node:
+            node['additionalProperties'] = False
+            node['required'] = list(node['properties'])
+        for key, value in node.items():
+            if key in ('properties', '$defs'):
+                # Mappings of name -> schema; the names themselves are not schema keywords
+                for sub_schema in value.values():
+                    _make_strict(sub_schema)
+            else:
+                _make_strict(value)
+    elif isinstance(node, list):
+        for item in node:
+            _make_strict(item)
+    return node
+
+
+@functools.lru_cache(maxsize=None)
+def json_schema_format(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Build a strict ``response_format`` for chat.completions.create from a pydantic model."""
+    schema = _make_strict(copy.deepcopy(model.model_json_schema()))
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "schema": schema,
+            "strict": True
+        }
+    }
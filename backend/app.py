@@ -1,19 +1,40 @@
 #!/usr/bin/env python3
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import requests
 from bs4 import BeautifulSoup
 import json
+import orjson
 # --------------------------- standard lib ---------------------------------
 from enum import Enum
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+import bisect
+import datetime as dt
+from datetime import timezone
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import heapq
+import itertools
 import os
+import threading
+import time
+import traceback
 from dotenv import load_dotenv
 
 # Import metadata curation client
 from metadata_curation_client import CurationAPIClient, PropertyType, SourceManager
 
+# In-process TTL cache (also used by the AI service)
+from ai_cache import TTLCache
+
 # Import scraping service
 from services.scraper import EntityScraper, ScraperError, HTMLFetchError, ContentExtractionError
+from services.api_cache import cached_call
+from services.http import session as http_session, apply_default_timeout
+from services.study_log import StudyLogWriter
+from services.audit_store import store_from_env
 
 # --------------------------------------------------------------------------
 # Constants (external demo endpoint used by the preview helper below)
@@ -27,7 +48,26 @@ EXTERNAL_API: str = "https://api.example.org/v1/pages"  # ← placeholder (repla
 # --------------------------------------------------------------------------------------
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by request.get_json() and jsonify()."""
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        # Skip the bytes -> str -> bytes round trip of the default implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Load environment variables
@@ -41,6 +81,10 @@ logger = app.logger
 
 # Initialize Metadata Curation API Client
 curation_client = None
+# True when the client would call this server itself (no CURATION_API_BASE_URL)
+CURATION_API_SELF_REFERENCE = False
+# Seconds before an upstream curation API call gives up
+CURATION_API_TIMEOUT = float(os.getenv('CURATION_API_TIMEOUT', '10'))
 try:
     api_base_url = os.getenv('CURATION_API_BASE_URL')
     api_key = os.getenv('CURATION_API_KEY')
@@ -57,7 +101,9 @@ try:
             base_url="http://localhost:8001",
             api_key="dev-key"
         )
+        CURATION_API_SELF_REFERENCE = True
         logger.info("Metadata Curation API Client initialized in self-referencing mode: http://localhost:8001")
+    apply_default_timeout(curation_client.session, CURATION_API_TIMEOUT)
 except Exception as e:
     logger.error(f"Failed to initialize Metadata Curation API Client: {e}")
     logger.warning("Falling back to dummy data mode")
@@ -96,6 +142,25 @@ class PropertyType(str, Enum):
     NUMERICAL = "NUMERICAL"
     FREE_TEXT = "FREE_TEXT"
 
+    # Render as the bare value (e.g. in prompts and error messages), not "PropertyType.X"
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+# Property types whose value is an option id vs. a free/numeric value
+_CHOICE_TYPES = frozenset({PropertyType.MULTIPLE_CHOICE, PropertyType.SINGLE_CHOICE, PropertyType.BINARY})
+_VALUE_TYPES = frozenset({PropertyType.NUMERICAL, PropertyType.FREE_TEXT})
+
+
+def _normalize_property_type(raw) -> "PropertyType | str":
+    """Map a type string to PropertyType once at load time; unknown types are kept as-is."""
+    value = str(raw or "FREE_TEXT").upper()
+    try:
+        return PropertyType(value)
+    except ValueError:
+        logger.warning(f"Unknown property type {raw!r}; keeping it as a plain string")
+        return value
+
 
 # --------------------------------------------------------------------------------------
 # In-memory demo implementation of the Metadata-Curation API
@@ -103,15 +168,66 @@ class PropertyType(str, Enum):
 
 # Import dummy data module
 from dummy_data import (
-    get_dummy_sources, get_dummy_properties, get_dummy_editions,
-    create_dummy_suggestions_for_edition
+    get_dummy_sources, get_dummy_properties, get_dummy_editions, thaw
 )
 
-# Enhanced data structure with evidence tracking and required fields
+class _Record:
+    """Dict-style access for slotted records, so code written against dicts keeps working."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value) -> None:
+        setattr(self, key, value)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def keys(self) -> list[str]:
+        return [f.name for f in fields(self)]
+
+    def to_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Build a record from a dict, ignoring keys that aren't fields."""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+@dataclass(slots=True)
+class Source(_Record):
+    id: int
+    name: str = "Unknown Source"
+    description: str = ""
+    source_type: str = "unknown"
+    is_dummy: bool = False
+    last_ingested_at: str | None = None
+
+
+@dataclass(slots=True)
+class Edition(_Record):
+    id: int
+    source_id: int | None = None
+    source_internal_id: str = ""
+    entity_name: str = ""
+    entity_description: str = ""
+    is_dummy: bool = False
+    context_ids: list = field(default_factory=list)
+
+
+# Enhanced data structure with evidence tracking and required fields.
+# Sources and editions have a fixed shape and are stored as slotted records; the
+# other tables stay dicts because their records grow keys as they are curated.
 DATA: dict[str, list] = {
-    "sources": [],       # [{id:int, name:str, description:str, is_dummy:bool, source_type:str}]
+    "sources": [],       # [Source]
     "properties": [],    # [{id:int, technical_name:str, name:str, type:PropertyType, property_options:list, is_required:bool}]
-    "editions": [],      # [{id:int, source_id:int, source_internal_id:str, entity_name:str, entity_description:str, is_dummy:bool}]
+    "editions": [],      # [Edition]
     "suggestions": [],   # [{id:int, source_id:int, edition_id:int, property_id:int, ..., evidence:dict, is_required:bool}]
     "curation_history": [],  # [{id:int, suggestion_id:int, action:str, timestamp:str, user_note:str, user_id:str, model_version:str}]
     "evidence": [],      # [{id:int, suggestion_id:int, content:str, source_url:str, confidence:float, extraction_method:str}]
@@ -119,102 +235,532 @@ DATA: dict[str, list] = {
 }
 
 
+@dataclass
+class Indexes:
+    """Lookup tables over the DATA tables.
+
+    Kept in step with every append so id lookups and source/edition filters
+    don't have to scan the lists. Any code that replaces one of those lists
+    wholesale must call ``rebuild`` (or ``index_editions``/``index_properties``
+    for the catalog tables).
+    """
+
+    suggestions_by_id: dict[int, dict] = field(default_factory=dict)
+    history_by_id: dict[int, dict] = field(default_factory=dict)
+    # edition_id -> its first publishing record
+    publishing_by_edition: dict[int, dict] = field(default_factory=dict)
+    # History/publishing records ordered by timestamp; the audit log bisects these
+    # for date ranges
+    history_by_time: list[dict] = field(default_factory=list)
+    publishing_by_time: list[dict] = field(default_factory=list)
+    # edition_id -> counter bumped whenever one of its suggestions is added, removed or
+    # curated; never reset, so a stale cached validation can't match again
+    edition_versions: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    suggestions_by_source: dict[int, set[int]] = field(default_factory=lambda: defaultdict(set))
+    suggestions_by_edition: dict[int, set[int]] = field(default_factory=lambda: defaultdict(set))
+    # (source_id, edition_id, property_id) -> suggestions for that field, in insertion order
+    suggestions_by_field: dict[tuple, list[dict]] = field(default_factory=lambda: defaultdict(list))
+    editions_by_id: dict[int, Edition] = field(default_factory=dict)
+    editions_by_source: dict[int, list[dict]] = field(default_factory=dict)
+    properties_by_id: dict[int, dict] = field(default_factory=dict)
+    option_ids_by_property: dict[int, frozenset] = field(default_factory=dict)
+    properties_by_source: dict[int, list[dict]] = field(default_factory=dict)
+    dummy_properties: list[dict] = field(default_factory=list)
+    real_properties: list[dict] = field(default_factory=list)
+    sources_by_id: dict[int, Source] = field(default_factory=dict)
+    source_is_dummy: dict[int, bool] = field(default_factory=dict)
+    properties_signature: bytes = b""
+    # Bumped (with the wall-clock time) whenever the catalog table is re-indexed;
+    # drives the cached GET /api/editions and /api/properties responses
+    editions_version: int = 0
+    editions_modified_at: float = field(default_factory=time.time)
+    properties_version: int = 0
+    properties_modified_at: float = field(default_factory=time.time)
+
+    def add_suggestion(self, suggestion: dict) -> None:
+        # Denormalized from the property so validation never has to join back to it
+        suggestion["is_required"] = self.property_is_required(suggestion.get("property_id"))
+        self.suggestions_by_id[suggestion["id"]] = suggestion
+        self.suggestions_by_source[suggestion.get("source_id")].add(suggestion["id"])
+        self.suggestions_by_edition[suggestion.get("edition_id")].add(suggestion["id"])
+        self.suggestions_by_field[_field_key(suggestion)].append(suggestion)
+        self.touch_edition(suggestion.get("edition_id"))
+
+    def remove_suggestion(self, suggestion: dict) -> None:
+        self.suggestions_by_id.pop(suggestion["id"], None)
+        self.suggestions_by_source[suggestion.get("source_id")].discard(suggestion["id"])
+        self.suggestions_by_edition[suggestion.get("edition_id")].discard(suggestion["id"])
+        key = _field_key(suggestion)
+        same_field = self.suggestions_by_field.get(key, [])
+        same_field[:] = [s for s in same_field if s is not suggestion]
+        if not same_field:
+            self.suggestions_by_field.pop(key, None)
+        self.touch_edition(suggestion.get("edition_id"))
+
+    def touch_edition(self, edition_id: int | None) -> None:
+        self.edition_versions[edition_id] += 1
+
+    def property_is_required(self, property_id: int | None) -> bool:
+        property_def = self.properties_by_id.get(property_id)
+        return bool(property_def.get("is_required", False)) if property_def else False
+
+    def add_history(self, entry: dict) -> None:
+        self.history_by_id[entry["id"]] = entry
+        # History is written right after a suggestion is curated, edited or reverted
+        suggestion = self.suggestions_by_id.get(entry.get("suggestion_id"))
+        if suggestion is not None:
+            self.touch_edition(suggestion.get("edition_id"))
+        _insort_by_time(self.history_by_time, entry, "timestamp")
+
+    def add_publishing(self, record: dict) -> None:
+        self.publishing_by_edition.setdefault(record["edition_id"], record)
+        _insort_by_time(self.publishing_by_time, record, "published_at")
+
+    def index_editions(self, editions: list) -> None:
+        self.editions_by_id = {e.id: e for e in editions}
+        by_source = defaultdict(list)
+        for edition in editions:
+            by_source[edition.source_id].append(edition)
+        self.editions_by_source = dict(by_source)
+        self.editions_version += 1
+        self.editions_modified_at = time.time()
+
+    def index_properties(self, properties: list) -> None:
+        self.properties_by_id = {p["id"]: p for p in properties}
+        self.option_ids_by_property = {
+            p["id"]: frozenset(o["id"] for o in p.get("property_options") or ())
+            for p in properties
+        }
+        by_source = defaultdict(list)
+        for p in properties:
+            if p.get("source_id") is not None:
+                by_source[p["source_id"]].append(p)
+        self.properties_by_source = dict(by_source)
+        # A reloaded catalog may flip is_required; refresh the copies on the suggestions
+        for suggestion in self.suggestions_by_id.values():
+            suggestion["is_required"] = self.property_is_required(suggestion.get("property_id"))
+        self.dummy_properties = [p for p in properties if p.get("is_dummy", False) is True]
+        self.real_properties = [p for p in properties if p.get("is_dummy", False) is False]
+        # Changes whenever the property catalog does; part of the AI suggestion cache key
+        self.properties_signature = hashlib.sha256(
+            orjson.dumps(properties, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        ).digest()
+        self.properties_version += 1
+        self.properties_modified_at = time.time()
+
+    def index_sources(self, sources: list) -> None:
+        self.sources_by_id = {s.id: s for s in sources}
+        self.source_is_dummy = {s.id: s.is_dummy for s in sources}
+        # Source dummy flags decide which properties a source-scoped request sees
+        self.properties_version += 1
+        self.properties_modified_at = time.time()
+
+    def rebuild(self, data: dict) -> None:
+        self.suggestions_by_id.clear()
+        self.history_by_id.clear()
+        self.history_by_time.clear()
+        self.suggestions_by_source.clear()
+        self.suggestions_by_edition.clear()
+        self.suggestions_by_field.clear()
+        for suggestion in data.get("suggestions", []):
+            self.add_suggestion(suggestion)
+        for entry in data.get("curation_history", []):
+            self.add_history(entry)
+        self.publishing_by_edition.clear()
+        self.publishing_by_time.clear()
+        for record in data.get("publishing_state", []):
+            self.add_publishing(record)
+        self.index_editions(data.get("editions", []))
+        self.index_properties(data.get("properties", []))
+        self.index_sources(data.get("sources", []))
+
+    def filter_suggestions(self, source_id: int | None = None, edition_id: int | None = None) -> list[dict]:
+        """Suggestions matching the given source/edition, in id order."""
+        ids = None
+        if source_id:
+            ids = self.suggestions_by_source.get(source_id, set())
+        if edition_id and (ids is None or ids):
+            edition_ids = self.suggestions_by_edition.get(edition_id, set())
+            ids = edition_ids if ids is None else ids & edition_ids
+        if ids is None:
+            return list(self.suggestions_by_id.values())
+        if not ids:
+            return []
+        return [self.suggestions_by_id[i] for i in sorted(ids)]
+
+
+def _field_key(suggestion: dict) -> tuple:
+    return suggestion.get("source_id"), suggestion.get("edition_id"), suggestion.get("property_id")
+
+
+def _insort_by_time(rows: list[dict], row: dict, time_key: str) -> None:
+    # Records are almost always appended in time order, so this is usually an append;
+    # ties on the timestamp are ordered by id so paging through them is deterministic
+    bisect.insort_right(rows, row, key=lambda r: (r[time_key], r["id"]))
+
+
+def _time_range(rows: list[dict], time_key: str, start: str | None, end: str | None,
+                before: tuple | None = None) -> list[dict]:
+    """Rows whose ISO timestamp falls within [start, end] (and whose (timestamp, id) is
+    below ``before``), newest first."""
+    lo = bisect.bisect_left(rows, start, key=lambda r: r[time_key]) if start else 0
+    hi = bisect.bisect_right(rows, end, key=lambda r: r[time_key]) if end else len(rows)
+    if before:
+        hi = min(hi, bisect.bisect_left(rows, before, key=lambda r: (r[time_key], r["id"])))
+    return rows[lo:hi][::-1]
+
+
+INDEXES = Indexes()
+
+# Guards every mutation of DATA; re-entrant so locked helpers can call each other
+DATA_LOCK = threading.RLock()
+
+# Set once DATA has been loaded from the API (or dummy data)
+_DATA_READY = False
+# Serializes the one-time load; never taken while DATA_LOCK is held
+_DATA_LOAD_LOCK = threading.Lock()
+
+
+def _synchronized(func):
+    """Run ``func`` while holding DATA_LOCK."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with DATA_LOCK:
+            return func(*args, **kwargs)
+    return wrapper
+
+# Bumped on every DATA mutation; cached responses built under an older version are stale
+DATA_VERSION = 0
+
+# 'single' or 'two_pass' AI suggestion generation for /api/entities/<id>/scrape
+AI_CONFIDENCE_MODE = os.getenv('AI_CONFIDENCE_MODE', 'single').lower()
+
+# Concurrent pages per scrape request when generating AI suggestions
+AI_PAGE_WORKERS = max(1, int(os.getenv('AI_PAGE_WORKERS', '8')))
+
+# Seconds a cached GET /api/sources payload is reused for
+SOURCES_CACHE_TTL = float(os.getenv('SOURCES_CACHE_TTL', '15'))
+
+# max-age for GET /api/editions and /api/properties (only change on reload/catalog append)
+CATALOG_CACHE_TTL = float(os.getenv('CATALOG_CACHE_TTL', '60'))
+
+# Next id per DATA table, seeded from the table's max id on first use
+_NEXT_IDS: dict[str, int] = {}
+
+# key -> (generated_at, data_version, etag, body_bytes)
+_RESPONSE_CACHE: dict[str, tuple[float, int, str, bytes]] = {}
+
+# (entity_id, fallback urls) -> (pages_data, scraping_errors) of a recent scrape
+SCRAPE_CACHE = TTLCache(maxsize=128, ttl=float(os.getenv('SCRAPE_CACHE_TTL', '300')))
+
+# sha256(html, url, property catalog) -> validated AI suggestions (orjson bytes)
+AI_SUGGESTION_CACHE = TTLCache(maxsize=512, ttl=float(os.getenv('AI_CACHE_TTL', '3600')))
+
+# Appends /api/log-curation-time records to study_logs/YYYYMMDD.jsonl off the request thread
+STUDY_LOG = StudyLogWriter(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'study_logs'))
+
+# Optional durable, indexed copy of the audit log (AUDIT_DB_PATH); None keeps it in memory only
+AUDIT_STORE = store_from_env()
+
+# Page size bounds for GET /api/audit-log
+AUDIT_LOG_DEFAULT_LIMIT = 500
+AUDIT_LOG_MAX_LIMIT = 1000
+# Time window for GET /api/audit-log: used when start_date is omitted, and the widest span allowed
+AUDIT_LOG_DEFAULT_WINDOW = dt.timedelta(days=float(os.getenv('AUDIT_LOG_DEFAULT_DAYS', '7')))
+AUDIT_LOG_MAX_WINDOW = dt.timedelta(days=float(os.getenv('AUDIT_LOG_MAX_DAYS', '90')))
+
+# (validator name, edition_id) -> ((edition version, properties version), earliest evidence expiry, result)
+VALIDATION_CACHE: dict[tuple, tuple] = {}
+
+
+@_synchronized
+def _bump_data_version() -> None:
+    global DATA_VERSION
+    DATA_VERSION += 1
+
+
+@_synchronized
+def _add_suggestion(suggestion: dict) -> None:
+    """Append a suggestion to the store and index it."""
+    DATA["suggestions"].append(suggestion)
+    INDEXES.add_suggestion(suggestion)
+    _bump_data_version()
+
+
+@_synchronized
+def _add_suggestions(suggestions: list) -> None:
+    """Append many suggestions at once; the data version is bumped a single time."""
+    if not suggestions:
+        return
+    DATA["suggestions"].extend(suggestions)
+    for suggestion in suggestions:
+        INDEXES.add_suggestion(suggestion)
+    _bump_data_version()
+
+
+@_synchronized
+def _remove_suggestions(suggestions: list) -> None:
+    """Drop suggestions from the store, updating the indexes in place instead of rebuilding them."""
+    if not suggestions:
+        return
+    doomed = {s["id"] for s in suggestions}
+    # One pass, in place, so the list object (and any reference to it) is kept
+    DATA["suggestions"][:] = [s for s in DATA["suggestions"] if s["id"] not in doomed]
+    for suggestion in suggestions:
+        INDEXES.remove_suggestion(suggestion)
+        _EVIDENCE_CHECKS.pop(suggestion["id"], None)
+    _bump_data_version()
+
+
+@_synchronized
+def _add_history(entry: dict) -> None:
+    """Append a curation history entry to the store and index it."""
+    DATA["curation_history"].append(entry)
+    INDEXES.add_history(entry)
+    if AUDIT_STORE is not None:
+        suggestion = INDEXES.suggestions_by_id.get(entry["suggestion_id"])
+        if suggestion is not None:
+            AUDIT_STORE.record(_curation_audit_entry(entry, suggestion))
+    _bump_data_version()
+
+
+def _edition_validation(validator, edition_id: int) -> dict:
+    """``validator(edition suggestions)``, reused until the edition's suggestions or the property
+    catalog change, or until the first piece of the edition's evidence expires."""
+    version = (INDEXES.edition_versions.get(edition_id, 0), INDEXES.properties_version)
+    key = (validator.__name__, edition_id)
+    cached = VALIDATION_CACHE.get(key)
+    now = dt.datetime.now(timezone.utc)
+    if cached is not None and cached[0] == version and (cached[1] is None or now < cached[1]):
+        return cached[2]
+    # One slot per edition, so a newer version simply replaces the stale result
+    suggestions = INDEXES.filter_suggestions(edition_id=edition_id)
+    result = validator(suggestions)
+    VALIDATION_CACHE[key] = (version, _earliest_evidence_expiry(suggestions, now), result)
+    return result
+
+
+def _earliest_evidence_expiry(suggestions, now: dt.datetime):
+    """Soonest expires_at among evidence that is still valid at ``now``, or None if none expires."""
+    earliest = None
+    for suggestion in suggestions:
+        if not _has_valid_evidence(suggestion):
+            continue
+        expires_at = _EVIDENCE_CHECKS[suggestion["id"]][2]
+        if expires_at is not None and expires_at >= now and (earliest is None or expires_at < earliest):
+            earliest = expires_at
+    return earliest
+
+
+def _json(obj, status: int = 200) -> Response:
+    """jsonify replacement that serializes with orjson straight to bytes."""
+    return Response(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), status=status, mimetype='application/json')
+
+
+def _stream_json_array(items, chunk_size: int = 64 * 1024):
+    """Encode ``items`` one at a time into a JSON array, yielding ~chunk_size byte chunks."""
+    buffer = bytearray(b'[')
+    first = True
+    for item in items:
+        if not first:
+            buffer += b','
+        buffer += orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+        first = False
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b']'
+    yield bytes(buffer)
+
+
+def _json_stream(items) -> Response:
+    """Stream a list as a JSON array so the full encoded body is never held in memory."""
+    # Snapshot the references: the generator runs after the view returns, outside any lock
+    return Response(_stream_json_array(tuple(items)), mimetype='application/json', direct_passthrough=True)
+
+
+def _cached_json(key: str, ttl: float, builder, version: int | None = None,
+                 last_modified: float | None = None) -> Response:
+    """
+    Serve a JSON payload from the response cache, rebuilding it when expired.
+
+    Args:
+        key: Cache key (one per endpoint/query combination)
+        ttl: Seconds the serialized body may be reused for
+        builder: Zero-argument callable returning the JSON-serializable payload
+        version: Version the cached body is tied to (defaults to DATA_VERSION)
+        last_modified: Epoch seconds the underlying data last changed, sent as Last-Modified
+
+    Returns:
+        Response with an ETag; 304 Not Modified when If-None-Match/If-Modified-Since match
+    """
+    if version is None:
+        version = DATA_VERSION
+    cached = _RESPONSE_CACHE.get(key)
+    now = time.monotonic()
+    if cached and cached[1] == version and now - cached[0] < ttl:
+        _, _, etag, body = cached
+    else:
+        body = orjson.dumps(builder(), option=orjson.OPT_NON_STR_KEYS)
+        etag = hashlib.blake2b(body).hexdigest()[:16]
+        _RESPONSE_CACHE[key] = (now, version, etag, body)
+
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = dt.datetime.fromtimestamp(int(last_modified), tz=timezone.utc)
+    response.headers['Cache-Control'] = f'public, max-age={int(ttl)}'
+    return response.make_conditional(request)
+
+
+@_synchronized
 def _gen_id(key: str) -> int:
-    """Incremental id generator per table."""
+    """Incremental id generator per table; ids of removed records are never reused."""
+    next_id = _NEXT_IDS.get(key)
+    if next_id is None:
+        next_id = max((r["id"] for r in DATA.get(key, ())), default=0) + 1
+    _NEXT_IDS[key] = next_id + 1
+    return next_id
+
+
+def _ensure_data_loaded() -> None:
+    """Load DATA exactly once; concurrent callers wait for the first load."""
+    global _DATA_READY
+    if _DATA_READY:
+        return
+    with _DATA_LOAD_LOCK:
+        if not _DATA_READY:
+            _fetch_api_data()
+            _DATA_READY = True
+
 
-    return len(DATA[key]) + 1
+@app.before_request
+def _warmup() -> None:
+    # before_first_request was removed in Flask 2.3; after the first load this is a flag check
+    _ensure_data_loaded()
 
 
 def _fetch_api_data() -> None:
-    """Fetch data from the metadata curation API if available, otherwise use dummy data."""
+    """Fetch data from the metadata curation API if available, otherwise use dummy data.
+
+    The API calls run without DATA_LOCK; only installing their result holds it, so a
+    slow upstream never blocks requests (including the client's own calls back here).
+    """
     
     if DATA["sources"]:  # already populated
         return
     
-    if curation_client:
+    catalog = None
+    if curation_client and CURATION_API_SELF_REFERENCE:
+        # Nothing else serves the API in this mode; calling ourselves cannot help
+        logger.info("Curation API client points at this server, using dummy data...")
+    elif curation_client:
         try:
-            logger.info("Fetching data from Metadata Curation API...")
-            
-            # Fetch sources from API
-            api_sources = curation_client.get_sources()
-            DATA["sources"] = []
-            for source in api_sources:
-                DATA["sources"].append({
-                    "id": source.get("id"),
-                    "name": source.get("name", "Unknown Source"),
-                    "description": source.get("description", ""),
-                    "source_type": source.get("source_type", "unknown"),
-                    "is_dummy": False
-                })
-            
-            # Fetch properties from API
-            api_properties = curation_client.get_properties()
-            DATA["properties"] = []
-            for prop in api_properties:
-                # Normalize property type to uppercase for compatibility
-                prop_type = prop.get("type", "FREE_TEXT").upper()
-                
-                property_data = {
-                    "id": prop.get("id"),
-                    "technical_name": prop.get("technical_name", ""),
-                    "name": prop.get("name", "Unknown Property"),
-                    "type": prop_type,
-                    "is_required": prop.get("is_required", False),
-                    "property_options": prop.get("property_options", []),
-                    "is_dummy": False
-                }
-                DATA["properties"].append(property_data)
-            
-            # Fetch entities/editions from API
-            DATA["editions"] = []
-            try:
-                # FIXED: Call get_entities() only ONCE (it returns all entities from all sources)
-                entities = curation_client.get_entities()
-                
-                # Create source lookup for entity descriptions
-                source_lookup = {s["id"]: s["name"] for s in DATA["sources"]}
-                
-                for entity in entities:
-                    source_id = entity.get("source_id")
-                    source_name = source_lookup.get(source_id, "Unknown Source")
-                    
-                    DATA["editions"].append({
-                        "id": entity.get("id"),
-                        "source_id": source_id,
-                        "source_internal_id": entity.get("source_internal_id", ""),
-                        "entity_name": entity.get("name", entity.get("source_internal_id", f"Entity {entity.get('id')}")),
-                        "entity_description": f"Entity from {source_name}",
-                        "is_dummy": False,
-                        "context_ids": entity.get("context_ids", [])
-                    })
-            except Exception as e:
-                logger.error(f"Failed to fetch entities: {e}")
-            
-            # Initialize empty arrays for runtime data
-            DATA["suggestions"] = []
-            DATA["curation_history"] = []
-            DATA["evidence"] = []
-            DATA["publishing_state"] = []
-            
-            logger.info(f"API data loaded - Sources: {len(DATA['sources'])}, Properties: {len(DATA['properties'])}, Editions: {len(DATA['editions'])}")
-
-            # Always append the dummy source as an additional catalog for demo/testing
-            try:
-                _append_dummy_catalog()
-                logger.info(
-                    f"Dummy catalog appended - Total Sources: {len(DATA['sources'])}, Properties: {len(DATA['properties'])}, Editions: {len(DATA['editions'])}"
-                )
-            except Exception as e:
-                logger.error(f"Failed to append dummy catalog: {e}")
-            
+            catalog = _fetch_api_catalog()
         except Exception as e:
             logger.error(f"Failed to fetch data from API: {e}")
             logger.info("Falling back to dummy data...")
-            _initialize_dummy_data()
     else:
         logger.info("No API client available, using dummy data...")
-        _initialize_dummy_data()
 
+    with DATA_LOCK:
+        if DATA["sources"]:  # populated while we were fetching
+            return
+        if catalog is None:
+            _initialize_dummy_data()
+            return
+        try:
+            _install_api_catalog(*catalog)
+        except Exception as e:
+            logger.error(f"Failed to load data from API: {e}")
+            logger.info("Falling back to dummy data...")
+            _initialize_dummy_data()
+
+
+def _fetch_api_catalog() -> tuple:
+    """Sources, properties and entities from the curation API; entities default to []."""
+    logger.info("Fetching data from Metadata Curation API...")
+    api_sources = cached_call(curation_client, 'get_sources')
+    api_properties = cached_call(curation_client, 'get_properties')
+    try:
+        # FIXED: Call get_entities() only ONCE (it returns all entities from all sources)
+        entities = cached_call(curation_client, 'get_entities')
+    except Exception as e:
+        logger.error(f"Failed to fetch entities: {e}")
+        entities = []
+    return api_sources, api_properties, entities
+
+
+@_synchronized
+def _install_api_catalog(api_sources: list, api_properties: list, entities: list) -> None:
+    """Replace DATA with the fetched API catalog plus the dummy catalog."""
+    DATA["sources"] = []
+    for source in api_sources:
+        DATA["sources"].append(Source(
+            id=source.get("id"),
+            name=source.get("name", "Unknown Source"),
+            description=source.get("description", ""),
+            source_type=source.get("source_type", "unknown"),
+            is_dummy=False
+        ))
+    
+    DATA["properties"] = []
+    for prop in api_properties:
+        # Normalize property type once so later checks are enum set lookups
+        prop_type = _normalize_property_type(prop.get("type", "FREE_TEXT"))
+        
+        property_data = {
+            "id": prop.get("id"),
+            "technical_name": prop.get("technical_name", ""),
+            "name": prop.get("name", "Unknown Property"),
+            "type": prop_type,
+            "is_required": prop.get("is_required", False),
+            "property_options": prop.get("property_options", []),
+            "is_dummy": False
+        }
+        DATA["properties"].append(property_data)
+    
+    DATA["editions"] = []
+    try:
+        # Create source lookup for entity descriptions
+        source_lookup = {s.id: s.name for s in DATA["sources"]}
+        
+        for entity in entities:
+            source_id = entity.get("source_id")
+            source_name = source_lookup.get(source_id, "Unknown Source")
+            
+            DATA["editions"].append(Edition(
+                id=entity.get("id"),
+                source_id=source_id,
+                source_internal_id=entity.get("source_internal_id", ""),
+                entity_name=entity.get("name", entity.get("source_internal_id", f"Entity {entity.get('id')}")),
+                entity_description=f"Entity from {source_name}",
+                is_dummy=False,
+                context_ids=entity.get("context_ids", [])
+            ))
+    except Exception as e:
+        logger.error(f"Failed to load entities: {e}")
+    
+    # Initialize empty arrays for runtime data
+    DATA["suggestions"] = []
+    DATA["curation_history"] = []
+    DATA["evidence"] = []
+    DATA["publishing_state"] = []
+    INDEXES.rebuild(DATA)
+    _bump_data_version()
+    
+    logger.info(f"API data loaded - Sources: {len(DATA['sources'])}, Properties: {len(DATA['properties'])}, Editions: {len(DATA['editions'])}")
+
+    # Always append the dummy source as an additional catalog for demo/testing
+    try:
+        _append_dummy_catalog()
+        logger.info(
+            f"Dummy catalog appended - Total Sources: {len(DATA['sources'])}, Properties: {len(DATA['properties'])}, Editions: {len(DATA['editions'])}"
+        )
+    except Exception as e:
+        logger.error(f"Failed to append dummy catalog: {e}")
+
+@_synchronized
 def _initialize_dummy_data() -> None:
     """Populate store with deterministic demo data so the front-end has something to fetch
     even before the real extractor runs.
@@ -224,22 +770,29 @@ def _initialize_dummy_data() -> None:
         return
 
     # 1) Load dummy sources with clear identification
-    DATA["sources"] = get_dummy_sources()
+    DATA["sources"] = [Source.from_dict(s) for s in get_dummy_sources()]
     
-    # 2) Load dummy properties
-    DATA["properties"] = get_dummy_properties()
+    # 2) Load dummy properties (thawed: the dummy_data copies are shared and read-only)
+    DATA["properties"] = [
+        {**thaw(p), "type": _normalize_property_type(p.get("type"))} for p in get_dummy_properties()
+    ]
     
     # 3) Load dummy editions with multiple entities per source
-    DATA["editions"] = get_dummy_editions()
+    DATA["editions"] = [Edition.from_dict(e) for e in get_dummy_editions()]
     
     # 4) NO automatic dummy suggestions - they should be created only when needed
     # DATA["suggestions"] starts empty - suggestions are generated on-demand
+    INDEXES.index_editions(DATA["editions"])
+    INDEXES.index_properties(DATA["properties"])
+    INDEXES.index_sources(DATA["sources"])
+    _bump_data_version()
 
 
 def _next_id(values: list[int]) -> int:
     return (max(values) + 1) if values else 1
 
 
+@_synchronized
 def _append_dummy_catalog() -> None:
     """Append the dummy source/properties/editions alongside API data.
     Ensures IDs do not collide and tags dummy properties with their source.
@@ -250,26 +803,24 @@ def _append_dummy_catalog() -> None:
     dummy_editions = get_dummy_editions()
 
     # Compute safe ID bases to avoid collision with API data
-    existing_source_ids = [s["id"] for s in DATA["sources"]]
-    existing_property_ids = [p["id"] for p in DATA["properties"]]
-    existing_edition_ids = [e["id"] for e in DATA["editions"]]
-
-    base_source_id = (max(existing_source_ids) + 1000) if existing_source_ids else 1000
-    base_property_id = (max(existing_property_ids) + 1000) if existing_property_ids else 1000
-    base_edition_id = (max(existing_edition_ids) + 1000) if existing_edition_ids else 1000
+    # The id indexes are current here: every loader re-indexes after filling DATA
+    base_source_id = max(INDEXES.sources_by_id, default=0) + 1000
+    base_property_id = max(INDEXES.properties_by_id, default=0) + 1000
+    base_edition_id = max(INDEXES.editions_by_id, default=0) + 1000
 
     # Remap and append sources
     source_id_map: dict[int, int] = {}
     for i, src in enumerate(dummy_sources):
         new_id = base_source_id + i
         source_id_map[src["id"]] = new_id
-        DATA["sources"].append({**src, "id": new_id, "is_dummy": True})
+        DATA["sources"].append(Source.from_dict({**src, "id": new_id, "is_dummy": True}))
 
     # Remap and append properties, tagging with source_id of first dummy source
     dummy_source_target_id = next(iter(source_id_map.values()), None)
     for i, prop in enumerate(dummy_properties):
-        new_prop = {**prop}
+        new_prop = thaw(prop)
         new_prop["id"] = base_property_id + i
+        new_prop["type"] = _normalize_property_type(prop.get("type"))
         # Tag properties to dummy source so the frontend can request per-source
         new_prop["source_id"] = dummy_source_target_id
         new_prop["is_dummy"] = True
@@ -281,7 +832,12 @@ def _append_dummy_catalog() -> None:
         new_ed["id"] = base_edition_id + i
         old_src_id = ed.get("source_id")
         new_ed["source_id"] = source_id_map.get(old_src_id, dummy_source_target_id)
-        DATA["editions"].append(new_ed)
+        DATA["editions"].append(Edition.from_dict(new_ed))
+
+    INDEXES.index_editions(DATA["editions"])
+    INDEXES.index_properties(DATA["properties"])
+    INDEXES.index_sources(DATA["sources"])
+    _bump_data_version()
 
 
 # --------------------------------------------------------------------------------------
@@ -292,32 +848,36 @@ def _append_dummy_catalog() -> None:
 @app.route("/api/sources", methods=["GET"])
 def sources_collection():
     logger.info("Listing all sources")
+    return _cached_json("sources", SOURCES_CACHE_TTL, _build_sources_payload)
+
+
+def _build_sources_payload() -> list:
     # Return sources with their editions and suggestion counts
     sources_with_details = []
     for source in DATA["sources"]:
-        source_editions = [e for e in DATA["editions"] if e["source_id"] == source["id"]]
+        source_editions = INDEXES.editions_by_source.get(source.id, [])
         
         # Group editions by entity for better organization
         entities = {}
         for edition in source_editions:
-            entity_name = edition.get("entity_name", "Unknown Entity")
+            entity_name = edition.entity_name or "Unknown Entity"
             if entity_name not in entities:
                 entities[entity_name] = {
                     "name": entity_name,
-                    "description": edition.get("entity_description", ""),
+                    "description": edition.entity_description,
                     "editions": []
                 }
             entities[entity_name]["editions"].append(edition)
         
         sources_with_details.append({
-            **source,
+            **source.to_dict(),
             "editions_count": len(source_editions),
             "suggestions_count": 0,  # Start with 0 - suggestions are generated on-demand
             "editions": source_editions,
             "entities": list(entities.values())
         })
 
-    return jsonify(sources_with_details)
+    return sources_with_details
 
 # --------------------------------------------------------------------------
 #   GET collections helpers
@@ -327,13 +887,17 @@ def sources_collection():
 @app.route("/api/editions", methods=["GET"])
 def list_editions():
     source_id = request.args.get("source_id", type=int)
-    
+
     if source_id:
         # Filter editions by source
-        filtered_editions = [e for e in DATA["editions"] if e["source_id"] == source_id]
-        return jsonify(filtered_editions)
-    
-    return jsonify(DATA["editions"])
+        builder = lambda: INDEXES.editions_by_source.get(source_id, [])
+    else:
+        builder = lambda: DATA["editions"]
+
+    return _cached_json(
+        f"editions:{source_id or ''}", CATALOG_CACHE_TTL, builder,
+        version=INDEXES.editions_version, last_modified=INDEXES.editions_modified_at
+    )
 
 
 @app.route("/api/suggestions", methods=["GET"])
@@ -342,36 +906,41 @@ def list_suggestions():
     edition_id = request.args.get("edition_id", type=int)
 
     # Basic filtering if params provided
-    items = DATA["suggestions"]
-    if source_id:
-        items = [s for s in items if s["source_id"] == source_id]
-    if edition_id:
-        items = [s for s in items if s["edition_id"] == edition_id]
-    return jsonify(items)
+    if source_id or edition_id:
+        return _json_stream(INDEXES.filter_suggestions(source_id, edition_id))
+    return _json_stream(DATA["suggestions"])
 
 
 @app.route("/api/properties", methods=["GET"])
 def properties_collection():
     logger.info("Listing all properties")
     source_id = request.args.get("source_id", type=int)
+    # Cache per partition, so e.g. every dummy source shares one serialized body
+    key, properties = _properties_partition(source_id)
+    return _cached_json(
+        f"properties:{key}", CATALOG_CACHE_TTL, lambda: properties,
+        version=INDEXES.properties_version,
+        last_modified=INDEXES.properties_modified_at
+    )
+
+
+def _properties_partition(source_id: int | None) -> tuple[str, list]:
+    """Return ``(cache_key, properties)`` for the catalog slice a request selects."""
     if source_id:
         # 1) Prefer explicit source-scoped properties if present
-        scoped = [p for p in DATA["properties"] if p.get("source_id") == source_id]
+        scoped = INDEXES.properties_by_source.get(source_id)
         if scoped:
-            return jsonify(scoped)
+            return f"source:{source_id}", scoped
 
         # 2) Otherwise, separate by dummy vs non-dummy to avoid leaking between catalogs
-        src = next((s for s in DATA["sources"] if s["id"] == source_id), None)
-        if src:
-            if src.get("is_dummy", False):
-                return jsonify([p for p in DATA["properties"] if p.get("is_dummy", False) is True])
-            else:
-                return jsonify([p for p in DATA["properties"] if p.get("is_dummy", False) is False])
+        is_dummy = INDEXES.source_is_dummy.get(source_id)
+        if is_dummy is not None:
+            return ("dummy", INDEXES.dummy_properties) if is_dummy else ("real", INDEXES.real_properties)
 
         # 3) If source not found, return empty set
-        return jsonify([])
+        return "none", []
 
-    return jsonify(DATA["properties"])
+    return "all", DATA["properties"]
 
 
 
@@ -387,17 +956,17 @@ def generate_ai_suggestions():
     """Generate AI-powered metadata suggestions from HTML content."""
 
     if not ai_service:
-        return jsonify({"error": "AI service not available. Please set OPENAI_API_KEY."}), 503
+        return _json({"error": "AI service not available. Please set OPENAI_API_KEY."}, 503)
 
     if not request.is_json:
-        return jsonify({"error": "Content-Type must be application/json"}), 400
+        return _json({"error": "Content-Type must be application/json"}, 400)
 
     payload = request.get_json(force=True)
     html_content = payload.get('html_content')
     url = payload.get('url')
 
     if not html_content or not url:
-        return jsonify({"error": "html_content and url are required"}), 400
+        return _json({"error": "html_content and url are required"}, 400)
 
     try:
         logger.info(f"Generating AI suggestions for URL: {url}")
@@ -405,26 +974,39 @@ def generate_ai_suggestions():
         # Get existing properties for context
         properties = DATA["properties"]
 
-        # Generate AI suggestions
-        ai_suggestions = ai_service.generate_metadata_suggestions(
-            html_content, url, properties
-        )
-
-        # Validate and format suggestions
-        validated_suggestions = ai_service.validate_suggestions(
-            ai_suggestions, properties
-        )
+        # Identical page + property catalog -> identical validated suggestions
+        cache_key = hashlib.sha256(
+            html_content.encode('utf-8') + b'|' + url.encode('utf-8') + b'|' + INDEXES.properties_signature
+        ).hexdigest()
+        cached = AI_SUGGESTION_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached AI suggestions for URL: {url}")
+            # Decode a fresh copy: the records below are mutated and stored in DATA
+            validated_suggestions = orjson.loads(cached)
+        else:
+            # Generate AI suggestions
+            ai_suggestions = ai_service.generate_metadata_suggestions(
+                html_content, url, properties
+            )
+
+            # Validate and format suggestions
+            validated_suggestions = ai_service.validate_suggestions(
+                ai_suggestions, properties
+            )
+            if validated_suggestions:
+                AI_SUGGESTION_CACHE.set(cache_key, orjson.dumps(validated_suggestions, option=orjson.OPT_NON_STR_KEYS))
 
         # Add to our data store (for demo purposes)
-        for suggestion in validated_suggestions:
-            suggestion['id'] = _gen_id("suggestions")
-            suggestion['source_id'] = 1  # Default to first source
-            suggestion['edition_id'] = 1  # Default to first edition
-            DATA["suggestions"].append(suggestion)
+        with DATA_LOCK:
+            for suggestion in validated_suggestions:
+                suggestion['id'] = _gen_id("suggestions")
+                suggestion['source_id'] = 1  # Default to first source
+                suggestion['edition_id'] = 1  # Default to first edition
+                _add_suggestion(suggestion)
 
         logger.info(f"Generated and stored {len(validated_suggestions)} AI suggestions")
 
-        return jsonify({
+        return _json({
             "success": True,
             "suggestions": validated_suggestions,
             "total_generated": len(validated_suggestions)
@@ -432,7 +1014,7 @@ def generate_ai_suggestions():
 
     except Exception as e:
         logger.error(f"Error generating AI suggestions: {str(e)}")
-        return jsonify({"error": f"Failed to generate suggestions: {str(e)}"}), 500
+        return _json({"error": f"Failed to generate suggestions: {str(e)}"}, 500)
 
 
 @app.route("/api/suggestions/<int:suggestion_id>/curate", methods=["POST"])
@@ -447,44 +1029,121 @@ def curate_suggestion(suggestion_id: int):
     """
     
     if not request.is_json:
-        return jsonify({"error": "Content-Type must be application/json"}), 400
+        return _json({"error": "Content-Type must be application/json"}, 400)
+    
+    payload = request.get_json(force=True)
+    with DATA_LOCK:
+        body, status = _curate_one(suggestion_id, payload)
+    
+    if status == 200:
+        # Log the curation action
+        logger.info(f"Suggestion {suggestion_id} {payload.get('action')}ed by user {payload.get('user_id', 'anonymous')} with evidence validation")
+    
+    return _json(body, status)
+
+
+@app.route("/api/suggestions/batch-curate", methods=["POST"])
+def batch_curate_suggestions():
+    """
+    Apply several curation actions in one request.
+    
+    Body is either a list of ``{suggestion_id, action, new_value, note}`` items or
+    ``{"items": [...], "user_id": ...}``; a top-level user_id applies to items that
+    don't set their own. Every item goes through the same checks as the single
+    curate endpoint and a failing item does not stop the rest.
+    """
+    
+    if not request.is_json:
+        return _json({"error": "Content-Type must be application/json"}, 400)
     
     payload = request.get_json(force=True)
+    if isinstance(payload, dict):
+        items = payload.get('items')
+        default_user_id = payload.get('user_id', 'anonymous')
+    else:
+        items = payload
+        default_user_id = 'anonymous'
+    if not isinstance(items, list):
+        return _json({"error": "Expected a list of curation items"}, 400)
+    
+    results = []
+    with DATA_LOCK:
+        for item in items:
+            if not isinstance(item, dict):
+                results.append({"id": None, "status": "error", "error": "Item must be an object"})
+                continue
+            suggestion_id = item.get('suggestion_id')
+            body, status = _curate_one(suggestion_id, {'user_id': default_user_id, **item})
+            if status == 200:
+                results.append({"id": suggestion_id, "status": body["suggestion"]["status"]})
+            else:
+                results.append({"id": suggestion_id, "status": "error", "error": body["error"]})
+    
+    succeeded = sum(1 for r in results if r["status"] != "error")
+    logger.info(f"Batch curation: {succeeded}/{len(results)} suggestions curated")
+    
+    return _json({
+        "success": succeeded == len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results
+    })
+
+
+def _curate_one(suggestion_id: int, payload: dict) -> tuple[dict, int]:
+    """
+    Apply one curation action; caller must hold DATA_LOCK.
+    
+    Args:
+        suggestion_id: Suggestion to curate
+        payload: Request body with action, note/curator_note, user_id and optional new_value
+        
+    Returns:
+        tuple: (response body, HTTP status)
+    """
     action = payload.get('action')  # 'accept', 'reject', 'edit'
     user_note = payload.get('note', '') or payload.get('curator_note', '')
     user_id = payload.get('user_id', 'anonymous')  # In production, this would come from auth
     
     if action not in ['accept', 'reject', 'edit']:
-        return jsonify({"error": "Action must be 'accept', 'reject', or 'edit'"}), 400
+        return {"error": "Action must be 'accept', 'reject', or 'edit'"}, 400
     
     # Find the suggestion
-    suggestion = next((s for s in DATA["suggestions"] if s["id"] == suggestion_id), None)
+    suggestion = INDEXES.suggestions_by_id.get(suggestion_id)
     if not suggestion:
-        return jsonify({"error": "Suggestion not found"}), 404
+        return {"error": "Suggestion not found"}, 404
     
     # CRITICAL BUSINESS LOGIC: Validate evidence before allowing curation
     if not _has_valid_evidence(suggestion):
-        return jsonify({
+        return {
             "error": "Cannot curate suggestion without valid evidence",
             "details": "All suggestions must have evidence attached before they can be accepted, rejected, or edited",
             "suggestion_id": suggestion_id,
             "evidence_status": _get_evidence_status(suggestion)
-        }), 400
+        }, 400
+    
+    # Validate an edited value up front so a rejected edit leaves the suggestion untouched
+    new_value = payload.get('new_value') if action == "edit" else None
+    if new_value is not None:
+        validation_result = _validate_suggestion_value(suggestion, new_value)
+        if not validation_result["valid"]:
+            return {
+                "error": "Invalid value for property type",
+                "details": validation_result["error"]
+            }, 400
     
     # Create comprehensive curation history entry
-    import datetime as dt
-    from datetime import timezone
-    current_time = dt.datetime.now(timezone.utc)
+    now_iso = dt.datetime.now(timezone.utc).isoformat()
     
     history_entry = {
         "id": _gen_id("curation_history"),
         "suggestion_id": suggestion_id,
         "action": action,
-        "timestamp": current_time.isoformat(),
+        "timestamp": now_iso,
         "user_note": user_note,
         "user_id": user_id,
         "model_version": suggestion.get('model_version', 'unknown'),
-        "previous_value": suggestion.copy(),
+        "previous_value": _snapshot(suggestion),
         "evidence_references": _get_evidence_references(suggestion)
     }
     
@@ -495,45 +1154,46 @@ def curate_suggestion(suggestion_id: int):
         "edit": "edited"
     }
     suggestion["status"] = status_map.get(action, suggestion.get("status", "pending"))
-    suggestion["curated_at"] = current_time.isoformat()
+    suggestion["curated_at"] = now_iso
     suggestion["curator_note"] = user_note
     suggestion["curated_by"] = user_id
     
-    # If editing, update the value with validation
-    if action == "edit":
-        new_value = payload.get('new_value')
-        if new_value is not None:
-            # Validate the new value based on property type
-            validation_result = _validate_suggestion_value(suggestion, new_value)
-            if not validation_result["valid"]:
-                return jsonify({
-                    "error": "Invalid value for property type",
-                    "details": validation_result["error"]
-                }), 400
-            
-            # Update the appropriate field based on property type
-            property_def = next((p for p in DATA["properties"] if p["id"] == suggestion["property_id"]), None)
-            if property_def:
-                if property_def["type"] in ["MULTIPLE_CHOICE", "SINGLE_CHOICE", "BINARY"]:
-                    suggestion['property_option_id'] = new_value
-                    suggestion['custom_value'] = None
-                else:
-                    suggestion['custom_value'] = new_value
-                    suggestion['property_option_id'] = None
+    # If editing, update the appropriate field based on property type
+    if new_value is not None:
+        property_def = INDEXES.properties_by_id.get(suggestion["property_id"])
+        if property_def:
+            if property_def["type"] in _CHOICE_TYPES:
+                suggestion['property_option_id'] = new_value
+                suggestion['custom_value'] = None
+            else:
+                suggestion['custom_value'] = new_value
+                suggestion['property_option_id'] = None
     
     # Store the history entry
-    DATA["curation_history"].append(history_entry)
+    _add_history(history_entry)
     
-    # Log the curation action
-    logger.info(f"Suggestion {suggestion_id} {action}ed by user {user_id} with evidence validation")
-    
-    return jsonify({
+    return {
         "success": True,
         "suggestion": suggestion,
         "history_entry": history_entry,
         "evidence_validated": True,
         "curation_allowed": True
-    })
+    }, 200
+
+
+# Suggestion fields that curation, edits and reverts change; history keeps only these
+_MUTABLE_FIELDS = (
+    "status", "curated_at", "curator_note", "curated_by", "property_option_id",
+    "custom_value", "ai_generated", "reverted_at", "reverted_by", "revert_note"
+)
+
+# The subset of _MUTABLE_FIELDS that PUT /api/suggestions/<id>/edit can change
+_EDIT_FIELDS = ("status", "curator_note", "property_option_id", "custom_value", "ai_generated")
+
+
+def _snapshot(suggestion: dict, fields: tuple = _MUTABLE_FIELDS) -> dict:
+    """Capture the given (by default all mutable) fields of a suggestion for its history entry."""
+    return {k: suggestion[k] for k in fields if k in suggestion}
 
 
 def _has_valid_evidence(suggestion: dict) -> bool:
@@ -558,31 +1218,61 @@ def _has_valid_evidence(suggestion: dict) -> bool:
     
     evidence = suggestion['evidence']
     
+    # Static checks are memoized per suggestion; the fingerprint changes whenever the
+    # evidence dict is replaced or any field the checks read is edited
+    fingerprint = (
+        id(evidence), evidence.get('content'), evidence.get('source_url'),
+        evidence.get('confidence'), evidence.get('expires_at')
+    )
+    cached = _EVIDENCE_CHECKS.get(suggestion.get('id'))
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, *_check_evidence(evidence))
+        _EVIDENCE_CHECKS[suggestion.get('id')] = cached
+    _, valid, expires_at = cached
+    
+    # Evidence must not be expired (if it has an expiration)
+    if valid and expires_at is not None:
+        return expires_at >= dt.datetime.now(timezone.utc)
+    
+    return valid
+
+
+# suggestion id -> (evidence fingerprint, passes static checks, parsed expires_at)
+_EVIDENCE_CHECKS: dict = {}
+
+
+def _check_evidence(evidence: dict) -> tuple:
+    """
+    Time-independent part of _has_valid_evidence.
+    
+    Returns:
+        tuple: (valid, expires_at) where expires_at is a tz-aware datetime or None
+    """
     # Evidence must have content
     if not evidence.get('content') or not evidence['content'].strip():
-        return False
+        return False, None
     
     # Evidence must have a source URL
     if not evidence.get('source_url') or not evidence['source_url'].strip():
-        return False
+        return False, None
     
     # Evidence must have reasonable confidence (above 0.1)
     if evidence.get('confidence', 0) < 0.1:
-        return False
+        return False, None
     
-    # Evidence must not be expired (if it has an expiration)
+    expires_at = None
     if evidence.get('expires_at'):
-        import datetime as dt
-        from datetime import timezone
+        # If we can't parse the date, assume it's valid
         try:
-            expires_at = dt.datetime.fromisoformat(evidence['expires_at'].replace('Z', '+00:00'))
-            if expires_at < dt.datetime.now(timezone.utc):
-                return False
-        except (ValueError, TypeError):
-            # If we can't parse the date, assume it's valid
-            pass
+            expires_at = _parse_timestamp(evidence['expires_at'])
+        except TypeError:
+            # Unhashable value, not a timestamp string
+            expires_at = None
+        # Naive timestamps can't be compared with the aware current time; treat as valid
+        if expires_at is not None and expires_at.tzinfo is None:
+            expires_at = None
     
-    return True
+    return True, expires_at
 
 
 def _get_evidence_status(suggestion: dict) -> dict:
@@ -640,41 +1330,62 @@ def _validate_suggestion_value(suggestion: dict, new_value) -> dict:
     Returns:
         dict: Validation result with 'valid' boolean and optional 'error' message
     """
-    property_def = next((p for p in DATA["properties"] if p["id"] == suggestion["property_id"]), None)
+    property_def = INDEXES.properties_by_id.get(suggestion["property_id"])
     if not property_def:
         return {"valid": False, "error": "Property definition not found"}
     
     # Validate based on property type
-    if property_def["type"] in ["MULTIPLE_CHOICE", "SINGLE_CHOICE", "BINARY"]:
-        # Must be a valid option ID
-        if not isinstance(new_value, int):
-            return {"valid": False, "error": f"Value must be an integer option ID for {property_def['type']} properties"}
-        
-        valid_options = [opt["id"] for opt in property_def.get("property_options", [])]
-        if new_value not in valid_options:
-            return {"valid": False, "error": f"Invalid option ID. Must be one of: {valid_options}"}
-    
-    elif property_def["type"] == "NUMERICAL":
-        # Must be a number
-        try:
-            float(new_value)
-        except (ValueError, TypeError):
-            return {"valid": False, "error": "Value must be a number for numerical properties"}
-    
-    elif property_def["type"] == "FREE_TEXT":
-        # Must be a string
-        if not isinstance(new_value, str) or not new_value.strip():
-            return {"valid": False, "error": "Value must be a non-empty string for free text properties"}
+    check = _VALUE_CHECKS.get(property_def["type"])
+    error = check(property_def, new_value) if check else None
+    if error:
+        return {"valid": False, "error": error}
     
     return {"valid": True}
 
 
+def _check_choice_value(property_def: dict, value) -> str | None:
+    # Must be a valid option ID
+    if not isinstance(value, int):
+        return f"Value must be an integer option ID for {property_def['type']} properties"
+    valid_options = INDEXES.option_ids_by_property.get(property_def["id"], frozenset())
+    if value not in valid_options:
+        return f"Invalid option ID. Must be one of: {sorted(valid_options)}"
+    return None
+
+
+def _check_numerical_value(property_def: dict, value) -> str | None:
+    # Must be a number
+    try:
+        float(value)
+    except (ValueError, TypeError):
+        return "Value must be a number for numerical properties"
+    return None
+
+
+def _check_free_text_value(property_def: dict, value) -> str | None:
+    # Must be a string
+    if not isinstance(value, str) or not value.strip():
+        return "Value must be a non-empty string for free text properties"
+    return None
+
+
+# PropertyType -> check returning an error message, or None when the value is valid
+_VALUE_CHECKS = {
+    PropertyType.MULTIPLE_CHOICE: _check_choice_value,
+    PropertyType.SINGLE_CHOICE: _check_choice_value,
+    PropertyType.BINARY: _check_choice_value,
+    PropertyType.NUMERICAL: _check_numerical_value,
+    PropertyType.FREE_TEXT: _check_free_text_value,
+}
+
+
 @app.route("/api/suggestions/<int:suggestion_id>/history", methods=["GET"])
 def get_suggestion_history(suggestion_id: int):
     return jsonify({"error": "History disabled in demo teardown"}), 404
 
 
 @app.route("/api/suggestions/<int:suggestion_id>/revert", methods=["POST"])
+@_synchronized
 def revert_suggestion(suggestion_id: int):
     """
     Revert a suggestion to a previous state from its history.
@@ -687,7 +1398,7 @@ def revert_suggestion(suggestion_id: int):
     """
     
     if not request.is_json:
-        return jsonify({"error": "Content-Type must be application/json"}), 400
+        return _json({"error": "Content-Type must be application/json"}, 400)
     
     payload = request.get_json(force=True)
     target_history_id = payload.get('history_id')
@@ -695,41 +1406,39 @@ def revert_suggestion(suggestion_id: int):
     user_id = payload.get('user_id', 'anonymous')
     
     if not target_history_id:
-        return jsonify({"error": "history_id is required to specify which state to revert to"}), 400
+        return _json({"error": "history_id is required to specify which state to revert to"}, 400)
     
     # Find the suggestion
-    suggestion = next((s for s in DATA["suggestions"] if s["id"] == suggestion_id), None)
+    suggestion = INDEXES.suggestions_by_id.get(suggestion_id)
     if not suggestion:
-        return jsonify({"error": "Suggestion not found"}), 404
+        return _json({"error": "Suggestion not found"}, 404)
     
     # Find the target history entry
-    target_history = next((h for h in DATA["curation_history"] if h["id"] == target_history_id), None)
+    target_history = INDEXES.history_by_id.get(target_history_id)
     if not target_history:
-        return jsonify({"error": "History entry not found"}), 404
+        return _json({"error": "History entry not found"}, 404)
     
     # Validate that the target history belongs to this suggestion
     if target_history["suggestion_id"] != suggestion_id:
-        return jsonify({"error": "History entry does not belong to this suggestion"}), 400
+        return _json({"error": "History entry does not belong to this suggestion"}, 400)
     
     # Get the previous value from the target history
     previous_value = target_history.get("previous_value", {})
     if not previous_value:
-        return jsonify({"error": "No previous value found in target history entry"}), 400
+        return _json({"error": "No previous value found in target history entry"}, 400)
     
     # Create a revert history entry
-    import datetime as dt
-    from datetime import timezone
-    current_time = dt.datetime.now(timezone.utc)
+    now_iso = dt.datetime.now(timezone.utc).isoformat()
     
     revert_history_entry = {
         "id": _gen_id("curation_history"),
         "suggestion_id": suggestion_id,
         "action": "revert",
-        "timestamp": current_time.isoformat(),
+        "timestamp": now_iso,
         "user_note": user_note,
         "user_id": user_id,
         "model_version": suggestion.get('model_version', 'unknown'),
-        "previous_value": suggestion.copy(),
+        "previous_value": _snapshot(suggestion),
         "reverted_to_history_id": target_history_id,
         "reverted_to_timestamp": target_history.get("timestamp"),
         "evidence_references": _get_evidence_references(suggestion)
@@ -738,17 +1447,17 @@ def revert_suggestion(suggestion_id: int):
     # Revert the suggestion to the previous state
     suggestion.update(previous_value)
     suggestion["status"] = "reverted"
-    suggestion["reverted_at"] = current_time.isoformat()
+    suggestion["reverted_at"] = now_iso
     suggestion["reverted_by"] = user_id
     suggestion["revert_note"] = user_note
     
     # Store the revert history entry
-    DATA["curation_history"].append(revert_history_entry)
+    _add_history(revert_history_entry)
     
     # Log the revert action
     logger.info(f"Suggestion {suggestion_id} reverted by user {user_id} to history entry {target_history_id}")
     
-    return jsonify({
+    return _json({
         "success": True,
         "suggestion": suggestion,
         "revert_history_entry": revert_history_entry,
@@ -757,37 +1466,48 @@ def revert_suggestion(suggestion_id: int):
     })
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp_str: str):
+    """
+    Parse an ISO-8601 timestamp (``Z`` suffix allowed), memoized per string.
+    
+    History and evidence timestamps are immutable once written, so the same
+    strings are parsed over and over by revert/publishing checks.
+    
+    Returns:
+        datetime or None if the string can't be parsed
+    """
+    try:
+        if timestamp_str.endswith('Z'):
+            timestamp_str = timestamp_str[:-1] + '+00:00'
+        return dt.datetime.fromisoformat(timestamp_str)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
 def _format_timestamp(timestamp_str: str) -> str:
     """Format timestamp for display purposes."""
     if not timestamp_str:
         return "Unknown"
     
-    try:
-        import datetime as dt
-        from datetime import timezone
-        
-        # Parse the timestamp
-        if 'Z' in timestamp_str:
-            timestamp_str = timestamp_str.replace('Z', '+00:00')
-        
-        dt_obj = dt.datetime.fromisoformat(timestamp_str)
-        
-        # Format for display
-        return dt_obj.strftime("%Y-%m-%d %H:%M:%S UTC")
-    except (ValueError, TypeError):
+    dt_obj = _parse_timestamp(timestamp_str)
+    if dt_obj is None:
         return timestamp_str
+    
+    # Format for display
+    return dt_obj.strftime("%Y-%m-%d %H:%M:%S UTC")
 
 
 @app.route("/api/sources/<int:source_id>/ingestion_complete", methods=["POST"])
+@_synchronized
 def ingestion_complete(source_id: int):
     # In this mock implementation we just record a timestamp.
-    import datetime as _dt
-    from datetime import timezone
-    for src in DATA["sources"]:
-        if src["id"] == source_id:
-            src["last_ingested_at"] = _dt.datetime.now(timezone.utc).isoformat()
-            return jsonify({"success": True, "source_id": source_id})
-    return jsonify({"error": "Source not found"}), 404
+    src = INDEXES.sources_by_id.get(source_id)
+    if src is None:
+        return jsonify({"error": "Source not found"}), 404
+    src.last_ingested_at = dt.datetime.now(timezone.utc).isoformat()
+    _bump_data_version()
+    return jsonify({"success": True, "source_id": source_id})
 
 # --------------------------------------------------------------------------------------
 # Existing preview endpoints (unchanged)
@@ -826,6 +1546,166 @@ def health_check():
 
 # Test endpoint removed - new endpoints are working correctly
 
+def _confidence_stats(outputs: list) -> tuple[float, float, float, int, int]:
+    """Mean, min, max, count >= 0.8 and count < 0.5 of the outputs' confidences, in one pass."""
+    total = 0.0
+    lowest = highest = float(outputs[0].get('confidence', 0.0))
+    high = low = 0
+    for item in outputs:
+        c = float(item.get('confidence', 0.0))
+        total += c
+        if c < lowest:
+            lowest = c
+        elif c > highest:
+            highest = c
+        if c >= 0.8:
+            high += 1
+        elif c < 0.5:
+            low += 1
+    return total / len(outputs), lowest, highest, high, low
+
+
+def _generate_page_suggestions(page: dict, properties: list, confidence_mode: str,
+                               source_id: int, edition_id: int) -> list[dict]:
+    """
+    Run the AI service over one scraped page.
+
+    Only reads shared state, so pages can be processed on worker threads.
+
+    Returns:
+        Suggestion records without ids; the caller assigns ids and stores them
+    """
+    records = []
+    page_url = page.get('url')
+    page_title = page.get('title')
+    logger.debug("Processing page: %s", page_url)
+    logger.debug("Page text content length: %d", len(page.get('text_content', '')))
+
+    if confidence_mode == 'two_pass' and hasattr(ai_service, 'generate_reasoned_suggestions'):
+        logger.info("🤖 Starting two-pass AI confidence system")
+        # Agent A: get reasoned suggestions without confidence
+        reasoned = ai_service.generate_reasoned_suggestions(
+            page.get('text_content', ''),
+            page.get('url', ''),
+            properties
+        )
+        logger.info(f"🧠 Agent A (Reasoner) generated {len(reasoned)} reasoned suggestions")
+
+        # Validate shape for value/evidence (ignore confidence)
+        # Reuse validator by temporarily injecting confidence=0.0 to pass schema where needed
+        prepared_for_validation = []
+        for rs in reasoned:
+            rs_copy = dict(rs)
+            if 'confidence' not in rs_copy:
+                rs_copy['confidence'] = 0.0
+            prepared_for_validation.append(rs_copy)
+
+        validated = ai_service.validate_suggestions(prepared_for_validation, properties)
+        logger.debug("Validated (two-pass) suggestions: %d", len(validated))
+
+        # Agent B: interpret confidences
+        interpreter_outputs = ai_service.interpret_confidence(
+            reasoned, properties, page_url, page.get('text_content')
+        )
+        logger.info(f"🎯 Agent B (Interpreter) processed {len(interpreter_outputs)} confidence interpretations")
+
+        # Map property_id -> interpreter result
+        interp_by_pid = {int(it.get('property_id')): it for it in interpreter_outputs if it.get('property_id') is not None}
+        # Map property_id -> first Agent A suggestion for it
+        reasoned_by_pid = {}
+        for r in reasoned:
+            if r.get('property_id') is not None:
+                reasoned_by_pid.setdefault(int(r['property_id']), r)
+
+        # Log confidence distribution statistics (single pass, only when they will be shown)
+        if interpreter_outputs and logger.isEnabledFor(logging.INFO):
+            avg_confidence, min_confidence, max_confidence, high_conf_count, low_conf_count = \
+                _confidence_stats(interpreter_outputs)
+
+            logger.info(f"📊 Two-pass confidence distribution:")
+            logger.info(f"   • Average: {avg_confidence:.2f}")
+            logger.info(f"   • Range: {min_confidence:.2f} - {max_confidence:.2f}")
+            logger.info(f"   • High confidence (≥80%): {high_conf_count}/{len(interpreter_outputs)}")
+            logger.info(f"   • Low confidence (<50%): {low_conf_count}/{len(interpreter_outputs)}")
+
+        for sug in validated:
+            pid = sug['property_id']
+            interp = interp_by_pid.get(pid, {})
+            agent_a = reasoned_by_pid.get(pid, {})
+            agent_a_evidence = agent_a.get('evidence', '')
+            agent_a_reasoning = agent_a.get('reasoning', '')
+            final_confidence = float(interp.get('confidence', 0.0))
+
+            # Debug logging for each suggestion
+            logger.info(f"🎯 Property {pid}: final_confidence={final_confidence:.2f} ({final_confidence*100:.0f}%)")
+            suggestion_record = {
+                'source_id': source_id,
+                'edition_id': edition_id,
+                'property_id': sug['property_id'],
+                'property_option_id': sug.get('property_option_id'),
+                'custom_value': sug.get('custom_value'),
+                'status': 'pending',
+                'ai_generated': True,
+                'confidence': final_confidence,
+                'confidence_source': interp.get('confidence_source', 'interpreter_v1'),
+                'evidence': {
+                    'content': agent_a_evidence,
+                    'source_url': page_url,
+                    'confidence': final_confidence,
+                    'extraction_method': 'ai_generated'
+                },
+                'reasoning': agent_a_reasoning,
+                'agentA_reasoning': agent_a_reasoning,
+                'agentA_evidence': agent_a_evidence,
+                'agentB_confidence': final_confidence,
+                'agentB_rationale': interp.get('rationale', ''),
+                'agentB_tags': interp.get('tags', {}),
+                'page_url': page_url,
+                'page_title': page_title
+            }
+            records.append(suggestion_record)
+
+    else:
+        # Single-pass fallback (current behavior)
+        page_suggestions = ai_service.generate_metadata_suggestions(
+            page.get('text_content', ''),
+            page.get('url', ''),
+            properties
+        )
+
+        logger.debug("Raw AI suggestions received: %d", len(page_suggestions))
+        if page_suggestions:
+            logger.debug("First raw suggestion: %s", page_suggestions[0])
+
+        validated = ai_service.validate_suggestions(page_suggestions, properties)
+        logger.debug("Validated suggestions: %d", len(validated))
+
+        for sug in validated:
+            confidence = sug.get('confidence', 0.0)
+            suggestion_record = {
+                'source_id': source_id,
+                'edition_id': edition_id,
+                'property_id': sug['property_id'],
+                'property_option_id': sug.get('property_option_id'),
+                'custom_value': sug.get('custom_value'),
+                'status': 'pending',
+                'ai_generated': True,
+                'confidence': confidence,
+                'evidence': {
+                    'content': sug.get('evidence', ''),
+                    'source_url': page_url,
+                    'confidence': confidence,
+                    'extraction_method': 'ai_generated'
+                },
+                'reasoning': sug.get('reasoning', ''),
+                'page_url': page_url,
+                'page_title': page_title
+            }
+            records.append(suggestion_record)
+
+    return records
+
+
 @app.route('/api/entities/<int:entity_id>/scrape', methods=['POST'])
 def scrape_entity_content(entity_id: int):
     """
@@ -842,12 +1722,12 @@ def scrape_entity_content(entity_id: int):
             return jsonify({"error": "No JSON data provided"}), 400
 
         # Find the entity
-        entity = next((e for e in DATA["editions"] if e["id"] == entity_id), None)
+        entity = INDEXES.editions_by_id.get(entity_id)
         if not entity:
             return jsonify({"error": "Entity not found"}), 404
         
         # Find the source
-        source = next((s for s in DATA["sources"] if s["id"] == entity["source_id"]), None)
+        source = INDEXES.sources_by_id.get(entity.source_id)
         if not source:
             return jsonify({"error": "Source not found"}), 404
 
@@ -856,11 +1736,20 @@ def scrape_entity_content(entity_id: int):
         
         # Start with empty suggestions - they will be populated if AI is enabled
         suggestions = []
-        logger.info(f"Processing entity '{entity['entity_name']}' with AI={'enabled' if use_ai else 'disabled'}")
+        logger.info(f"Processing entity '{entity.entity_name}' with AI={'enabled' if use_ai else 'disabled'}")
 
         # Use the new robust scraping service
         fallback_urls = data.get('urls', None)
-        pages_data, scraping_errors = entity_scraper.scrape_entity(entity, source, fallback_urls)
+        cache_key = (entity_id, tuple(sorted(fallback_urls or [])))
+        cached = None if request.args.get('no_cache') == '1' else SCRAPE_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached scrape for entity {entity_id}")
+            pages_data, scraping_errors = cached
+        else:
+            pages_data, scraping_errors = entity_scraper.scrape_entity(entity, source, fallback_urls)
+            # Failed scrapes are not cached so the next request retries them
+            if pages_data:
+                SCRAPE_CACHE.set(cache_key, (pages_data, scraping_errors))
         
         # Log any scraping errors
         if scraping_errors:
@@ -874,173 +1763,60 @@ def scrape_entity_content(entity_id: int):
         if use_ai and ai_service:
             logger.info("AI suggestions requested, generating for each page")
             
-            # DEBUG: Log the data being sent to AI service
-            logger.info(f"DEBUG: Properties count: {len(DATA['properties'])}")
-            logger.info(f"DEBUG: First property: {DATA['properties'][0] if DATA['properties'] else 'None'}")
-            logger.info(f"DEBUG: Pages data count: {len(pages_data)}")
+            # Log the data being sent to AI service (lazy formatting: free unless DEBUG is on)
+            logger.debug("Properties count: %d", len(DATA['properties']))
+            logger.debug("First property: %s", DATA['properties'][0] if DATA['properties'] else 'None')
+            logger.debug("Pages data count: %d", len(pages_data))
             if pages_data:
-                logger.info(f"DEBUG: First page text length: {len(pages_data[0].get('text_content', ''))}")
+                logger.debug("First page text length: %d", len(pages_data[0].get('text_content', '')))
             
             # Use the entity and source IDs from the request
-            selected_source_id = source["id"]
+            selected_source_id = source.id
             selected_edition_id = entity_id
             
             logger.info(f"Using source_id: {selected_source_id}, edition_id: {selected_edition_id}")
             
             # CRITICAL: Remove existing AI-generated suggestions for this source/edition combination
             # This prevents duplicates when reprocessing content
-            existing_ai_suggestions = [
-                s for s in DATA["suggestions"] 
-                if s.get('ai_generated', False) 
-                and s.get('source_id') == selected_source_id 
-                and s.get('edition_id') == selected_edition_id
-            ]
+            with DATA_LOCK:
+                existing_ai_suggestions = [
+                    s for s in INDEXES.filter_suggestions(selected_source_id, selected_edition_id)
+                    if s.get('ai_generated', False)
+                ]
+                # Keep only non-AI suggestions and AI suggestions for different source/edition combinations
+                _remove_suggestions(existing_ai_suggestions)
             
             if existing_ai_suggestions:
-                logger.info(f"Removing {len(existing_ai_suggestions)} existing AI suggestions for source_id={selected_source_id}, edition_id={selected_edition_id}")
-                # Keep only non-AI suggestions and AI suggestions for different source/edition combinations
-                DATA["suggestions"] = [
-                    s for s in DATA["suggestions"] 
-                    if not (s.get('ai_generated', False) 
-                           and s.get('source_id') == selected_source_id 
-                           and s.get('edition_id') == selected_edition_id)
-                ]
+                logger.info(f"Removed {len(existing_ai_suggestions)} existing AI suggestions for source_id={selected_source_id}, edition_id={selected_edition_id}")
                 logger.info(f"Remaining suggestions after cleanup: {len(DATA['suggestions'])}")
             
             # Decide confidence mode
-            confidence_mode = os.getenv('AI_CONFIDENCE_MODE', 'single').lower()
-
-            for page in pages_data:
-                try:
-                    logger.info(f"DEBUG: Processing page: {page.get('url')}")
-                    logger.info(f"DEBUG: Page text content length: {len(page.get('text_content', ''))}")
-
-                    if confidence_mode == 'two_pass' and hasattr(ai_service, 'generate_reasoned_suggestions'):
-                        logger.info("🤖 Starting two-pass AI confidence system")
-                        # Agent A: get reasoned suggestions without confidence
-                        reasoned = ai_service.generate_reasoned_suggestions(
-                            page.get('text_content', ''),
-                            page.get('url', ''),
-                            DATA['properties']
-                        )
-                        logger.info(f"🧠 Agent A (Reasoner) generated {len(reasoned)} reasoned suggestions")
-                        logger.info(f"DEBUG: Reasoner suggestions: {len(reasoned)}")
-
-                        # Validate shape for value/evidence (ignore confidence)
-                        # Reuse validator by temporarily injecting confidence=0.0 to pass schema where needed
-                        prepared_for_validation = []
-                        for rs in reasoned:
-                            rs_copy = dict(rs)
-                            if 'confidence' not in rs_copy:
-                                rs_copy['confidence'] = 0.0
-                            prepared_for_validation.append(rs_copy)
-
-                        validated = ai_service.validate_suggestions(prepared_for_validation, DATA['properties'])
-                        logger.info(f"DEBUG: Validated (two-pass) suggestions: {len(validated)}")
-
-                        # Agent B: interpret confidences
-                        interpreter_outputs = ai_service.interpret_confidence(reasoned, DATA['properties'], page.get('url'))
-                        logger.info(f"🎯 Agent B (Interpreter) processed {len(interpreter_outputs)} confidence interpretations")
-                        
-                        # Map property_id -> interpreter result
-                        interp_by_pid = {int(it.get('property_id')): it for it in interpreter_outputs if it.get('property_id') is not None}
-                        
-                        # Log confidence distribution statistics
-                        confidence_scores = [float(it.get('confidence', 0.0)) for it in interpreter_outputs]
-                        if confidence_scores:
-                            avg_confidence = sum(confidence_scores) / len(confidence_scores)
-                            min_confidence = min(confidence_scores)
-                            max_confidence = max(confidence_scores)
-                            high_conf_count = len([c for c in confidence_scores if c >= 0.8])
-                            low_conf_count = len([c for c in confidence_scores if c < 0.5])
-                            
-                            logger.info(f"📊 Two-pass confidence distribution:")
-                            logger.info(f"   • Average: {avg_confidence:.2f}")
-                            logger.info(f"   • Range: {min_confidence:.2f} - {max_confidence:.2f}")
-                            logger.info(f"   • High confidence (≥80%): {high_conf_count}/{len(confidence_scores)}")
-                            logger.info(f"   • Low confidence (<50%): {low_conf_count}/{len(confidence_scores)}")
-
-                        for sug in validated:
-                            pid = sug['property_id']
-                            interp = interp_by_pid.get(pid, {})
-                            final_confidence = float(interp.get('confidence', 0.0))
-                            
-                            # Debug logging for each suggestion
-                            logger.info(f"🎯 Property {pid}: final_confidence={final_confidence:.2f} ({final_confidence*100:.0f}%)")
-                            # Build record
-                            suggestion_record = {
-                                'id': _gen_id('suggestions'),
-                                'source_id': selected_source_id,
-                                'edition_id': selected_edition_id,
-                                'property_id': sug['property_id'],
-                                'property_option_id': sug.get('property_option_id'),
-                                'custom_value': sug.get('custom_value'),
-                                'status': 'pending',
-                                'ai_generated': True,
-                                'confidence': final_confidence,
-                                'confidence_source': interp.get('confidence_source', 'interpreter_v1'),
-                                'evidence': {
-                                    'content': reasoned and next((r.get('evidence') for r in reasoned if int(r.get('property_id', -1)) == pid), ''),
-                                    'source_url': page.get('url'),
-                                    'confidence': final_confidence,
-                                    'extraction_method': 'ai_generated'
-                                },
-                                'reasoning': reasoned and next((r.get('reasoning') for r in reasoned if int(r.get('property_id', -1)) == pid), ''),
-                                'agentA_reasoning': reasoned and next((r.get('reasoning') for r in reasoned if int(r.get('property_id', -1)) == pid), ''),
-                                'agentA_evidence': reasoned and next((r.get('evidence') for r in reasoned if int(r.get('property_id', -1)) == pid), ''),
-                                'agentB_confidence': final_confidence,
-                                'agentB_rationale': interp.get('rationale', ''),
-                                'agentB_tags': interp.get('tags', {}),
-                                'page_url': page.get('url'),
-                                'page_title': page.get('title')
-                            }
-
-                            DATA['suggestions'].append(suggestion_record)
-                            ai_suggestions.append(suggestion_record)
-
-                    else:
-                        # Single-pass fallback (current behavior)
-                        page_suggestions = ai_service.generate_metadata_suggestions(
-                            page.get('text_content', ''),
-                            page.get('url', ''),
-                            DATA['properties']
-                        )
-
-                        logger.info(f"DEBUG: Raw AI suggestions received: {len(page_suggestions)}")
-                        if page_suggestions:
-                            logger.info(f"DEBUG: First raw suggestion: {page_suggestions[0]}")
-
-                        validated = ai_service.validate_suggestions(page_suggestions, DATA['properties'])
-                        logger.info(f"DEBUG: Validated suggestions: {len(validated)}")
-
-                        for sug in validated:
-                            suggestion_record = {
-                                'id': _gen_id('suggestions'),
-                                'source_id': selected_source_id,
-                                'edition_id': selected_edition_id,
-                                'property_id': sug['property_id'],
-                                'property_option_id': sug.get('property_option_id'),
-                                'custom_value': sug.get('custom_value'),
-                                'status': 'pending',
-                                'ai_generated': True,
-                                'confidence': sug.get('confidence', 0.0),
-                                'evidence': {
-                                    'content': sug.get('evidence', ''),
-                                    'source_url': page.get('url'),
-                                    'confidence': sug.get('confidence', 0.0),
-                                    'extraction_method': 'ai_generated'
-                                },
-                                'reasoning': sug.get('reasoning', ''),
-                                'page_url': page.get('url'),
-                                'page_title': page.get('title')
-                            }
-                            DATA['suggestions'].append(suggestion_record)
-                            ai_suggestions.append(suggestion_record)
-
-                except Exception as e:
-                    logger.error(f"Failed to generate AI suggestions for {page.get('url')}: {e}")
-                    import traceback
-                    logger.error(f"Full traceback: {traceback.format_exc()}")
+            confidence_mode = AI_CONFIDENCE_MODE
+
+            # LLM calls are network-bound, so pages are processed on threads; records are
+            # stored afterwards, in page order, under one lock
+            properties = DATA['properties']
+            page_results = []
+            if pages_data:
+                with ThreadPoolExecutor(max_workers=min(AI_PAGE_WORKERS, len(pages_data))) as pool:
+                    futures = [
+                        pool.submit(_generate_page_suggestions, page, properties, confidence_mode,
+                                    selected_source_id, selected_edition_id)
+                        for page in pages_data
+                    ]
+                    for page, future in zip(pages_data, futures):
+                        try:
+                            page_results.append(future.result())
+                        except Exception as e:
+                            logger.error(f"Failed to generate AI suggestions for {page.get('url')}: {e}")
+                            logger.error(f"Full traceback: {''.join(traceback.format_exception(e))}")
+
+            with DATA_LOCK:
+                ai_suggestions.extend(
+                    {'id': _gen_id('suggestions'), **record}
+                    for records in page_results for record in records
+                )
+                _add_suggestions(ai_suggestions)
             
             if ai_suggestions:
                 suggestions = ai_suggestions
@@ -1056,30 +1832,30 @@ def scrape_entity_content(entity_id: int):
         else:
             logger.info(f"Manual Processing: {len(pages_data)} pages, ready for manual curation")
         
-        import datetime as dt
-        
+        ai_count = sum(1 for s in suggestions if s.get('ai_generated', False))
+        props_total = len(DATA["properties"])
         return jsonify({
             "success": True,
             "entity": {
                 "id": entity_id,
-                "name": entity["entity_name"],
-                "description": entity["entity_description"],
-                "source_id": entity["source_id"]
+                "name": entity.entity_name,
+                "description": entity.entity_description,
+                "source_id": entity.source_id
             },
             "source": {
-                "id": source["id"],
-                "name": source["name"]
+                "id": source.id,
+                "name": source.name
             },
             "scraped_content": {
                 "pages": pages_data,
                 "total_pages": len(pages_data),
-                "scraped_at": dt.datetime.now(dt.timezone.utc).isoformat()
+                "scraped_at": dt.datetime.now(timezone.utc).isoformat()
             },
             "suggestions": {
                 "items": suggestions,
                 "total_count": len(suggestions),
-                "ai_generated": len([s for s in suggestions if s.get('ai_generated', False)]),
-                "manual_required": len(DATA["properties"]) - len([s for s in suggestions if s.get('ai_generated', False)]) if use_ai else len(DATA["properties"])
+                "ai_generated": ai_count,
+                "manual_required": props_total - ai_count if use_ai else props_total
             }
         })
     except Exception as e:
@@ -1097,9 +1873,9 @@ def fetch_external():
     limit = int(request.args.get('limit', 10) or 10)
 
     try:
-        r = requests.get(EXTERNAL_API,
-                         params={"q": q, "limit": limit},
-                         timeout=15)
+        r = http_session.get(EXTERNAL_API,
+                             params={"q": q, "limit": limit},
+                             timeout=15)
         r.raise_for_status()
         data = r.json()          # assume [{url:str,title:str}, …]
 
@@ -1116,6 +1892,7 @@ def fetch_external():
 ## Removed POST /api/editions (creation disabled)
 
 @app.route("/api/manual-metadata", methods=["POST"])
+@_synchronized
 def create_manual_metadata():
     """
     Create or update metadata suggestions manually (without AI).
@@ -1137,15 +1914,15 @@ def create_manual_metadata():
             return jsonify({"error": f"Field '{field}' is required"}), 400
     
     # Validate references exist
-    if not any(s["id"] == payload["source_id"] for s in DATA["sources"]):
+    if payload["source_id"] not in INDEXES.sources_by_id:
         return jsonify({"error": "Source not found"}), 404
-    if not any(e["id"] == payload["edition_id"] for e in DATA["editions"]):
+    if payload["edition_id"] not in INDEXES.editions_by_id:
         return jsonify({"error": "Edition not found"}), 404
-    if not any(p["id"] == payload["property_id"] for p in DATA["properties"]):
+    if payload["property_id"] not in INDEXES.properties_by_id:
         return jsonify({"error": "Property not found"}), 404
     
     # Get the property to validate the value and check if it's required
-    property_def = next(p for p in DATA["properties"] if p["id"] == payload["property_id"])
+    property_def = INDEXES.properties_by_id[payload["property_id"]]
     is_required = property_def.get("is_required", False)
     
     # Validate that either property_option_id/property_option_ids or custom_value is provided based on property type
@@ -1154,12 +1931,12 @@ def create_manual_metadata():
     custom_value = payload.get("custom_value")
     curator_note = payload.get("curator_note", "")
     
-    if property_def["type"] == "MULTIPLE_CHOICE":
+    if property_def["type"] is PropertyType.MULTIPLE_CHOICE:
         # Handle multiple selections
         if property_option_ids and isinstance(property_option_ids, list) and len(property_option_ids) > 0:
             # Validate all options exist
             for opt_id in property_option_ids:
-                if not any(opt["id"] == opt_id for opt in property_def.get("property_options", [])):
+                if opt_id not in INDEXES.option_ids_by_property[property_def["id"]]:
                     return jsonify({"error": f"Invalid property_option_id: {opt_id}"}), 400
             # Store as JSON string or comma-separated for compatibility
             property_option_id = property_option_ids[0]  # Store first as primary
@@ -1170,10 +1947,10 @@ def create_manual_metadata():
             # Allow saving with only curator note (e.g., "not sure")
             property_option_id = None
             custom_value = None
-    elif property_def["type"] in ["SINGLE_CHOICE", "BINARY"]:
+    elif property_def["type"] in (PropertyType.SINGLE_CHOICE, PropertyType.BINARY):
         if property_option_id:
             # Validate the option exists
-            if not any(opt["id"] == property_option_id for opt in property_def.get("property_options", [])):
+            if property_option_id not in INDEXES.option_ids_by_property[property_def["id"]]:
                 return jsonify({"error": "Invalid property_option_id"}), 400
             custom_value = None
         elif not curator_note:
@@ -1207,13 +1984,10 @@ def create_manual_metadata():
     }
     
     # Check if suggestion already exists for this combination
-    existing_suggestion = next(
-        (s for s in DATA["suggestions"] 
-         if s["source_id"] == payload["source_id"] 
-         and s["edition_id"] == payload["edition_id"] 
-         and s["property_id"] == payload["property_id"]), 
-        None
+    same_field = INDEXES.suggestions_by_field.get(
+        (payload["source_id"], payload["edition_id"], payload["property_id"])
     )
+    existing_suggestion = same_field[0] if same_field else None
     
     if existing_suggestion:
         # Update existing suggestion
@@ -1227,6 +2001,8 @@ def create_manual_metadata():
             "evidence": evidence_record,
             "is_required": is_required
         })
+        INDEXES.touch_edition(existing_suggestion.get("edition_id"))
+        _bump_data_version()
         
         # Update evidence record
         evidence_record["suggestion_id"] = existing_suggestion["id"]
@@ -1243,8 +2019,6 @@ def create_manual_metadata():
     else:
         # Create new suggestion
         new_id = _gen_id("suggestions")
-        import datetime as dt
-        from datetime import timezone
         
         record = {
             "id": new_id,
@@ -1252,7 +2026,7 @@ def create_manual_metadata():
             "edition_id": payload["edition_id"],
             "property_id": payload["property_id"],
             "property_option_id": property_option_id,
-            "property_option_ids": property_option_ids if property_def["type"] == "MULTIPLE_CHOICE" else None,
+            "property_option_ids": property_option_ids if property_def["type"] is PropertyType.MULTIPLE_CHOICE else None,
             "custom_value": custom_value,
             "status": "accepted",  # Manual entries are pre-accepted by curator
             "ai_generated": False,
@@ -1268,7 +2042,7 @@ def create_manual_metadata():
         evidence_record["suggestion_id"] = new_id
         evidence_record["created_at"] = record["created_at"]
         
-        DATA["suggestions"].append(record)
+        _add_suggestion(record)
         DATA["evidence"].append(evidence_record)
         
         logger.info(f"Created new manual suggestion: {new_id} with evidence")
@@ -1281,6 +2055,7 @@ def create_manual_metadata():
 
 
 @app.route("/api/suggestions/<int:suggestion_id>/edit", methods=["PUT"])
+@_synchronized
 def edit_suggestion(suggestion_id: int):
     """Edit an existing metadata suggestion."""
     
@@ -1290,18 +2065,19 @@ def edit_suggestion(suggestion_id: int):
     payload = request.get_json(force=True)
     
     # Find the suggestion
-    suggestion = next((s for s in DATA["suggestions"] if s["id"] == suggestion_id), None)
+    suggestion = INDEXES.suggestions_by_id.get(suggestion_id)
     if not suggestion:
         return jsonify({"error": "Suggestion not found"}), 404
     
     # Get the property to validate the new value
-    property_def = next(p for p in DATA["properties"] if p["id"] == suggestion["property_id"])
+    property_def = INDEXES.properties_by_id[suggestion["property_id"]]
+    previous_value = _snapshot(suggestion, _EDIT_FIELDS)
     
     # Update fields if provided
     if "property_option_id" in payload:
-        if property_def["type"] in ["MULTIPLE_CHOICE", "SINGLE_CHOICE", "BINARY"]:
+        if property_def["type"] in _CHOICE_TYPES:
             # Validate the option exists
-            if not any(opt["id"] == payload["property_option_id"] for opt in property_def.get("property_options", [])):
+            if payload["property_option_id"] not in INDEXES.option_ids_by_property[property_def["id"]]:
                 return jsonify({"error": "Invalid property_option_id"}), 400
             suggestion["property_option_id"] = payload["property_option_id"]
             suggestion["custom_value"] = None
@@ -1309,7 +2085,7 @@ def edit_suggestion(suggestion_id: int):
             return jsonify({"error": "property_option_id not applicable for this property type"}), 400
     
     if "custom_value" in payload:
-        if property_def["type"] in ["NUMERICAL", "FREE_TEXT"]:
+        if property_def["type"] in _VALUE_TYPES:
             suggestion["custom_value"] = payload["custom_value"]
             suggestion["property_option_id"] = None
         else:
@@ -1323,17 +2099,15 @@ def edit_suggestion(suggestion_id: int):
     suggestion["ai_generated"] = False
     
     # Create history entry
-    import datetime as dt
-    from datetime import timezone
     history_entry = {
         "id": _gen_id("curation_history"),
         "suggestion_id": suggestion_id,
         "action": "edit",
         "timestamp": dt.datetime.now(timezone.utc).isoformat(),
         "user_note": payload.get("note", "Edited by curator"),
-        "previous_value": suggestion.copy()
+        "previous_value": previous_value
     }
-    DATA["curation_history"].append(history_entry)
+    _add_history(history_entry)
     
     logger.info(f"Suggestion {suggestion_id} edited by curator")
     
@@ -1349,6 +2123,7 @@ def edit_suggestion(suggestion_id: int):
 # --------------------------------------------------------------------------------------
 
 @app.route("/api/editions/<int:edition_id>/publish", methods=["POST"])
+@_synchronized
 def publish_edition(edition_id: int):
     """
     Publish an edition when all required fields are filled and validated.
@@ -1368,15 +2143,12 @@ def publish_edition(edition_id: int):
     publish_note = payload.get('note', 'Published by curator')
     
     # Find the edition
-    edition = next((e for e in DATA["editions"] if e["id"] == edition_id), None)
+    edition = INDEXES.editions_by_id.get(edition_id)
     if not edition:
         return jsonify({"error": "Edition not found"}), 404
     
-    # Get all suggestions for this edition
-    edition_suggestions = [s for s in DATA["suggestions"] if s["edition_id"] == edition_id]
-    
-    # Validate publishing requirements
-    validation_result = _validate_publishing_requirements(edition_suggestions)
+    # Validate publishing requirements fresh: publishing must never act on a cached verdict
+    validation_result = _validate_publishing_requirements(INDEXES.filter_suggestions(edition_id=edition_id))
     if not validation_result["valid"]:
         return jsonify({
             "error": "Cannot publish edition",
@@ -1384,34 +2156,41 @@ def publish_edition(edition_id: int):
             "validation_summary": validation_result["summary"]
         }), 400
     
-    # Create publishing record
-    import datetime as dt
-    from datetime import timezone
-    current_time = dt.datetime.now(timezone.utc)
+    published_at = dt.datetime.now(timezone.utc).isoformat()
+    edition_suggestions = INDEXES.filter_suggestions(edition_id=edition_id)
     
+    # Update all suggestions to published status, counting fields in the same pass
+    required_count = accepted_count = 0
+    for suggestion in edition_suggestions:
+        if suggestion.get("is_required", False):
+            required_count += 1
+        if suggestion.get("status") == "accepted":
+            accepted_count += 1
+            suggestion["published_at"] = published_at
+            suggestion["published_by"] = user_id
+            suggestion["publish_note"] = publish_note
+    
+    # Create publishing record
     publishing_record = {
         "id": _gen_id("publishing_state"),
         "edition_id": edition_id,
         "status": "published",
-        "published_at": current_time.isoformat(),
+        "published_at": published_at,
         "published_by": user_id,
         "publish_note": publish_note,
         "validation_errors": [],
         "total_fields": len(edition_suggestions),
-        "required_fields": len([s for s in edition_suggestions if s.get("is_required", False)]),
-        "accepted_fields": len([s for s in edition_suggestions if s.get("status") == "accepted"]),
+        "required_fields": required_count,
+        "accepted_fields": accepted_count,
         "evidence_validation": "passed"
     }
     
-    # Update all suggestions to published status
-    for suggestion in edition_suggestions:
-        if suggestion.get("status") == "accepted":
-            suggestion["published_at"] = current_time.isoformat()
-            suggestion["published_by"] = user_id
-            suggestion["publish_note"] = publish_note
-    
     # Store publishing record
     DATA["publishing_state"].append(publishing_record)
+    INDEXES.add_publishing(publishing_record)
+    if AUDIT_STORE is not None:
+        AUDIT_STORE.record(_publishing_audit_entry(publishing_record))
+    _bump_data_version()
     
     # Log the publishing action
     logger.info(f"Edition {edition_id} published by user {user_id} with {len(edition_suggestions)} fields validated")
@@ -1421,7 +2200,7 @@ def publish_edition(edition_id: int):
         "publishing_record": publishing_record,
         "edition": edition,
         "validation_summary": validation_result["summary"],
-        "message": f"Successfully published edition '{edition['entity_name']}' with {len(edition_suggestions)} validated fields"
+        "message": f"Successfully published edition '{edition.entity_name}' with {len(edition_suggestions)} validated fields"
     })
 
 
@@ -1438,28 +2217,96 @@ def get_publishing_status(edition_id: int):
     """
     
     # Find the edition
-    edition = next((e for e in DATA["editions"] if e["id"] == edition_id), None)
+    edition = INDEXES.editions_by_id.get(edition_id)
     if not edition:
         return jsonify({"error": "Edition not found"}), 404
     
     # Get publishing state
-    publishing_state = next((p for p in DATA["publishing_state"] if p["edition_id"] == edition_id), None)
-    
-    # Get all suggestions for this edition
-    edition_suggestions = [s for s in DATA["suggestions"] if s["edition_id"] == edition_id]
+    publishing_state = INDEXES.publishing_by_edition.get(edition_id)
     
-    # Calculate validation status
-    validation_status = _calculate_validation_status(edition_suggestions)
+    # Calculate validation status (cached until one of the edition's suggestions changes)
+    validation_status = _edition_validation(_calculate_validation_status, edition_id)
     
     return jsonify({
         "edition_id": edition_id,
-        "edition_name": edition["entity_name"],
+        "edition_name": edition.entity_name,
         "publishing_state": publishing_state,
         "validation_status": validation_status,
         "can_publish": validation_status["all_requirements_met"]
     })
 
 
+def _curation_audit_entry(entry: dict, suggestion: dict) -> dict:
+    """Audit-log view of a curation history entry."""
+    return {
+        "id": entry["id"],
+        "timestamp": entry["timestamp"],
+        "action": entry["action"],
+        "user_id": entry.get("user_id", "unknown"),
+        "model_version": entry.get("model_version", "unknown"),
+        "suggestion_id": entry["suggestion_id"],
+        "edition_id": suggestion.get("edition_id"),
+        "source_id": suggestion.get("source_id"),
+        "property_id": suggestion.get("property_id"),
+        "user_note": entry.get("user_note", ""),
+        "evidence_references": entry.get("evidence_references", []),
+        "entry_type": "curation"
+    }
+
+
+def _publishing_audit_entry(record: dict) -> dict:
+    """Audit-log view of a publishing record."""
+    return {
+        "id": record["id"],
+        "timestamp": record["published_at"],
+        "action": "publish",
+        "user_id": record.get("published_by", "unknown"),
+        "model_version": "system",
+        "edition_id": record["edition_id"],
+        "user_note": record.get("publish_note", ""),
+        "evidence_references": [],
+        "entry_type": "publishing",
+        "validation_summary": {
+            "total_fields": record.get("total_fields", 0),
+            "required_fields": record.get("required_fields", 0),
+            "accepted_fields": record.get("accepted_fields", 0)
+        }
+    }
+
+
+def _audit_sort_key(entry: dict) -> tuple:
+    """Total order of audit entries; the log is served in descending order of this key."""
+    return entry["timestamp"], entry["entry_type"], entry["id"]
+
+
+def _audit_cursor(entry: dict) -> str:
+    return "{}|{}|{}".format(*_audit_sort_key(entry))
+
+
+def _parse_audit_cursor(cursor: str) -> tuple | None:
+    """(timestamp, entry_type, id) from a cursor; a bare timestamp means "before that instant"."""
+    parts = cursor.rsplit("|", 2)
+    if len(parts) == 1:
+        return cursor, "", 0
+    if len(parts) != 3:
+        return None
+    try:
+        return parts[0], parts[1], int(parts[2])
+    except ValueError:
+        return None
+
+
+def _stream_before(cursor: tuple | None, entry_type: str) -> tuple | None:
+    """The (timestamp, id) bound below which one entry type's stream lies under ``cursor``."""
+    if cursor is None:
+        return None
+    timestamp, cursor_type, cursor_id = cursor
+    if entry_type == cursor_type:
+        return timestamp, cursor_id
+    # Other types tie-break against the cursor on entry_type alone
+    return (timestamp, float("inf")) if entry_type < cursor_type else (timestamp, float("-inf"))
+
+
 @app.route("/api/audit-log", methods=["GET"])
 def get_audit_log():
     """
@@ -1471,75 +2318,92 @@ def get_audit_log():
         - Evidence references
         - Publishing actions
         - Filtered by date range, user, action type
+        - Newest first, at most ``limit`` entries per page (default 500, max 1000);
+          pass ``next_cursor`` back as ``cursor`` for the following page
+        - Bounded in time: end_date defaults to now, start_date to 7 days before
+          end_date, and spans over 90 days are rejected
     """
     
     # Get query parameters for filtering
+    limit = min(max(request.args.get('limit', default=AUDIT_LOG_DEFAULT_LIMIT, type=int), 1), AUDIT_LOG_MAX_LIMIT)
+    cursor = request.args.get('cursor')
+    cursor_key = _parse_audit_cursor(cursor) if cursor else None
+    if cursor and cursor_key is None:
+        return jsonify({"error": "cursor must be a next_cursor value from a previous page"}), 400
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
     user_id = request.args.get('user_id')
     action_type = request.args.get('action_type')
     edition_id = request.args.get('edition_id', type=int)
     
-    # Start with all history entries
-    audit_entries = []
-    
-    # Add curation history
-    for entry in DATA["curation_history"]:
-        suggestion = next((s for s in DATA["suggestions"] if s["id"] == entry["suggestion_id"]), None)
-        if suggestion:
-            audit_entry = {
-                "id": entry["id"],
-                "timestamp": entry["timestamp"],
-                "action": entry["action"],
-                "user_id": entry.get("user_id", "unknown"),
-                "model_version": entry.get("model_version", "unknown"),
-                "suggestion_id": entry["suggestion_id"],
-                "edition_id": suggestion.get("edition_id"),
-                "source_id": suggestion.get("source_id"),
-                "property_id": suggestion.get("property_id"),
-                "user_note": entry.get("user_note", ""),
-                "evidence_references": entry.get("evidence_references", []),
-                "entry_type": "curation"
-            }
-            audit_entries.append(audit_entry)
-    
-    # Add publishing actions
-    for entry in DATA["publishing_state"]:
-        audit_entry = {
-            "id": entry["id"],
-            "timestamp": entry["published_at"],
-            "action": "publish",
-            "user_id": entry.get("published_by", "unknown"),
-            "model_version": "system",
-            "edition_id": entry["edition_id"],
-            "user_note": entry.get("publish_note", ""),
-            "evidence_references": [],
-            "entry_type": "publishing",
-            "validation_summary": {
-                "total_fields": entry.get("total_fields", 0),
-                "required_fields": entry.get("required_fields", 0),
-                "accepted_fields": entry.get("accepted_fields", 0)
-            }
-        }
-        audit_entries.append(audit_entry)
-    
-    # Apply filters
-    if start_date:
-        audit_entries = [e for e in audit_entries if e["timestamp"] >= start_date]
-    if end_date:
-        audit_entries = [e for e in audit_entries if e["timestamp"] <= end_date]
-    if user_id:
-        audit_entries = [e for e in audit_entries if e["user_id"] == user_id]
-    if action_type:
-        audit_entries = [e for e in audit_entries if e["action"] == action_type]
-    if edition_id:
-        audit_entries = [e for e in audit_entries if e.get("edition_id") == edition_id]
-    
-    # Sort by timestamp (newest first)
-    audit_entries.sort(key=lambda x: x["timestamp"], reverse=True)
+    # Never scan the whole log: fill in a default window and cap its width
+    window_end = _parse_timestamp(end_date) if end_date else dt.datetime.now(timezone.utc)
+    window_start = _parse_timestamp(start_date) if start_date else None
+    if window_end is None or (start_date and window_start is None):
+        return jsonify({"error": "start_date and end_date must be ISO-8601 timestamps"}), 400
+    if window_end.tzinfo is None:
+        window_end = window_end.replace(tzinfo=timezone.utc)
+    if window_start is None:
+        window_start = window_end - AUDIT_LOG_DEFAULT_WINDOW
+        start_date = window_start.isoformat()
+    elif window_start.tzinfo is None:
+        window_start = window_start.replace(tzinfo=timezone.utc)
+    if window_end - window_start > AUDIT_LOG_MAX_WINDOW:
+        return jsonify({
+            "error": f"Audit log window may span at most {AUDIT_LOG_MAX_WINDOW.days} days",
+            "start_date": start_date,
+            "end_date": end_date or window_end.isoformat()
+        }), 400
+    
+    def curation_entries():
+        # The date range is a bisect over the time-ordered index; the other filters are
+        # checked on the raw entry before any dict is built
+        if action_type == "publish":
+            return
+        for entry in _time_range(INDEXES.history_by_time, "timestamp", start_date, end_date,
+                                 _stream_before(cursor_key, "curation")):
+            if action_type and entry["action"] != action_type:
+                continue
+            entry_user = entry.get("user_id", "unknown")
+            if user_id and entry_user != user_id:
+                continue
+            suggestion = INDEXES.suggestions_by_id.get(entry["suggestion_id"])
+            if not suggestion or (edition_id and suggestion.get("edition_id") != edition_id):
+                continue
+            yield _curation_audit_entry(entry, suggestion)
+    
+    def publishing_entries():
+        if action_type and action_type != "publish":
+            return
+        for entry in _time_range(INDEXES.publishing_by_time, "published_at", start_date, end_date,
+                                 _stream_before(cursor_key, "publishing")):
+            entry_user = entry.get("published_by", "unknown")
+            if user_id and entry_user != user_id:
+                continue
+            if edition_id and entry["edition_id"] != edition_id:
+                continue
+            yield _publishing_audit_entry(entry)
+    
+    if AUDIT_STORE is not None:
+        # Filters, ordering and the page cut all run in SQL against the indexed table
+        audit_entries = AUDIT_STORE.query(
+            start=start_date, end=end_date, before=cursor_key, user_id=user_id,
+            action=action_type, edition_id=edition_id, limit=limit + 1
+        )
+    else:
+        # Both streams are already newest first, so merging them keeps the log sorted;
+        # iteration stops one entry past the page, which is only used to detect more
+        merged = heapq.merge(curation_entries(), publishing_entries(),
+                             key=_audit_sort_key, reverse=True)
+        audit_entries = list(itertools.islice(merged, limit + 1))
+    has_more = len(audit_entries) > limit
+    del audit_entries[limit:]
     
     return jsonify({
         "total_entries": len(audit_entries),
+        "limit": limit,
+        "has_more": has_more,
+        "next_cursor": _audit_cursor(audit_entries[-1]) if has_more else None,
         "filters_applied": {
             "start_date": start_date,
             "end_date": end_date,
@@ -1573,32 +2437,31 @@ def _validate_publishing_requirements(suggestions: list) -> dict:
         "validation_passed": False
     }
     
-    # Count required fields
-    required_suggestions = [s for s in suggestions if s.get("is_required", False)]
-    summary["required_fields"] = len(required_suggestions)
-    
-    # Check each required field
-    for suggestion in required_suggestions:
-        if suggestion.get("status") != "accepted":
-            errors.append(f"Required field '{_get_property_name(suggestion['property_id'])}' is not accepted (status: {suggestion.get('status', 'unknown')})")
-            summary["pending_fields"] += 1
-        elif not _has_valid_evidence(suggestion):
-            errors.append(f"Required field '{_get_property_name(suggestion['property_id'])}' lacks valid evidence")
-        else:
-            summary["accepted_fields"] += 1
-            summary["fields_with_evidence"] += 1
-    
-    # Check non-required fields for evidence if they're accepted
-    non_required_suggestions = [s for s in suggestions if not s.get("is_required", False)]
-    for suggestion in non_required_suggestions:
-        if suggestion.get("status") == "accepted":
+    # Single pass; errors for required fields are still reported before the others
+    optional_errors = []
+    for suggestion in suggestions:
+        status = suggestion.get("status")
+        if suggestion.get("is_required", False):
+            # Check each required field
+            summary["required_fields"] += 1
+            if status != "accepted":
+                errors.append(f"Required field '{_get_property_name(suggestion['property_id'])}' is not accepted (status: {suggestion.get('status', 'unknown')})")
+                summary["pending_fields"] += 1
+            elif not _has_valid_evidence(suggestion):
+                errors.append(f"Required field '{_get_property_name(suggestion['property_id'])}' lacks valid evidence")
+            else:
+                summary["accepted_fields"] += 1
+                summary["fields_with_evidence"] += 1
+        elif status == "accepted":
+            # Check non-required fields for evidence if they're accepted
             if not _has_valid_evidence(suggestion):
-                errors.append(f"Accepted field '{_get_property_name(suggestion['property_id'])}' lacks valid evidence")
+                optional_errors.append(f"Accepted field '{_get_property_name(suggestion['property_id'])}' lacks valid evidence")
             else:
                 summary["accepted_fields"] += 1
                 summary["fields_with_evidence"] += 1
-        elif suggestion.get("status") == "rejected":
+        elif status == "rejected":
             summary["rejected_fields"] += 1
+    errors.extend(optional_errors)
     
     # Determine if all requirements are met
     all_requirements_met = (
@@ -1620,36 +2483,25 @@ def _validate_publishing_requirements(suggestions: list) -> dict:
 def _calculate_validation_status(suggestions: list) -> dict:
     """Calculate detailed validation status for publishing."""
     
-    # Enrich suggestions with is_required from properties
-    enriched_suggestions = []
-    for suggestion in suggestions:
-        property_def = next((p for p in DATA["properties"] if p["id"] == suggestion["property_id"]), None)
-        suggestion_copy = suggestion.copy()
-        suggestion_copy["is_required"] = property_def.get("is_required", False) if property_def else False
-        enriched_suggestions.append(suggestion_copy)
-    
-    required_suggestions = [s for s in enriched_suggestions if s.get("is_required", False)]
-    non_required_suggestions = [s for s in enriched_suggestions if not s.get("is_required", False)]
+    def empty_bucket() -> dict:
+        return {"total": 0, "accepted": 0, "pending": 0, "rejected": 0, "with_evidence": 0}
     
     status = {
-        "required_fields": {
-            "total": len(required_suggestions),
-            "accepted": len([s for s in required_suggestions if s.get("status") == "accepted"]),
-            "pending": len([s for s in required_suggestions if s.get("status") == "pending"]),
-            "rejected": len([s for s in required_suggestions if s.get("status") == "rejected"]),
-            "with_evidence": len([s for s in required_suggestions if _has_valid_evidence(s)])
-        },
-        "non_required_fields": {
-            "total": len(non_required_suggestions),
-            "accepted": len([s for s in non_required_suggestions if s.get("status") == "accepted"]),
-            "pending": len([s for s in non_required_suggestions if s.get("status") == "pending"]),
-            "rejected": len([s for s in non_required_suggestions if s.get("status") == "rejected"]),
-            "with_evidence": len([s for s in non_required_suggestions if _has_valid_evidence(s)])
-        },
+        "required_fields": empty_bucket(),
+        "non_required_fields": empty_bucket(),
         "all_requirements_met": False,
         "ready_for_publishing": False
     }
     
+    # Single pass; is_required is kept on each suggestion by INDEXES
+    for suggestion in suggestions:
+        bucket = status["required_fields" if suggestion.get("is_required", False) else "non_required_fields"]
+        bucket["total"] += 1
+        if suggestion.get("status") in ("accepted", "pending", "rejected"):
+            bucket[suggestion["status"]] += 1
+        if _has_valid_evidence(suggestion):
+            bucket["with_evidence"] += 1
+    
     # Check if all required fields are accepted with evidence
     required_ready = (
         status["required_fields"]["total"] > 0 and
@@ -1669,7 +2521,7 @@ def _calculate_validation_status(suggestions: list) -> dict:
 
 def _get_property_name(property_id: int) -> str:
     """Get property name by ID for error messages."""
-    property_def = next((p for p in DATA["properties"] if p["id"] == property_id), None)
+    property_def = INDEXES.properties_by_id.get(property_id)
     return property_def.get("name", f"Property {property_id}") if property_def else f"Property {property_id}"
 
 
@@ -1678,13 +2530,18 @@ def clear_all_data():
     """Debug endpoint to clear all data and reload from dummy data."""
     try:
         global DATA
-        DATA = {
-            "sources": [],
-            "properties": [],
-            "editions": [],
-            "suggestions": [],
-            "evidence": []
-        }
+        with DATA_LOCK:
+            DATA = {
+                "sources": [],
+                "properties": [],
+                "editions": [],
+                "suggestions": [],
+                "evidence": []
+            }
+            INDEXES.rebuild(DATA)
+            _EVIDENCE_CHECKS.clear()
+            _bump_data_version()
+        # Reloads outside DATA_LOCK: the upstream fetch must not hold it
         _fetch_api_data()
         return jsonify({
             "success": True,
@@ -1698,37 +2555,25 @@ def clear_all_data():
         return jsonify({"error": "Failed to clear data"}), 500
 
 @app.route('/api/debug/cleanup-duplicates', methods=['POST'])
+@_synchronized
 def cleanup_duplicate_suggestions():
     """Debug endpoint to manually clean up duplicate AI suggestions."""
     try:
         original_count = len(DATA["suggestions"])
         
-        # Group suggestions by source_id, edition_id, property_id
-        suggestions_by_key = {}
-        for suggestion in DATA["suggestions"]:
-            key = (suggestion.get('source_id'), suggestion.get('edition_id'), suggestion.get('property_id'))
-            if key not in suggestions_by_key:
-                suggestions_by_key[key] = []
-            suggestions_by_key[key].append(suggestion)
-        
-        # Keep only the latest AI suggestion for each key, keep all manual suggestions
-        cleaned_suggestions = []
-        duplicates_removed = 0
-        
-        for key, suggestions in suggestions_by_key.items():
-            ai_suggestions = [s for s in suggestions if s.get('ai_generated', False)]
-            manual_suggestions = [s for s in suggestions if not s.get('ai_generated', False)]
-            
-            # Keep all manual suggestions
-            cleaned_suggestions.extend(manual_suggestions)
-            
-            # Keep only the latest AI suggestion (highest ID)
-            if ai_suggestions:
+        # Suggestions are already grouped by (source_id, edition_id, property_id) in the index;
+        # keep all manual suggestions and only the latest AI suggestion (highest ID) per group
+        duplicates = []
+        for same_field in INDEXES.suggestions_by_field.values():
+            if len(same_field) < 2:
+                continue
+            ai_suggestions = [s for s in same_field if s.get('ai_generated', False)]
+            if len(ai_suggestions) > 1:
                 latest_ai = max(ai_suggestions, key=lambda x: x.get('id', 0))
-                cleaned_suggestions.append(latest_ai)
-                duplicates_removed += len(ai_suggestions) - 1
+                duplicates.extend(s for s in ai_suggestions if s is not latest_ai)
+        duplicates_removed = len(duplicates)
         
-        DATA["suggestions"] = cleaned_suggestions
+        _remove_suggestions(duplicates)
         final_count = len(DATA["suggestions"])
         
         logger.info(f"Cleanup: Removed {duplicates_removed} duplicate AI suggestions ({original_count} -> {final_count})")
@@ -1752,7 +2597,7 @@ def log_curation_time():
     Log curation time data for user study analysis.
     
     This endpoint receives timing data when a user completes curation of an entity.
-    Data is stored in JSON files for later analysis.
+    Records are appended to a daily JSONL file in the background for later analysis.
     """
     try:
         if not request.is_json:
@@ -1766,28 +2611,15 @@ def log_curation_time():
             if field not in log_data:
                 return jsonify({"error": f"Missing required field: {field}"}), 400
         
-        # Create logs directory if it doesn't exist
-        import os
-        from pathlib import Path
-        import datetime as dt
-        
-        logs_dir = Path(__file__).parent / 'study_logs'
-        logs_dir.mkdir(exist_ok=True)
-        
-        # Create filename with timestamp
-        timestamp = dt.datetime.now().strftime('%Y%m%d_%H%M%S')
         entity_id = log_data.get('entity_id')
-        filename = f"{entity_id}_{timestamp}.json"
-        filepath = logs_dir / filename
+        filename = StudyLogWriter.filename_for(dt.date.today())
         
         # Add server-side metadata
-        log_data['logged_at'] = dt.datetime.now(dt.timezone.utc).isoformat()
+        log_data['logged_at'] = dt.datetime.now(timezone.utc).isoformat()
         log_data['log_filename'] = filename
         
-        # Write to file
-        import json
-        with open(filepath, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        # Queued; the writer thread appends it to the day's file
+        STUDY_LOG.write(log_data, filename)
         
         logger.info(f"📊 Curation time logged: Entity {entity_id}, Mode: {log_data['curation_mode']}, Duration: {log_data['duration_seconds']:.2f}s")
         
@@ -1800,7 +2632,6 @@ def log_curation_time():
         
     except Exception as e:
         logger.error(f"Error logging curation time: {e}")
-        import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         return jsonify({"error": "Failed to log curation time"}), 500
 
@@ -1808,6 +2639,6 @@ def log_curation_time():
 if __name__ == '__main__':
     print("🚀 Starting Curation Preview API & Metadata-Curation mock…")
     # Initialize data (API or dummy) before starting the server
-    _fetch_api_data()
-    logger.info(f"DEBUG: Data initialized - Sources: {len(DATA['sources'])}, Properties: {len(DATA['properties'])}, Editions: {len(DATA['editions'])}")
+    _ensure_data_loaded()
+    logger.info(f"Data initialized - Sources: {len(DATA['sources'])}, Properties: {len(DATA['properties'])}, Editions: {len(DATA['editions'])}")
     app.run(debug=False, host='0.0.0.0', port=8001)
@@ -1,29 +1,105 @@
 #!/usr/bin/env python3
 import argparse
+import hashlib
+import io
 import json
+import os
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
-def fetch_html(url):
-    response = requests.get(url, headers={"User-Agent": "CurationPreview/1.0"})
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "data_curation", "preview_html")
+# shelve is not thread-safe; pages are fetched concurrently
+_CACHE_LOCK = threading.Lock()
+# response.text is already decoded; stop lxml from re-decoding it by the page's meta charset
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+def fetch_html(url, cache=None):
+    headers = {"User-Agent": "CurationPreview/1.0"}
+    key = hashlib.blake2b(url.encode("utf-8")).hexdigest()
+    cached = None
+    if cache is not None:
+        with _CACHE_LOCK:
+            cached = cache.get(key)
+    # Revalidate a cached copy instead of downloading the page again
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+    response = requests.get(url, headers=headers)
+    if cached and response.status_code == 304:
+        return cached["body"]
     response.raise_for_status()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if cache is not None and (etag or last_modified):
+        with _CACHE_LOCK:
+            cache[key] = {"etag": etag, "last_modified": last_modified, "body": response.text}
     return response.text
 
-def create_simple_html(entity_name, source_name, pages_data, suggestions_data):
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Curation Preview - {entity_name}</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{ 
+def _page_text(doc, limit):
+    # Whitespace-collapsed text of doc cut to limit chars, and whether it was longer;
+    # stops walking the tree once the first limit chars are settled
+    pieces = []
+    size = 0
+    check_at = limit * 2
+    for piece in doc.itertext():
+        pieces.append(piece)
+        size += len(piece)
+        if size >= check_at:
+            words = ''.join(pieces).split()
+            # The last word may still continue in the next text node
+            settled = ' '.join(words[:-1])
+            if len(settled) > limit:
+                return settled[:limit], True
+            check_at = size * 2
+    text = ' '.join(''.join(pieces).split())
+    return text[:limit], len(text) > limit
+
+def _fetch_page(url, cache=None):
+    try:
+        print(f"Fetching: {url}")
+        html = fetch_html(url, cache)
+        title, text_content = url, ""
+        if html.strip():
+            # lxml builds the tree in C; script/style text is dropped as BeautifulSoup's get_text() did
+            doc = lxml.html.fromstring(html.encode("utf-8"), parser=_HTML_PARSER)
+            etree.strip_elements(doc, "script", "style", with_tail=False)
+            title = doc.findtext(".//title") or url
+            # Show more content (first 5000 characters), whitespace cleaned up
+            text_content, truncated = _page_text(doc, 5000)
+            if truncated:
+                text_content += "...\\n\\n[Content truncated - showing first 5000 characters]"
+        
+        return {
+            "url": url,
+            "title": title,
+            "text_content": text_content
+        }
+    except Exception as e:
+        print(f"Error fetching {url}: {e}")
+        return {
+            "url": url,
+            "title": f"Error: {str(e)}",
+            "text_content": f"Failed to fetch: {str(e)}"
+        }
+
+# Static parts of the preview page, written out verbatim on every run
+_PREVIEW_STYLE = """    <style>
+        * { box-sizing: border-box; }
+        body { 
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; 
             margin: 0; 
             padding: 0; 
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
-        }}
-        .header {{ 
+        }
+        .header { 
             background: rgba(255, 255, 255, 0.95); 
             backdrop-filter: blur(10px);
             padding: 25px 30px; 
@@ -31,42 +107,42 @@ def create_simple_html(entity_name, source_name, pages_data, suggestions_data):
             border-radius: 15px; 
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
             text-align: center;
-        }}
-        .header h1 {{ 
+        }
+        .header h1 { 
             margin: 0 0 10px 0; 
             color: #2c3e50; 
             font-size: 2.2em; 
             font-weight: 700;
-        }}
-        .header p {{ 
+        }
+        .header p { 
             margin: 0; 
             color: #7f8c8d; 
             font-size: 1.1em;
-        }}
-        .container {{ 
+        }
+        .container { 
             display: grid; 
             grid-template-columns: 320px 1fr 380px; 
             gap: 25px; 
             height: calc(100vh - 140px); 
             margin: 0 20px 20px 20px;
-        }}
-        .sidebar, .content, .right {{ 
+        }
+        .sidebar, .content, .right { 
             background: rgba(255, 255, 255, 0.95); 
             backdrop-filter: blur(10px);
             padding: 25px; 
             border-radius: 15px; 
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
             overflow-y: auto;
-        }}
-        .sidebar h2, .content h2, .right h2 {{ 
+        }
+        .sidebar h2, .content h2, .right h2 { 
             margin: 0 0 20px 0; 
             color: #2c3e50; 
             font-size: 1.5em; 
             font-weight: 600;
             padding-bottom: 10px;
             border-bottom: 2px solid #e9ecef;
-        }}
-        .page-item {{ 
+        }
+        .page-item { 
             padding: 15px; 
             margin: 8px 0; 
             border: 2px solid #e9ecef; 
@@ -74,45 +150,45 @@ def create_simple_html(entity_name, source_name, pages_data, suggestions_data):
             cursor: pointer; 
             transition: all 0.3s ease;
             background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        }}
-        .page-item:hover {{ 
+        }
+        .page-item:hover { 
             transform: translateY(-2px);
             box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
             border-color: #007bff;
-        }}
-        .page-item.active {{ 
+        }
+        .page-item.active { 
             background: linear-gradient(135deg, #007bff 0%, #0056b3 100%);
             color: white; 
             border-color: #0056b3;
             box-shadow: 0 8px 25px rgba(0, 123, 255, 0.3);
-        }}
-        .field {{ 
+        }
+        .field { 
             margin-bottom: 25px; 
             padding: 20px; 
             border: 2px solid #e9ecef; 
             border-radius: 12px;
             background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
             transition: all 0.3s ease;
-        }}
-        .field:hover {{ 
+        }
+        .field:hover { 
             transform: translateY(-2px);
             box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
-        }}
-        .field h3 {{ 
+        }
+        .field h3 { 
             margin: 0 0 15px 0; 
             color: #2c3e50; 
             font-size: 1.3em;
             font-weight: 600;
-        }}
-        .field-value {{ 
+        }
+        .field-value { 
             background: #e3f2fd; 
             padding: 10px 15px; 
             border-radius: 8px; 
             margin: 10px 0;
             border-left: 4px solid #2196f3;
             font-weight: 500;
-        }}
-        .confidence-badge {{ 
+        }
+        .confidence-badge { 
             background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
             color: white; 
             padding: 5px 12px; 
@@ -121,8 +197,8 @@ def create_simple_html(entity_name, source_name, pages_data, suggestions_data):
             font-weight: 600;
             display: inline-block;
             margin: 5px 0;
-        }}
-        .btn {{ 
+        }
+        .btn { 
             background: linear-gradient(135deg, #007bff 0%, #0056b3 100%);
             color: white; 
             border: none; 
@@ -133,19 +209,19 @@ def create_simple_html(entity_name, source_name, pages_data, suggestions_data):
             font-weight: 500;
             transition: all 0.3s ease;
             box-shadow: 0 4px 15px rgba(0, 123, 255, 0.3);
-        }}
-        .btn:hover {{ 
+        }
+        .btn:hover { 
             transform: translateY(-2px);
             box-shadow: 0 6px 20px rgba(0, 123, 255, 0.4);
-        }}
-        .btn.reject {{ 
+        }
+        .btn.reject { 
             background: linear-gradient(135deg, #dc3545 0%, #c82333 100%);
             box-shadow: 0 4px 15px rgba(220, 53, 69, 0.3);
-        }}
-        .btn.reject:hover {{ 
+        }
+        .btn.reject:hover { 
             box-shadow: 0 6px 20px rgba(220, 53, 69, 0.4);
-        }}
-        .content-text {{ 
+        }
+        .content-text { 
             background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
             padding: 25px; 
             border-radius: 12px; 
@@ -157,101 +233,69 @@ def create_simple_html(entity_name, source_name, pages_data, suggestions_data):
             font-size: 14px; 
             line-height: 1.6;
             color: #2c3e50;
-        }}
-        .content-text::-webkit-scrollbar {{ width: 8px; }}
-        .content-text::-webkit-scrollbar-track {{ background: #f1f1f1; border-radius: 4px; }}
-        .content-text::-webkit-scrollbar-thumb {{ background: #c1c1c1; border-radius: 4px; }}
-        .content-text::-webkit-scrollbar-thumb:hover {{ background: #a8a8a8; }}
-        .url-display {{ 
+        }
+        .content-text::-webkit-scrollbar { width: 8px; }
+        .content-text::-webkit-scrollbar-track { background: #f1f1f1; border-radius: 4px; }
+        .content-text::-webkit-scrollbar-thumb { background: #c1c1c1; border-radius: 4px; }
+        .content-text::-webkit-scrollbar-thumb:hover { background: #a8a8a8; }
+        .url-display { 
             background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
             padding: 15px 20px; 
             border-radius: 10px; 
             margin: 20px 0;
             border-left: 4px solid #2196f3;
-        }}
-        .url-display a {{ 
+        }
+        .url-display a { 
             color: #1976d2; 
             text-decoration: none; 
             font-weight: 500;
             word-break: break-all;
-        }}
-        .url-display a:hover {{ 
+        }
+        .url-display a:hover { 
             text-decoration: underline; 
             color: #1565c0;
-        }}
-        .stats {{ 
+        }
+        .stats { 
             display: flex; 
             gap: 20px; 
             margin: 20px 0;
             flex-wrap: wrap;
-        }}
-        .stat-item {{ 
+        }
+        .stat-item { 
             background: rgba(255, 255, 255, 0.8);
             padding: 15px 20px;
             border-radius: 10px;
             text-align: center;
             flex: 1;
             min-width: 120px;
-        }}
-        .stat-number {{ 
+        }
+        .stat-number { 
             font-size: 2em; 
             font-weight: 700; 
             color: #007bff; 
             margin-bottom: 5px;
-        }}
-        .stat-label {{ 
+        }
+        .stat-label { 
             color: #7f8c8d; 
             font-size: 0.9em;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
     </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Curation Preview: {entity_name}</h1>
-        <p>Source: {source_name}</p>
-    </div>
-    
-    <div class="container">
-        <div class="sidebar">
-            <h2>📄 Pages ({len(pages_data)})</h2>
-            <div id="pagesList">
-                {''.join([f'<div class="page-item" onclick="showPage({i})" id="page-{i}"><strong>{i+1}.</strong> {page.get("title", "Untitled")[:60]}{"..." if len(page.get("title", "")) > 60 else ""}</div>' for i, page in enumerate(pages_data)])}
-            </div>
-        </div>
-        
-        <div class="content">
-            <h2>📖 Page Content</h2>
-            <div id="contentDisplay">
-                <div style="text-align: center; padding: 50px; color: #7f8c8d;">
-                    <h3>Select a page to view content</h3>
-                    <p>Click on any page in the left panel to see its content here</p>
-                </div>
-            </div>
-        </div>
-        
-        <div class="right">
-            <h2>🏷️ Metadata Fields</h2>
-            <div id="fields">
-                {''.join([f'''
-                <div class="field">
-                    <h3>{suggestion["field"]}</h3>
-                    <div class="field-value">{suggestion.get("value", "N/A")}</div>
-                    <div class="confidence-badge">{int(suggestion.get("confidence", 0) * 100)}% Confidence</div>
-                    <button class="btn" onclick="acceptField(\'{suggestion["field"]}\', \'{suggestion.get("value", "")}\')">✅ Accept</button>
-                    <button class="btn reject" onclick="rejectField(\'{suggestion["field"]}\', \'{suggestion.get("value", "")}\')">❌ Reject</button>
-                </div>
-                ''' for suggestion in suggestions_data])}
-        </div>
-    </div>
+"""
 
-    <script>
-        const pagesData = {json.dumps(pages_data, ensure_ascii=False)};
+_PREVIEW_SCRIPT = """    <script>
+        const pagesData = JSON.parse(document.getElementById('pages-data').textContent);
         
-        function showPage(pageIndex) {{
+        function escapeHtml(text) {
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML.replace(/"/g, '&quot;');
+        }
+        
+        function showPage(pageIndex) {
             document.querySelectorAll('.page-item').forEach(item => item.classList.remove('active'));
-            document.getElementById(`page-${{pageIndex}}`).classList.add('active');
+            document.getElementById(`page-${pageIndex}`).classList.add('active');
             
             const page = pagesData[pageIndex];
             const contentDisplay = document.getElementById('contentDisplay');
@@ -260,46 +304,132 @@ def create_simple_html(entity_name, source_name, pages_data, suggestions_data):
             const stats = `
                 <div class="stats">
                     <div class="stat-item">
-                        <div class="stat-number">{len(pages_data)}</div>
+                        <div class="stat-number">${pagesData.length}</div>
                         <div class="stat-label">Total Pages</div>
                     </div>
                     <div class="stat-item">
-                        <div class="stat-number">${{page.text_content ? page.text_content.length : 0}}</div>
+                        <div class="stat-number">${page.text_content ? page.text_content.length : 0}</div>
                         <div class="stat-label">Characters</div>
                     </div>
                     <div class="stat-item">
-                        <div class="stat-number">${{page.text_content ? page.text_content.split(' ').length : 0}}</div>
+                        <div class="stat-number">${page.text_content ? page.text_content.split(' ').length : 0}</div>
                         <div class="stat-label">Words</div>
                     </div>
                 </div>
             `;
             
             contentDisplay.innerHTML = `
-                <h3 style="color: #2c3e50; margin-bottom: 20px;">${{page.title || 'Untitled'}}</h3>
+                <h3 style="color: #2c3e50; margin-bottom: 20px;">${escapeHtml(page.title || 'Untitled')}</h3>
                 <div class="url-display">
-                    <strong>🔗 URL:</strong> <a href="${{page.url}}" target="_blank">${{page.url}}</a>
+                    <strong>🔗 URL:</strong> <a href="${escapeHtml(page.url)}" target="_blank">${escapeHtml(page.url)}</a>
                 </div>
-                ${{stats}}
-                <div class="content-text">${{page.text_content || 'No content available'}}</div>
+                ${stats}
+                <div class="content-text">${escapeHtml(page.text_content || 'No content available')}</div>
             `;
-        }}
+        }
+        
+        function acceptField(field, value) {
+            alert(`Accepted: ${field} = ${value}`);
+        }
         
-        function acceptField(field, value) {{
-            alert(`Accepted: ${{field}} = ${{value}}`);
-        }}
+        function rejectField(field, value) {
+            alert(`Rejected: ${field} = ${value}`);
+        }
         
-        function rejectField(field, value) {{
-            alert(`Rejected: ${{field}} = ${{value}}`);
-        }}
+        // One delegated listener per list instead of inline handlers on every item
+        document.getElementById('pagesList').addEventListener('click', event => {
+            const item = event.target.closest('.page-item');
+            if (item) showPage(Number(item.dataset.page));
+        });
+        
+        document.getElementById('fields').addEventListener('click', event => {
+            const button = event.target.closest('button[data-action]');
+            if (!button) return;
+            const field = button.closest('.field');
+            const handler = button.dataset.action === 'accept' ? acceptField : rejectField;
+            handler(field.dataset.field, field.dataset.value);
+        });
         
         // Show first page automatically
-        if (pagesData.length > 0) {{
+        if (pagesData.length > 0) {
             showPage(0);
-        }}
+        }
     </script>
 </body>
 </html>"""
-    return html
+
+def write_simple_html(out, entity_name, source_name, pages_data, suggestions_data):
+    # Written section by section, so the page list, field list and page data are
+    # never assembled into one big string. Text is HTML-escaped once here; the
+    # client reads page data from an inert JSON block.
+    entity_name = escape(entity_name)
+    source_name = escape(source_name)
+    out.write(f"""<!DOCTYPE html>
+<html>
+<head>
+    <title>Curation Preview - {entity_name}</title>
+""")
+    out.write(_PREVIEW_STYLE)
+    out.write(f"""</head>
+<body>
+    <div class="header">
+        <h1>Curation Preview: {entity_name}</h1>
+        <p>Source: {source_name}</p>
+    </div>
+    
+    <div class="container">
+        <div class="sidebar">
+            <h2>📄 Pages ({len(pages_data)})</h2>
+            <div id="pagesList">
+                """)
+    for i, page in enumerate(pages_data):
+        out.write(f'<div class="page-item" data-page="{i}" id="page-{i}"><strong>{i+1}.</strong> {escape(page.get("title", "Untitled")[:60])}{"..." if len(page.get("title", "")) > 60 else ""}</div>')
+    out.write("""
+            </div>
+        </div>
+        
+        <div class="content">
+            <h2>📖 Page Content</h2>
+            <div id="contentDisplay">
+                <div style="text-align: center; padding: 50px; color: #7f8c8d;">
+                    <h3>Select a page to view content</h3>
+                    <p>Click on any page in the left panel to see its content here</p>
+                </div>
+            </div>
+        </div>
+        
+        <div class="right">
+            <h2>🏷️ Metadata Fields</h2>
+            <div id="fields">
+                """)
+    for suggestion in suggestions_data:
+        field_name = escape(str(suggestion["field"]))
+        value = escape(str(suggestion.get("value", "")))
+        shown_value = escape(str(suggestion.get("value", "N/A")))
+        out.write(f'''
+                <div class="field" data-field="{field_name}" data-value="{value}">
+                    <h3>{field_name}</h3>
+                    <div class="field-value">{shown_value}</div>
+                    <div class="confidence-badge">{int(suggestion.get("confidence", 0) * 100)}% Confidence</div>
+                    <button class="btn" data-action="accept">✅ Accept</button>
+                    <button class="btn reject" data-action="reject">❌ Reject</button>
+                </div>
+                ''')
+    out.write("""
+        </div>
+    </div>
+
+    <script id="pages-data" type="application/json">""")
+    # "<" is written as \u003c so page text can never close the script element
+    for chunk in json.JSONEncoder(ensure_ascii=False).iterencode(pages_data):
+        out.write(chunk.replace("<", "\\u003c"))
+    out.write("</script>\n")
+    out.write(_PREVIEW_SCRIPT)
+
+def create_simple_html(entity_name, source_name, pages_data, suggestions_data):
+    buffer = io.StringIO()
+    write_simple_html(buffer, entity_name, source_name, pages_data, suggestions_data)
+    return buffer.getvalue()
 
 def main():
     parser = argparse.ArgumentParser(description="Build a simple curation preview HTML")
@@ -308,6 +438,9 @@ def main():
     parser.add_argument("--pages", required=True, help="Text file with URLs")
     parser.add_argument("--suggestions", required=True, help="JSON file of suggestions")
     parser.add_argument("--out", default="curation_preview.html", help="Output HTML path")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="HTTP cache file (revalidated via ETag/Last-Modified)")
+    parser.add_argument("--no-cache", action="store_true", help="Always download pages")
+    parser.add_argument("--workers", type=int, default=16, help="Pages fetched concurrently")
     
     args = parser.parse_args()
     
@@ -322,40 +455,19 @@ def main():
     print(f"Processing {len(page_urls)} pages...")
     
     # Fetch pages
-    pages_data = []
-    for url in page_urls:
-        try:
-            print(f"Fetching: {url}")
-            html = fetch_html(url)
-            soup = BeautifulSoup(html, "html.parser")
-            title = soup.title.string if soup.title else url
-            # Get more content and clean it up
-            text_content = soup.get_text()
-            # Remove excessive whitespace and clean up
-            text_content = ' '.join(text_content.split())
-            # Show more content (first 5000 characters)
-            if len(text_content) > 5000:
-                text_content = text_content[:5000] + "...\\n\\n[Content truncated - showing first 5000 characters]"
-            
-            pages_data.append({
-                "url": url,
-                "title": title,
-                "text_content": text_content
-            })
-        except Exception as e:
-            print(f"Error fetching {url}: {e}")
-            pages_data.append({
-                "url": url,
-                "title": f"Error: {str(e)}",
-                "text_content": f"Failed to fetch: {str(e)}"
-            })
-    
-    # Generate HTML
-    html = create_simple_html(args.entity, args.source, pages_data, suggestions_data)
+    cache = None
+    if not args.no_cache:
+        os.makedirs(os.path.dirname(os.path.abspath(args.cache)), exist_ok=True)
+        cache = shelve.open(args.cache)
+    # Network-bound, so pages are fetched concurrently; map keeps them in input order
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        pages_data = list(executor.map(lambda url: _fetch_page(url, cache), page_urls))
+    if cache is not None:
+        cache.close()
     
-    # Write output
+    # Generate HTML straight into the output file
     with open(args.out, "w", encoding="utf-8") as f:
-        f.write(html)
+        write_simple_html(f, args.entity, args.source, pages_data, suggestions_data)
     
     print(f"✅ Generated: {args.out}")
 
@@ -4,8 +4,10 @@ Dummy data module for the Metadata Curation System.
 Contains test data that simulates real-world scenarios.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping, NamedTuple, Sequence
 from enum import Enum
+from functools import cache
+from types import MappingProxyType
 
 class PropertyType(str, Enum):
     """Enumeration that mirrors the public client SDK."""
@@ -15,9 +17,35 @@ class PropertyType(str, Enum):
     NUMERICAL = "NUMERICAL"
     FREE_TEXT = "FREE_TEXT"
 
-def get_dummy_sources() -> List[Dict[str, Any]]:
+# Plain-string type keys for the suggestion builder tables
+_MC = PropertyType.MULTIPLE_CHOICE.value
+_SC = PropertyType.SINGLE_CHOICE.value
+_BIN = PropertyType.BINARY.value
+_NUM = PropertyType.NUMERICAL.value
+_FT = PropertyType.FREE_TEXT.value
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of literal data: dicts become mappingproxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """Plain dict/list deep copy of frozen dummy data, safe to store and mutate."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+# The getters below build their data once; the results are shared and read-only
+
+@cache
+def get_dummy_sources() -> Sequence[Mapping[str, Any]]:
     """Get dummy sources with clear distinction from API data."""
-    return [
+    return _freeze([
         {
             "id": 1,
             "name": "Digital Edition Catalogue",
@@ -25,11 +53,12 @@ def get_dummy_sources() -> List[Dict[str, Any]]:
             "is_dummy": True,
             "source_type": "academic_digital_library"
         }
-    ]
+    ])
 
-def get_dummy_properties() -> List[Dict[str, Any]]:
+@cache
+def get_dummy_properties() -> Sequence[Mapping[str, Any]]:
     """Get dummy metadata properties."""
-    return [
+    return _freeze([
         {
             "id": 1,
             "technical_name": "genre",
@@ -123,11 +152,12 @@ def get_dummy_properties() -> List[Dict[str, Any]]:
                 {"id": 4, "name": "Not Digitized"}
             ]
         }
-    ]
+    ])
 
-def get_dummy_editions() -> List[Dict[str, Any]]:
+@cache
+def get_dummy_editions() -> Sequence[Mapping[str, Any]]:
     """Get dummy editions with multiple entities per source."""
-    return [
+    return _freeze([
         # Source 1: Digital Edition Catalogue
         {
             "id": 1,
@@ -145,7 +175,7 @@ def get_dummy_editions() -> List[Dict[str, Any]]:
             "entity_description": "Digital edition of Martha Ballard's diary (1785-1812) from Maine State Library",
             "is_dummy": True
         }
-    ]
+    ])
 
 def get_dummy_suggestions() -> List[Dict[str, Any]]:
     """Get dummy suggestions with realistic data for each edition."""
@@ -156,76 +186,83 @@ def get_dummy_suggestions() -> List[Dict[str, Any]]:
     
     return suggestions
 
+class _EditionContext(NamedTuple):
+    """What the suggestion builders need to know about the edition."""
+    is_veda: bool
+    is_manuscript: bool
+    is_european: bool
+    entity_name: str
+
+def _first_option(ctx: _EditionContext, prop: Mapping[str, Any]) -> tuple:
+    return (prop["property_options"][0]["id"] if prop["property_options"] else None), None
+
+# (type, technical_name) -> builder(ctx, prop) returning (property_option_id, custom_value)
+_SUGGESTION_BUILDERS = {
+    # Realistic genre for different types of texts: Religious Text / Poetry / Prose
+    (_MC, "genre"):
+        lambda ctx, prop: (5 if ctx.is_veda else 1 if ctx.is_manuscript else 2, None),
+    (_MC, "preservation_status"): lambda ctx, prop: (2, None),  # Good
+    (_MC, "digitization_quality"): lambda ctx, prop: (1, None),  # High Resolution
+    # Sanskrit / English / default
+    (_SC, "language"):
+        lambda ctx, prop: (1 if ctx.is_veda else 2 if ctx.is_european else 1, None),
+    (_NUM, "publication_year"): lambda ctx, prop: (None, "2023"),
+    (_NUM, "manuscript_age"): lambda ctx, prop: (None, "1500"),
+    (_FT, "description"):
+        lambda ctx, prop: (None, f"Digital edition of {ctx.entity_name}"),
+}
+
+# Fallback per property type when no (type, technical_name) builder exists
+_DEFAULT_BUILDERS = {
+    _MC: _first_option,
+    _SC: _first_option,
+    _BIN: lambda ctx, prop: (2, None),  # 1 (true) for most cases
+    _NUM: lambda ctx, prop: (None, "2023"),
+    _FT: lambda ctx, prop: (None, "Sample description"),
+}
+
+def _make_suggestion(base: Dict[str, Any], prop: Mapping[str, Any], ctx: _EditionContext) -> Dict[str, Any]:
+    """One dummy suggestion for ``prop``: a copy of ``base`` plus the builder's values."""
+    suggestion = base.copy()
+    suggestion["property_id"] = prop["id"]
+    # Generate realistic dummy values based on property type
+    builder = (_SUGGESTION_BUILDERS.get((prop["type"], prop.get("technical_name")))
+               or _DEFAULT_BUILDERS.get(prop["type"]))
+    if builder is not None:
+        suggestion["property_option_id"], suggestion["custom_value"] = builder(ctx, prop)
+    return suggestion
+
 def create_dummy_suggestions_for_edition(edition_id: int, source_id: int, properties: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Create realistic dummy suggestions for a specific edition."""
-    suggestions = []
+    # Everything the builders need from the edition, looked up once
+    edition = get_edition_by_id(edition_id)
+    internal_id = edition.get("source_internal_id", "")
+    ctx = _EditionContext(
+        is_veda="veda" in internal_id,
+        is_manuscript="manuscript" in internal_id,
+        is_european="european" in internal_id,
+        entity_name=edition.get("entity_name", "Unknown"),
+    )
     
-    for prop in properties:
-        suggestion = {
-            "edition_id": edition_id,
-            "source_id": source_id,
-            "property_id": prop["id"],
-            "status": "pending",
-            "ai_generated": False,
-            "is_dummy": True
-        }
-        
-        # Generate realistic dummy values based on property type
-        if prop["type"] == PropertyType.MULTIPLE_CHOICE.value:
-            if prop["technical_name"] == "genre":
-                # Realistic genre for different types of texts
-                if "veda" in get_edition_by_id(edition_id).get("source_internal_id", ""):
-                    suggestion["property_option_id"] = 5  # Religious Text
-                elif "manuscript" in get_edition_by_id(edition_id).get("source_internal_id", ""):
-                    suggestion["property_option_id"] = 1  # Poetry
-                else:
-                    suggestion["property_option_id"] = 2  # Prose
-            elif prop["technical_name"] == "preservation_status":
-                suggestion["property_option_id"] = 2  # Good
-            elif prop["technical_name"] == "digitization_quality":
-                suggestion["property_option_id"] = 1  # High Resolution
-            else:
-                suggestion["property_option_id"] = prop["property_options"][0]["id"] if prop["property_options"] else None
-            suggestion["custom_value"] = None
-            
-        elif prop["type"] == PropertyType.SINGLE_CHOICE.value:
-            if prop["technical_name"] == "language":
-                if "veda" in get_edition_by_id(edition_id).get("source_internal_id", ""):
-                    suggestion["property_option_id"] = 1  # Sanskrit
-                elif "european" in get_edition_by_id(edition_id).get("source_internal_id", ""):
-                    suggestion["property_option_id"] = 2  # English
-                else:
-                    suggestion["property_option_id"] = 1  # Default
-            else:
-                suggestion["property_option_id"] = prop["property_options"][0]["id"] if prop["property_options"] else None
-            suggestion["custom_value"] = None
-            
-        elif prop["type"] == PropertyType.BINARY.value:
-            suggestion["property_option_id"] = 2  # 1 (true) for most cases
-            suggestion["custom_value"] = None
-            
-        elif prop["type"] == PropertyType.NUMERICAL.value:
-            suggestion["property_option_id"] = None
-            if prop["technical_name"] == "publication_year":
-                suggestion["custom_value"] = "2023"
-            elif prop["technical_name"] == "manuscript_age":
-                suggestion["custom_value"] = "1500"
-            else:
-                suggestion["custom_value"] = "2023"
-                
-        elif prop["type"] == PropertyType.FREE_TEXT.value:
-            suggestion["property_option_id"] = None
-            if prop["technical_name"] == "description":
-                edition = get_edition_by_id(edition_id)
-                suggestion["custom_value"] = f"Digital edition of {edition.get('entity_name', 'Unknown')}"
-            else:
-                suggestion["custom_value"] = "Sample description"
-        
-        suggestions.append(suggestion)
+    # Fields shared by every suggestion; property_id is filled per copy (kept here for key order)
+    base = {
+        "edition_id": edition_id,
+        "source_id": source_id,
+        "property_id": None,
+        "status": "pending",
+        "ai_generated": False,
+        "is_dummy": True
+    }
     
-    return suggestions
+    return [_make_suggestion(base, prop, ctx) for prop in properties]
+
+@cache
+def _dummy_editions_by_id() -> Mapping[int, Mapping[str, Any]]:
+    return MappingProxyType({e["id"]: e for e in get_dummy_editions()})
+
+# Returned for unknown ids; read-only so the shared instance can't be filled in
+_NO_EDITION: Mapping[str, Any] = MappingProxyType({})
 
-def get_edition_by_id(edition_id: int) -> Dict[str, Any]:
+def get_edition_by_id(edition_id: int) -> Mapping[str, Any]:
     """Helper function to get edition by ID."""
-    editions = get_dummy_editions()
-    return next((e for e in editions if e["id"] == edition_id), {})
+    return _dummy_editions_by_id().get(edition_id, _NO_EDITION)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Client-side rate limiting for OpenAI requests.
+Token buckets for requests-per-minute and tokens-per-minute, per model.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``per_minute / 60`` tokens per second.
+
+    State is guarded by a threading lock (not an asyncio one) so a single bucket
+    can be shared by Flask worker threads and by any event loop.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, n_tokens: float) -> float:
+        """Take ``n_tokens`` if available; otherwise return the seconds to wait."""
+        # A request larger than the whole bucket would otherwise wait forever
+        n_tokens = min(n_tokens, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens >= n_tokens:
+                self.tokens -= n_tokens
+                return 0.0
+            return (n_tokens - self.tokens) / self.rate
+
+    async def acquire(self, n_tokens: float = 1) -> None:
+        """Wait (without blocking the event loop) until ``n_tokens`` are available."""
+        while True:
+            wait = self._take(n_tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, n_tokens: float = 1) -> None:
+        """Blocking variant of acquire for synchronous callers."""
+        while True:
+            wait = self._take(n_tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+_BUCKETS: Dict[str, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def get_buckets(model: str) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+    """
+    Return the (rpm, tpm) buckets for ``model``.
+
+    Limits come from AI_RPM_LIMIT / AI_TPM_LIMIT; an unset or zero limit
+    yields None for that bucket (no limiting).
+    """
+    with _BUCKETS_LOCK:
+        if model not in _BUCKETS:
+            rpm = float(os.getenv('AI_RPM_LIMIT', '0'))
+            tpm = float(os.getenv('AI_TPM_LIMIT', '0'))
+            _BUCKETS[model] = (
+                TokenBucket(rpm) if rpm > 0 else None,
+                TokenBucket(tpm) if tpm > 0 else None
+            )
+            if rpm > 0 or tpm > 0:
+                logger.info(f"Rate limiting {model}: rpm={rpm or 'unlimited'}, tpm={tpm or 'unlimited'}")
+        return _BUCKETS[model]
+
+
+async def acquire(model: str, n_tokens: int) -> None:
+    """Reserve one request and ``n_tokens`` tokens of budget for ``model``."""
+    rpm, tpm = get_buckets(model)
+    if tpm is not None:
+        await tpm.acquire(n_tokens)
+    if rpm is not None:
+        await rpm.acquire(1)
+
+
+def acquire_sync(model: str, n_tokens: int) -> None:
+    """Blocking variant of acquire."""
+    rpm, tpm = get_buckets(model)
+    if tpm is not None:
+        tpm.acquire_sync(n_tokens)
+    if rpm is not None:
+        rpm.acquire_sync(1)
@@ -4,8 +4,11 @@ Services package for data curation interface backend.
 This package contains service modules for:
 - Web scraping and content extraction
 - AI-powered metadata curation
-- External API integration
+- External API integration (with a persistent response cache)
+- A shared pooled HTTP session for outbound requests
+- Background writing of user-study timing logs
+- An optional SQLite-backed audit log
 """
 
-__all__ = ['scraper']
+__all__ = ['scraper', 'api_cache', 'http', 'study_log', 'audit_store']
 
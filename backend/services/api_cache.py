@@ -0,0 +1,142 @@
+"""
+Persistent cache for Metadata Curation API reads.
+
+Payloads of ``curation_client.get_*`` calls are stored in SQLite so that:
+- cold starts skip the upstream API while the stored payload is fresh
+- an unreachable API falls back to the last known good payload
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+try:
+    from importlib.metadata import version as _package_version
+    CLIENT_VERSION = _package_version('metadata-curation-client')
+except Exception:
+    CLIENT_VERSION = 'unknown'
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'data_curation' / 'api.sqlite'
+
+
+class APICache:
+    """SQLite-backed store of ``key -> (ts, stale_after, payload)``."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or os.getenv('CURATION_API_CACHE_PATH') or DEFAULT_CACHE_PATH).expanduser()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        if not self._initialized:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_cache ("
+                "key TEXT PRIMARY KEY, ts REAL NOT NULL, stale_after REAL NOT NULL, payload BLOB NOT NULL)"
+            )
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[Tuple[float, float, Any]]:
+        """Return ``(ts, stale_after, payload)`` for ``key``, or None if never stored."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    row = conn.execute(
+                        "SELECT ts, stale_after, payload FROM api_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"API cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        ts, stale_after, payload = row
+        return ts, stale_after, orjson.loads(payload)
+
+    def set(self, key: str, payload: Any, ttl_seconds: float) -> None:
+        """Store ``payload`` under ``key``; it counts as fresh for ``ttl_seconds``."""
+        try:
+            body = orjson.dumps(payload)
+        except TypeError as e:
+            logger.warning(f"API cache skipped non-JSON payload for {key}: {e}")
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = self._connect()
+                try:
+                    with conn:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO api_cache (key, ts, stale_after, payload) VALUES (?, ?, ?, ?)",
+                            (key, now, now + ttl_seconds, body)
+                        )
+                finally:
+                    conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"API cache write failed: {e}")
+
+
+_CACHE: Optional[APICache] = None
+
+
+def get_cache() -> APICache:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = APICache()
+    return _CACHE
+
+
+def _cache_key(client: Any, method_name: str, args: tuple, kwargs: dict) -> str:
+    params = orjson.dumps([args, kwargs], option=orjson.OPT_SORT_KEYS, default=str).decode()
+    return f"{getattr(client, 'base_url', '')}|{method_name}|{params}|{CLIENT_VERSION}"
+
+
+def cached_call(client: Any, method_name: str, ttl_seconds: Optional[float] = None, *args, **kwargs) -> Any:
+    """
+    Call ``client.<method_name>(*args, **kwargs)`` through the persistent cache.
+
+    Args:
+        client: API client instance (e.g. CurationAPIClient)
+        method_name: Name of the read method to call
+        ttl_seconds: Freshness window; defaults to CURATION_API_CACHE_TTL (0 = always refetch)
+
+    Returns:
+        The fresh cached payload, the upstream payload, or - if the upstream call
+        fails - the last stored payload regardless of age.
+
+    Raises:
+        Whatever the upstream call raised when nothing has been stored yet.
+    """
+    if ttl_seconds is None:
+        ttl_seconds = float(os.getenv('CURATION_API_CACHE_TTL', '3600'))
+
+    cache = get_cache()
+    key = _cache_key(client, method_name, args, kwargs)
+    entry = cache.get(key)
+    if entry is not None and time.time() < entry[1]:
+        logger.info(f"API cache hit for {method_name}")
+        return entry[2]
+
+    try:
+        payload = getattr(client, method_name)(*args, **kwargs)
+    except Exception as e:
+        if entry is None:
+            raise
+        age = time.time() - entry[0]
+        logger.warning(f"{method_name} failed ({e}); serving cached payload from {age:.0f}s ago")
+        return entry[2]
+
+    cache.set(key, payload, ttl_seconds)
+    return payload
@@ -0,0 +1,101 @@
+"""
+Optional SQLite copy of the audit log.
+
+When ``AUDIT_DB_PATH`` is set, every curation and publishing audit entry is
+also written here, indexed on timestamp, edition, user and action, so
+``GET /api/audit-log`` can filter and page in SQL. The database outlives the
+in-memory DATA tables, so the trail survives restarts.
+"""
+
+import os
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS audit_log ("
+    "seq INTEGER PRIMARY KEY AUTOINCREMENT, entry_id INTEGER, entry_type TEXT NOT NULL, "
+    "timestamp TEXT NOT NULL, user_id TEXT, action TEXT, edition_id INTEGER, payload BLOB NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS audit_log_ts ON audit_log (timestamp)",
+    "CREATE INDEX IF NOT EXISTS audit_log_edition_ts ON audit_log (edition_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS audit_log_user_ts ON audit_log (user_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS audit_log_action_ts ON audit_log (action, timestamp)",
+)
+
+
+class AuditStore:
+    """SQLite-backed append-only store of audit-log entries (the dicts the endpoint returns)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def record(self, entry: dict) -> None:
+        """Append one audit entry; failures are logged, never raised into the request."""
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT INTO audit_log (entry_id, entry_type, timestamp, user_id, action, edition_id, payload) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (entry.get("id"), entry["entry_type"], entry["timestamp"], entry.get("user_id"),
+                         entry.get("action"), entry.get("edition_id"),
+                         orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS))
+                    )
+        except (sqlite3.Error, OSError, TypeError) as e:
+            logger.warning(f"Audit store write failed: {e}")
+
+    def query(self, start: Optional[str] = None, end: Optional[str] = None,
+              before: Optional[Tuple[str, str, int]] = None,
+              user_id: Optional[str] = None, action: Optional[str] = None, edition_id: Optional[int] = None,
+              limit: int = 500) -> List[dict]:
+        """
+        Entries matching every given filter, newest first, at most ``limit`` of them.
+
+        ``before`` is a (timestamp, entry_type, entry_id) cursor; only entries ordered
+        strictly below it are returned, so ties on the timestamp are never skipped.
+        """
+        clauses, params = [], []
+        for column, op, value in (
+            ("timestamp", ">=", start), ("timestamp", "<=", end),
+            ("user_id", "=", user_id), ("action", "=", action), ("edition_id", "=", edition_id),
+        ):
+            if value:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        if before:
+            clauses.append("(timestamp, entry_type, entry_id) < (?, ?, ?)")
+            params.extend(before)
+        sql = "SELECT payload FROM audit_log"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp DESC, entry_type DESC, entry_id DESC, seq DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [orjson.loads(payload) for (payload,) in rows]
+
+
+def store_from_env() -> Optional[AuditStore]:
+    """The store configured by ``AUDIT_DB_PATH``, or None when the audit log is memory-only."""
+    path = os.getenv('AUDIT_DB_PATH')
+    return AuditStore(Path(path)) if path else None
@@ -0,0 +1,38 @@
+"""
+Shared HTTP session for outbound requests.
+
+Reusing one pooled ``requests.Session`` keeps connections alive between
+calls, so repeated requests to the same host skip the TCP/TLS handshake.
+"""
+
+import functools
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # Only idempotent GETs are retried; transient connect/read errors get two more tries
+    retry = Retry(total=2, backoff_factor=0.2, allowed_methods=frozenset({'GET', 'HEAD'}))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+session = _build_session()
+
+
+def apply_default_timeout(session: requests.Session, timeout: float) -> requests.Session:
+    """Give every request made through ``session`` a timeout unless the caller passes one."""
+    request = session.request
+
+    @functools.wraps(request)
+    def request_with_timeout(method, url, **kwargs):
+        kwargs.setdefault('timeout', timeout)
+        return request(method, url, **kwargs)
+
+    session.request = request_with_timeout
+    return session
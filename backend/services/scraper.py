@@ -13,9 +13,11 @@ This module provides a clean, well-tested scraping service with:
 import re
 import logging
 from typing import Optional, List, Dict, Any, Tuple
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import requests
 
+from services.http import session as http_session
+
 from services.content_extractors import (
     ParagraphExtractor, 
     ListExtractor, 
@@ -26,6 +28,9 @@ from services.content_types import get_config
 
 logger = logging.getLogger(__name__)
 
+_TITLE_ONLY = SoupStrainer("title")
+_WORD_RE = re.compile(r"\S+")
+
 
 class ScraperError(Exception):
     """Base exception for scraper errors."""
@@ -250,7 +255,7 @@ class ContentExtractor:
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) CurationPreview/1.0"
             }
             
-            response = requests.get(url, timeout=timeout, headers=headers)
+            response = http_session.get(url, timeout=timeout, headers=headers)
             response.raise_for_status()
             
             content_type = response.headers.get('Content-Type', '')
@@ -788,9 +793,10 @@ class EntityScraper:
         # Fetch HTML
         html = self.content_extractor.fetch_html(url)
         
-        # Parse with BeautifulSoup for title
-        soup = BeautifulSoup(html, "html.parser")
+        # Parse only the <title> element; the full tree is built once, by the extractor
+        soup = BeautifulSoup(html, "html.parser", parse_only=_TITLE_ONLY)
         title = soup.title.string if soup.title else url
+        del soup
         
         # Extract structured content
         structured_content = self.content_extractor.extract_structured_content(html, url)
@@ -804,7 +810,8 @@ class EntityScraper:
             "text_content": text_content,
             "structured_content": structured_content,
             "char_count": len(text_content),
-            "word_count": len(text_content.split())
+            # Count words without materializing the split list
+            "word_count": sum(1 for _ in _WORD_RE.finditer(text_content))
         }
         
         logger.info(f"Successfully scraped {url}: {page_data['char_count']} chars, "
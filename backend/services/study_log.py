@@ -0,0 +1,96 @@
+"""
+Background writer for user-study curation-time logs.
+
+Request threads only enqueue records; a single daemon thread appends them as
+JSON lines to one file per day (``YYYYMMDD.jsonl``), so logging never blocks a
+request on disk I/O.
+"""
+
+import atexit
+import datetime as dt
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class StudyLogWriter:
+    """Queue-backed JSONL appender, flushed every ``flush_every`` records or ``flush_interval`` seconds."""
+
+    def __init__(self, directory: Path, flush_every: int = 20, flush_interval: float = 2.0):
+        self.directory = Path(directory)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def filename_for(day: dt.date) -> str:
+        return f"{day:%Y%m%d}.jsonl"
+
+    def write(self, record: dict, filename: Optional[str] = None) -> None:
+        """Queue ``record`` for appending to ``filename`` (today's file by default); returns immediately."""
+        if filename is None:
+            # Resolved here, not in the writer thread, so a record queued just before
+            # midnight still lands in the file the caller was told about
+            filename = self.filename_for(dt.date.today())
+        self._ensure_started()
+        self._queue.put((filename, record))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out everything queued so far and stop the worker."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        # Started lazily so forked server workers each get their own thread
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='study-log-writer', daemon=True)
+                    self._thread.start()
+                    atexit.register(self.close)
+
+    def _run(self) -> None:
+        handle = None
+        current = None
+        pending = 0
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            try:
+                if item is not None:
+                    filename, record = item
+                    if filename != current:
+                        if handle is not None:
+                            handle.close()
+                        self.directory.mkdir(parents=True, exist_ok=True)
+                        handle = open(self.directory / filename, 'ab')
+                        current = filename
+                    handle.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b'\n')
+                    pending += 1
+                if pending and (pending >= self.flush_every or time.monotonic() - last_flush >= self.flush_interval):
+                    handle.flush()
+                    pending = 0
+                    last_flush = time.monotonic()
+            except Exception as e:
+                logger.error(f"Study log write failed: {e}")
+        if handle is not None:
+            handle.close()